@@ -55,6 +55,7 @@ decorator) can be undone and redone. If using :mod:`aeidon` in a context where
 reverting actions is never needed, greater flexibility can be achieved by
 accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 
+:var CACHE_HOME_DIR: Path to the user's local cache directory
 :var CONFIG_HOME_DIR: Path to the user's local configuration directory
 :var DATA_DIR: Path to the global data directory
 :var DATA_HOME_DIR: Path to the user's local data directory
@@ -94,27 +95,72 @@ from aeidon.observable import *
 from aeidon.errors import *
 from aeidon.enum import *
 from aeidon.enums import *
-from aeidon import encodings
-from aeidon import languages
-from aeidon import countries
-from aeidon import locales
-from aeidon import scripts
-from aeidon.metadata import *
-from aeidon.calculator import *
-from aeidon.finder import *
-from aeidon.parser import *
-from aeidon.liner import *
-from aeidon import containers
-from aeidon.subtitle import *
-from aeidon.file import *
-from aeidon import files
-from aeidon.markup import *
-from aeidon import markups
-from aeidon.markupconv import *
-from aeidon.pattern import *
-from aeidon.patternman import *
-from aeidon.clipboard import *
-from aeidon.revertable import *
-from aeidon import agents
-from aeidon.project import *
-from aeidon.unittest import *
+
+# Modules below are imported only when first accessed as attributes of
+# the aeidon namespace, so that e.g. using only aeidon.Calculator does not
+# import the ISO code tables, file formats or the project and its agents.
+_lazy_modules = (
+    "agents",
+    "containers",
+    "countries",
+    "encodings",
+    "files",
+    "languages",
+    "locales",
+    "markups",
+    "scripts",
+)
+
+_lazy_names = {
+    "batch":       ("BatchConverter", "BatchResult"),
+    "calculator":  ("Calculator",),
+    "clipboard":   ("Clipboard",),
+    "file":        ("SubtitleFile",),
+    "finder":      ("Finder",),
+    "journal":     ("JournalEntry", "UndoJournal"),
+    "lazy":        ("LazySubtitleList",),
+    "liner":       ("Liner",),
+    "markup":      ("Markup",),
+    "markupconv":  ("MarkupConverter",),
+    "metadata":    ("MetadataItem",),
+    "parser":      ("Parser",),
+    "pattern":     ("Pattern",),
+    "patternman":  ("PatternManager",),
+    "patternprog": ("PatternProgram",),
+    "project":     ("Project",),
+    "revertable":  ("RevertableAction",
+                    "RevertableActionGroup",
+                    "RevertableStack"),
+    "searchindex": ("SearchIndex",),
+    "signalbatch": ("SignalBatch",),
+    "sniffer":     ("Sniffer",),
+    "store":       ("SubtitleStore", "SubtitleView"),
+    "subtitle":    ("Subtitle",),
+    "unittest":    ("TestCase",),
+}
+
+_lazy_modules_by_name = dict((name, module)
+                             for module, names in _lazy_names.items()
+                             for name in names)
+
+
+def __dir__():
+    """Return names in namespace, including those not yet imported."""
+    return sorted(set(globals()) |
+                  set(_lazy_modules) |
+                  set(_lazy_modules_by_name))
+
+def __getattr__(name):
+    """Import and return lazily imported module or class `name`."""
+    # Use __import__ instead of importlib so that lazy imports
+    # are visible too in the output of python -X importtime.
+    if name in _lazy_modules:
+        __import__("aeidon.{}".format(name))
+        return globals()[name]
+    if name in _lazy_modules_by_name:
+        module = _lazy_modules_by_name[name]
+        module = __import__("aeidon.{}".format(module), fromlist=[name])
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    raise AttributeError("Module {} has no attribute {}"
+                         .format(repr(__name__), repr(name)))
@@ -122,10 +122,20 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.notify_frozen
     def replace_positions(self, indices, subtitles, register=-1):
         """Replace positions at `indices` with those from `subtitles`."""
-        orig_subtitles = [self.subtitles[i].copy() for i in indices]
-        for i, index in enumerate(indices):
-            self.subtitles[index].start = subtitles[i].start
-            self.subtitles[index].end = subtitles[i].end
+        # Keep only original positions, packed in arrays, to revert.
+        if isinstance(self.subtitles, aeidon.SubtitleStore):
+            orig_subtitles = self.subtitles.take_positions(indices)
+            self.subtitles.replace_positions(indices, subtitles)
+        else: # List of subtitles
+            orig_subtitles = aeidon.SubtitleStore(self.get_mode(),
+                                                  self.framerate)
+
+            orig_subtitles.extend_positions(self.subtitles[i]
+                                            for i in indices)
+
+            for i, index in enumerate(indices):
+                self.subtitles[index].start = subtitles[i].start
+                self.subtitles[index].end = subtitles[i].end
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Replacing positions")
@@ -63,6 +63,42 @@ class OpenAgent(aeidon.Delegate):
             subtitles.pop(0)
             i += 1
 
+    def _index_file(self, file):
+        """
+        Index `file` and return a list of subtitles parsed on demand.
+
+        Return ``None`` if `file` cannot be indexed or its subtitles are not
+        in chronological order, in which case they need to be read and sorted.
+        """
+        try:
+            index = file.index()
+        except IOError:
+            raise
+        except Exception:
+            raise aeidon.ParseError("Failed to parse file {}"
+                                    .format(repr(file.path)))
+        if index is None: return None
+        offsets, starts = index
+        if any(starts[i] > starts[i+1] for i in range(len(starts) - 1)):
+            return None
+        return aeidon.LazySubtitleList(file, offsets, self.framerate)
+
+    def _new_file(self, path, encoding):
+        """
+        Return a new subtitle file for `path` after sniffing it.
+
+        The file is sniffed once for BOM and format and if small enough to
+        have been read completely, its contents are passed on to the file.
+        """
+        sniffer = aeidon.Sniffer(path)
+        encoding = sniffer.detect_bom() or encoding
+        format = sniffer.detect_format(encoding)
+        file = aeidon.files.new(format, path, encoding)
+        file.bytes_read = sniffer.bytes_read
+        if sniffer.complete:
+            file.data = sniffer.prefix
+        return file
+
     @aeidon.deco.export
     def open(self, doc, path, encoding=None, align_method=None):
         """
@@ -99,13 +135,16 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
-        self.subtitles, sort_count = self._sort_subtitles(subtitles)
+        self.main_file = self._new_file(path, encoding)
+        subtitles = (self._index_file(self.main_file) if self.lazy else None)
+        sort_count = 0
+        if subtitles is None:
+            subtitles = self._read_file(self.main_file,
+                                        self.columnar,
+                                        self.mapped)
+
+            subtitles, sort_count = self._sort_subtitles(subtitles)
+        self.subtitles = subtitles
         self.set_framerate(self.framerate, register=None)
         self.main_changed = 0
         # Deactivate possible translation file.
@@ -142,12 +181,8 @@ class OpenAgent(aeidon.Delegate):
         """
         encoding = encoding or aeidon.util.get_default_encoding()
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
+        self.tran_file = self._new_file(path, encoding)
+        subtitles = self._read_file(self.tran_file, mapped=self.mapped)
         subtitles, sort_count = self._sort_subtitles(subtitles)
         for subtitle in subtitles:
             subtitle.framerate = self.framerate
@@ -163,9 +198,23 @@ class OpenAgent(aeidon.Delegate):
         self.emit("translation-file-opened", self.tran_file)
         return sort_count
 
-    def _read_file(self, file):
-        """Read `file` and return subtitles."""
+    def _read_file(self, file, columnar=False, mapped=False):
+        """
+        Read `file` and return subtitles.
+
+        If `columnar` is ``True``, return an :class:`aeidon.SubtitleStore`,
+        filled as subtitles are parsed to avoid ever having all of them in
+        memory as separate :class:`aeidon.Subtitle` instances. Otherwise if
+        `mapped` is ``True``, read `file` mapped to memory.
+        """
         try:
+            if columnar:
+                return aeidon.SubtitleStore(file.mode,
+                                            self.framerate,
+                                            file.iter_read())
+
+            if mapped:
+                return file.read_mapped()
             return file.read()
         except (IOError, UnicodeError):
             raise
@@ -184,4 +233,7 @@ class OpenAgent(aeidon.Delegate):
             bisect.insort(sorted_starts, start)
             if sorted_starts[-1] != start:
                 sort_count += 1
+        if isinstance(subtitles, aeidon.SubtitleStore):
+            subtitles.sort()
+            return subtitles, sort_count
         return sorted(subtitles), sort_count
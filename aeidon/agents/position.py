@@ -84,13 +84,10 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
+        new_subtitles = self._get_store(indices)
+        new_subtitles.convert_framerate(framerate_out)
         self.set_framerate(framerate_out)
         self.replace_positions(indices, new_subtitles, register=register)
         self.group_actions(register, 2, _("Converting framerate"))
@@ -119,6 +116,15 @@ class PositionAgent(aeidon.Delegate):
         constant = -coefficient * x1 + y1
         return coefficient, constant
 
+    def _get_store(self, indices):
+        """Return a new :class:`aeidon.SubtitleStore` of `indices`."""
+        # Only positions are needed, leave texts blank.
+        if isinstance(self.subtitles, aeidon.SubtitleStore):
+            return self.subtitles.take_positions(indices)
+        store = aeidon.SubtitleStore(self.get_mode(), self.framerate)
+        store.extend_positions(self.subtitles[i] for i in indices)
+        return store
+
     def _get_time_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         p1 = [p1[0], self.calc.time_to_seconds(p1[1])]
@@ -139,8 +145,12 @@ class PositionAgent(aeidon.Delegate):
         orig_framerate = self.framerate
         self.framerate = framerate
         self.calc = aeidon.Calculator(framerate)
-        for subtitle in self.subtitles:
-            subtitle.framerate = framerate
+        if isinstance(self.subtitles, (aeidon.SubtitleStore,
+                                       aeidon.LazySubtitleList)):
+            self.subtitles.framerate = framerate
+        else: # List of subtitles
+            for subtitle in self.subtitles:
+                subtitle.framerate = framerate
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Setting framerate")
@@ -158,14 +168,23 @@ class PositionAgent(aeidon.Delegate):
         `value` can be any valid position type, negative to make subtitles
         appear ealier, positive to make subtitles appear later.
         """
-        new_subtitles = []
+        orig_indices = indices
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
-        self.set_action_description(register, _("Shifting positions"))
+        new_subtitles = self._get_store(indices)
+        new_subtitles.shift_positions(value)
+        self.replace_positions(indices, new_subtitles, register=None)
+        # Revert by shifting back instead of keeping original positions.
+        if new_subtitles.mode == aeidon.modes.TIME:
+            offset = self.calc.to_milliseconds(value)
+            value = self.calc.milliseconds_to_time(-offset)
+        else: # Frames
+            value = -self.calc.to_frame(value)
+        action = aeidon.RevertableAction(register=register)
+        action.docs = tuple(aeidon.documents)
+        action.description = _("Shifting positions")
+        action.revert_function = self.shift_positions
+        action.revert_args = (orig_indices, value)
+        self.register_action(action)
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -176,13 +195,10 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
+        new_subtitles = self._get_store(indices)
+        new_subtitles.scale_positions(coefficient)
+        new_subtitles.shift_positions(constant)
         self.replace_positions(indices, new_subtitles, register=register)
         self.set_action_description(register, _("Transforming positions"))
@@ -43,6 +43,7 @@ This way it will not be in any way processed by the undo/redo system.
 """
 
 import aeidon
+import time
 
 
 class RegisterAgent(aeidon.Delegate):
@@ -51,19 +52,24 @@ class RegisterAgent(aeidon.Delegate):
     Managing revertable actions.
 
     :ivar _do_description: Original description of the action
+    :ivar _journal: :class:`aeidon.UndoJournal` used or ``None``
+    :ivar _last_action: Tuple of the most recent action done and its time
     """
 
     def __init__(self, master):
         """Initialize a :class:`RegisterAgent` instance."""
         aeidon.Delegate.__init__(self, master)
         self._do_description = None
+        self._journal = None
+        self._last_action = (None, None)
         aeidon.util.connect(self, self, "notify::undo_limit")
+        aeidon.util.connect(self, self, "notify::undo_memory_limit")
 
-    def _break_action_group(self, stack, index=0):
+    def _break_action_group(self, stack):
         """Break the action group in `stack` and return amount broken into."""
-        action_group = stack.pop(index)
+        action_group = stack.popleft()
         for action in reversed(action_group.actions):
-            stack.insert(index, action)
+            stack.appendleft(action)
         return len(action_group.actions)
 
     @aeidon.deco.export
@@ -76,12 +82,47 @@ class RegisterAgent(aeidon.Delegate):
         """Return ``True`` if one or more actions can be undone."""
         return len(self.undoables) >= count
 
+    @aeidon.deco.export
+    def coalesce_actions(self, register):
+        """Merge the most recent action into the previous one if possible."""
+        if (register != aeidon.registers.DO or
+            self.undo_coalesce_time is None or
+            not self.undoables):
+            self._last_action = (None, None)
+            return
+        action = self.undoables[0]
+        prev, prev_time = self._last_action
+        if action is prev: return
+        now = time.monotonic()
+        self._last_action = (action, now)
+        if len(self.undoables) < 2: return
+        if self.undoables[1] is not prev: return
+        if now - prev_time > self.undo_coalesce_time: return
+        target = getattr(action, "target", None)
+        if target is None: return
+        if target != getattr(prev, "target", None): return
+        # Keep the saved state reachable by undoing.
+        if aeidon.documents.MAIN in action.docs and self.main_changed == 1:
+            return
+        if aeidon.documents.TRAN in action.docs and self.tran_changed == 1:
+            return
+        # The previous action reverts to the value before both.
+        self.undoables.popleft()
+        self._shift_changed_value(action, -1)
+        self._last_action = (prev, now)
+
     @aeidon.deco.export
     def cut_reversion_stacks(self):
-        """Cut undo and redo stacks to their maximum lengths."""
-        if self.undo_limit is not None:
-            del self.redoables[self.undo_limit:]
-            del self.undoables[self.undo_limit:]
+        """Cut undo and redo stacks to their maximum lengths and sizes."""
+        for stack in (self.undoables, self.redoables):
+            if self.undo_limit is not None:
+                while len(stack) > self.undo_limit:
+                    stack.pop()
+            if self.undo_memory_limit is not None:
+                # Keep at least the most recent action revertable.
+                while (len(stack) > 1 and
+                       stack.size > self.undo_memory_limit):
+                    stack.pop()
 
     @aeidon.deco.export
     def emit_action_signal(self, register):
@@ -117,18 +158,23 @@ class RegisterAgent(aeidon.Delegate):
         action_group.description = description
         stack = self._get_destination_stack(register)
         for i in range(count):
-            action = stack.pop(0)
+            action = stack.popleft()
             if isinstance(action, aeidon.RevertableActionGroup):
                 action_group.actions.extend(action.actions)
             else: # Single action
                 action_group.actions.append(action)
-        stack.insert(0, action_group)
+        stack.appendleft(action_group)
 
     def _on_notify_undo_limit(self, *args):
         """Cut reversion stacks if limit set."""
         if self.undo_limit is not None:
             self.cut_reversion_stacks()
 
+    def _on_notify_undo_memory_limit(self, *args):
+        """Cut reversion stacks if limit set."""
+        if self.undo_memory_limit is not None:
+            self.cut_reversion_stacks()
+
     @aeidon.deco.export
     def redo(self, count=1):
         """Redo `count` amount of actions from the redoable stack."""
@@ -136,21 +182,21 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.redoables[0], group):
             return self._revert_multiple(count, aeidon.registers.REDO)
         self._do_description = self.redoables[0].description
-        self.redoables.pop(0).revert()
+        self.redoables.popleft().revert()
 
     @aeidon.deco.export
     def register_action(self, action):
         """Register `action` as done, undone or redone."""
         if action.register == aeidon.registers.DO:
-            self.undoables.insert(0, action)
-            self.redoables = []
+            self.undoables.appendleft(action)
+            self.redoables.clear()
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.UNDO:
-            self.redoables.insert(0, action)
+            self.redoables.appendleft(action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.REDO:
-            self.undoables.insert(0, action)
+            self.undoables.appendleft(action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
 
@@ -165,7 +211,7 @@ class RegisterAgent(aeidon.Delegate):
                 part_count = self._break_action_group(stack)
             for j in range(part_count):
                 self._do_description = stack[0].description
-                stack.pop(0).revert()
+                stack.popleft().revert()
             if part_count > 1:
                 self.group_actions(register, part_count, description)
         self.unblock(register.signal)
@@ -179,6 +225,26 @@ class RegisterAgent(aeidon.Delegate):
         stack = self._get_destination_stack(register)
         stack[0].description = description
 
+    @aeidon.deco.export
+    def set_undo_journal(self, enabled=True, path=None, limit=1000):
+        """
+        Page actions out of undo and redo stacks to a journal file.
+
+        All but `limit` most recent actions in both stacks are written to a
+        journal file at `path` or a temporary file if `path` is ``None`` and
+        read back once undone or redone up to. If `enabled` is ``False``,
+        read all actions back into memory and remove the journal file.
+        """
+        if self._journal is not None:
+            self.undoables.set_journal(None)
+            self.redoables.set_journal(None)
+            self._journal.close()
+            self._journal = None
+        if not enabled: return
+        self._journal = aeidon.UndoJournal(self.master, path)
+        self.undoables.set_journal(self._journal, limit)
+        self.redoables.set_journal(self._journal, limit)
+
     def _shift_changed_value(self, action, shift):
         """Shift the values of changed attributes."""
         if aeidon.documents.MAIN in action.docs:
@@ -198,4 +264,4 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.undoables[0], group):
             return self._revert_multiple(count, aeidon.registers.UNDO)
         self._do_description = self.undoables[0].description
-        self.undoables.pop(0).revert()
+        self.undoables.popleft().revert()
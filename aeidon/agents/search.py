@@ -30,17 +30,25 @@ class SearchAgent(aeidon.Delegate):
 
     :ivar _docs: Sequence of :attr:`aeidon.documents` items
     :ivar _finder: Instance of :class:`aeidon.Finder` used
+    :ivar _indexed_subtitles: Subtitles indexed in :attr:`_search_indices`
     :ivar _match_doc: :attr:`aeidon.documents` item of the last match
     :ivar _match_passed: ``True`` if the position of last match has been passed
     :ivar _match_index: Index of the last match
     :ivar _match_span: Start and end positions of the last match
     :ivar _indices: Sequence of target indices or ``None`` for all
+    :ivar _search_indices: Dictionary mapping documents to search indices
     :ivar _wrap: ``True`` to wrap search, ``False`` to stop at the last index
 
     Searching is done with the help of an instance of :class:`aeidon.Finder`.
     This agent provides for looping over the subtitles and their texts, feeding
     those texts to the finder and raising :exc:`StopIteration` when no more
     matches are found.
+
+    If enabled with :meth:`set_search_indexing`, texts are indexed with
+    :class:`aeidon.SearchIndex` and only subtitles that can contain matches
+    are fed to the finder. Indices are kept up to date based on signals
+    emitted by the project, texts changed with signals blocked or directly
+    in :attr:`subtitles` are not noticed.
     """
 
     def __init__(self, master):
@@ -48,11 +56,13 @@ class SearchAgent(aeidon.Delegate):
         aeidon.Delegate.__init__(self, master)
         self._docs = None
         self._finder = aeidon.Finder()
+        self._indexed_subtitles = None
         self._indices = None
         self._match_doc = None
         self._match_index = None
         self._match_passed = None
         self._match_span = None
+        self._search_indices = None
         self._wrap = None
         # Set targets to defaults.
         self.set_search_target()
@@ -72,7 +82,7 @@ class SearchAgent(aeidon.Delegate):
         self._match_index = index
         self._match_doc = doc
         self._match_passed = False
-        indices = self._indices or self.get_all_indices()
+        first, last = self._get_bounds()
         while True:
             with aeidon.util.silent(ValueError):
                 # Return match in document after location.
@@ -80,7 +90,7 @@ class SearchAgent(aeidon.Delegate):
             # Proceed to the next document or raise StopIteration.
             self._match_passed = True
             doc = self._get_document(doc, next)
-            index = (min(indices) if next else max(indices))
+            index = (first if next else last)
             pos = None
 
     @aeidon.deco.export
@@ -109,6 +119,18 @@ class SearchAgent(aeidon.Delegate):
         doc = (self._docs[-1] if doc is None else doc)
         return self._find(index, doc, pos, next=False)
 
+    def _get_bounds(self):
+        """
+        Return the first and last index of target subtitles.
+
+        Raise :exc:`ValueError` if no subtitles.
+        """
+        if self._indices:
+            return min(self._indices), max(self._indices)
+        if not self.subtitles:
+            raise ValueError("No subtitles")
+        return 0, len(self.subtitles) - 1
+
     def _get_document(self, doc, next):
         """
         Return the document to proceed to.
@@ -134,6 +156,42 @@ class SearchAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {} or invalid next: {}"
                          .format(repr(doc), repr(next)))
 
+    def _get_search_index(self, doc):
+        """Return an up-to-date :class:`aeidon.SearchIndex` for `doc`."""
+        if self._indexed_subtitles is not self.subtitles:
+            # Subtitles have been replaced as a whole.
+            self._indexed_subtitles = self.subtitles
+            self._search_indices.clear()
+        index = self._search_indices.get(doc)
+        if (index is None or
+            index.size != len(self.subtitles) or
+            index.changes > max(1000, index.size // 10)):
+            texts = (x.get_text(doc) for x in self.subtitles)
+            index = aeidon.SearchIndex(texts)
+            self._search_indices[doc] = index
+        return index
+
+    def _iter_indices(self, start, stop, doc, next):
+        """
+        Iterate over indices of subtitles that can contain matches.
+
+        Indices are limited to ``range(start, stop)``. `next` should be
+        ``True`` to iterate in ascending order, ``False`` for descending.
+        """
+        indices = range(start, stop)
+        indices = (indices if next else reversed(indices))
+        if self._search_indices is None:
+            return indices
+        # Include the index of the last match to be able to tell
+        # when a full loop with no matches has been made.
+        include = ((self._match_index,)
+                   if doc == self._match_doc else ())
+
+        candidates = self._get_search_index(doc).iter_candidates(
+            self._finder.pattern, start, stop, not next, include)
+
+        return (indices if candidates is None else candidates)
+
     def _next_in_document(self, index, doc, pos=None):
         """
         Find the next match in `doc` starting from `pos`.
@@ -143,8 +201,11 @@ class SearchAgent(aeidon.Delegate):
         Raise :exc:`ValueError` if no match in this `doc` after `pos`.
         Return tuple of index, document, match span.
         """
-        indices = self._indices or self.get_all_indices()
-        for index in range(index, max(indices)+1):
+        first, last = self._get_bounds()
+        start = index
+        for index in self._iter_indices(start, last+1, doc, True):
+            if index != start:
+                pos = None
             text = self.subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
@@ -180,8 +241,11 @@ class SearchAgent(aeidon.Delegate):
         Raise :exc:`ValueError` if no match in this `doc` before `pos`.
         Return tuple of index, document, match span.
         """
-        indices = self._indices or self.get_all_indices()
-        for index in reversed(range(min(indices), index+1)):
+        first, last = self._get_bounds()
+        start = index
+        for index in self._iter_indices(first, start+1, doc, False):
+            if index != start:
+                pos = None
             text = self.subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
@@ -208,6 +272,38 @@ class SearchAgent(aeidon.Delegate):
         # Raise ValueError if no match found in this document after position.
         raise ValueError("No more matches in document")
 
+    def _on_main_file_opened(self, *args):
+        """Discard search indices of all documents."""
+        self._search_indices.clear()
+
+    def _on_main_texts_changed(self, project, indices):
+        """Mark changed texts in the search index of the main document."""
+        if aeidon.documents.MAIN in self._search_indices:
+            self._search_indices[aeidon.documents.MAIN].update(indices)
+
+    def _on_subtitles_inserted(self, project, indices):
+        """Insert texts to search indices of all documents."""
+        if list(indices) != sorted(indices):
+            # Subtitles inserted one by one to unsorted
+            # indices do not end up at those indices.
+            return self._search_indices.clear()
+        for index in self._search_indices.values():
+            index.insert(indices)
+
+    def _on_subtitles_removed(self, project, indices):
+        """Remove texts from search indices of all documents."""
+        for index in self._search_indices.values():
+            index.remove(indices)
+
+    def _on_translation_file_opened(self, *args):
+        """Discard search indices of all documents."""
+        self._search_indices.clear()
+
+    def _on_translation_texts_changed(self, project, indices):
+        """Mark changed texts in the search index of the translation."""
+        if aeidon.documents.TRAN in self._search_indices:
+            self._search_indices[aeidon.documents.TRAN].update(indices)
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def replace(self, register=-1):
@@ -239,8 +335,9 @@ class SearchAgent(aeidon.Delegate):
             counts[doc] = 0
             new_indices = []
             new_texts = []
-            for index, subtitle in enumerate(self.subtitles):
-                text = subtitle.get_text(doc)
+            stop = len(self.subtitles)
+            for index in self._iter_indices(0, stop, doc, True):
+                text = self.subtitles[index].get_text(doc)
                 self._finder.set_text(text)
                 sub_count = self._finder.replace_all()
                 if sub_count > 0:
@@ -258,6 +355,32 @@ class SearchAgent(aeidon.Delegate):
             self.group_actions(register, 2, _("Replacing all"))
         return sum(counts.values())
 
+    @aeidon.deco.export
+    def set_search_indexing(self, enabled=True):
+        """
+        Enable or disable use of search indices.
+
+        Search indices speed up finding matches of strings and regular
+        expressions with literal parts in large projects. Indices are built
+        when first needed and kept up to date based on signals.
+        """
+        if enabled == (self._search_indices is not None): return
+        signals = ("main-file-opened",
+                   "main-texts-changed",
+                   "subtitles-inserted",
+                   "subtitles-removed",
+                   "translation-file-opened",
+                   "translation-texts-changed")
+
+        for signal in signals:
+            if enabled:
+                aeidon.util.connect(self, self, signal)
+            else: # Disconnect
+                method = "_on_{}".format(signal.replace("-", "_"))
+                self.disconnect(signal, getattr(self, method))
+        self._indexed_subtitles = None
+        self._search_indices = ({} if enabled else None)
+
     @aeidon.deco.export
     def set_search_regex(self, pattern, flags=re.DOTALL|re.MULTILINE):
         """
@@ -58,6 +58,7 @@ class SetAgent(aeidon.Delegate):
         action.description = _("Editing position")
         action.revert_function = self.set_end
         action.revert_args = (index, orig_end)
+        action.target = ("end", index)
         self.register_action(action)
         self.emit("positions-changed", (index,))
 
@@ -80,6 +81,7 @@ class SetAgent(aeidon.Delegate):
         action.description = _("Editing position")
         action.revert_function = self.set_end
         action.revert_args = (index, orig_value)
+        action.target = ("end", index)
         self.register_action(action)
         self.emit("positions-changed", (index,))
 
@@ -107,12 +109,17 @@ class SetAgent(aeidon.Delegate):
         orig_value = subtitle.start
         subtitle.start = value
         if subtitle.start == orig_value: return
+        orig_index = index
         index = self._move_if_needed(index)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Editing position")
         action.revert_function = self.set_start
         action.revert_args = (index, orig_value)
+        if index == orig_index:
+            # A moved subtitle can end up at the index of another,
+            # never merge edits that move subtitles.
+            action.target = ("start", index)
         self.register_action(action)
         self.emit("positions-changed", (index,))
 
@@ -129,6 +136,7 @@ class SetAgent(aeidon.Delegate):
         action.description = _("Editing text")
         action.revert_function = self.set_text
         action.revert_args = (index, doc, orig_value)
+        action.target = ("text", index, doc)
         self.register_action(action)
         signal = self.get_text_signal(doc)
         self.emit(signal, (index,))
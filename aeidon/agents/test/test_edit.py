@@ -100,6 +100,17 @@ class TestEditAgent(aeidon.TestCase):
             assert subtitles[i].start == new_subtitles[i].start
             assert subtitles[i].end == new_subtitles[i].end
 
+    @aeidon.deco.reversion_test
+    def test_replace_positions__undo(self):
+        subtitle = self.project.new_subtitle()
+        subtitle.start_frame = 1
+        subtitle.end_frame = 2
+        self.project.replace_positions((3,), [subtitle])
+        action = self.project.undoables[0]
+        orig_subtitles = action.revert_args[1]
+        assert isinstance(orig_subtitles, aeidon.SubtitleStore)
+        assert orig_subtitles[0].main_text == ""
+
     @aeidon.deco.reversion_test
     def test_replace_texts(self):
         doc = aeidon.documents.MAIN
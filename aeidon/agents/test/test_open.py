@@ -38,6 +38,39 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__bytes_read(self):
+        path = self.new_subrip_file()
+        size = len(open(path, "rb").read())
+        self.project.open_main(path, "ascii")
+        assert self.project.main_file.bytes_read == size
+        assert self.project.main_file.data is None
+
+    def test_open_main__lazy(self):
+        path = self.new_subrip_file()
+        project = aeidon.Project(lazy=True)
+        project.open_main(path, "ascii")
+        assert isinstance(project.subtitles, aeidon.LazySubtitleList)
+        assert project.subtitles.count_parsed() == 0
+        self.project.open_main(path, "ascii")
+        assert project.subtitles == self.project.subtitles
+
+    def test_open_main__lazy_sort(self):
+        path = self.new_subrip_file()
+        with open(path, "w") as f:
+            f.write("1\n00:00:05,000 --> 00:00:06,000\nx\n\n")
+            f.write("2\n00:00:01,000 --> 00:00:02,000\ny\n")
+        project = aeidon.Project(lazy=True)
+        sort_count = project.open_main(path, "ascii")
+        assert not isinstance(project.subtitles, aeidon.LazySubtitleList)
+        assert sort_count == 1
+
+    def test_open_main__mapped(self):
+        path = self.new_microdvd_file()
+        project = aeidon.Project(mapped=True)
+        project.open_main(path, "ascii")
+        self.project.open_main(path, "ascii")
+        assert project.subtitles == self.project.subtitles
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
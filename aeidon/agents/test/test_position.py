@@ -136,6 +136,16 @@ class TestPositionAgent(aeidon.TestCase):
             assert subtitle.start_frame == start
             assert subtitle.end_frame == end
 
+    @aeidon.deco.reversion_test
+    def test_shift_positions__all(self):
+        orig_subtitles = [x.copy() for x in self.project.subtitles]
+        self.project.shift_positions(None, "00:00:01.500")
+        for i, subtitle in enumerate(self.project.subtitles):
+            start = orig_subtitles[i].start_seconds + 1.5
+            assert abs(subtitle.start_seconds - start) < 0.001
+        action = self.project.undoables[0]
+        assert action.revert_args == (None, "-00:00:01.500")
+
     @aeidon.deco.reversion_test
     def test_transform_positions(self):
         a, b = "00:00:01.000", "00:00:45.000"
@@ -144,3 +154,14 @@ class TestPositionAgent(aeidon.TestCase):
         for subtitle in self.project.subtitles[3:6]:
             assert a < subtitle.start_time < b
         assert self.project.subtitles[6].start_time == b
+
+
+class TestPositionAgentColumnar(TestPositionAgent):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project(columnar=True)
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        self.project.open_translation(self.new_microdvd_file(), "ascii")
+
+    def test_subtitles(self):
+        assert isinstance(self.project.subtitles, aeidon.SubtitleStore)
@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import functools
 
 MAIN = aeidon.documents.MAIN
 TRAN = aeidon.documents.TRAN
@@ -27,6 +28,86 @@ class TestRegisterAgent(aeidon.TestCase):
         self.project = self.new_project()
         self.delegate = self.project.undo.__self__
 
+    def test_coalesce_actions(self):
+        self.project.undo_coalesce_time = 60
+        text = self.project.subtitles[0].main_text
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        self.project.set_text(0, MAIN, "abc")
+        assert len(self.project.undoables) == 1
+        assert self.project.main_changed == 1
+        self.project.undo()
+        assert self.project.subtitles[0].main_text == text
+        assert self.project.main_changed == 0
+
+    def test_coalesce_actions__disabled(self):
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+
+    def test_coalesce_actions__different_target(self):
+        self.project.undo_coalesce_time = 60
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(1, MAIN, "a")
+        self.project.set_text(1, TRAN, "a")
+        self.project.set_end(1, self.project.subtitles[1].end_seconds + 1)
+        assert len(self.project.undoables) == 4
+
+    def test_coalesce_actions__moved(self):
+        self.project.undo_coalesce_time = 60
+        subtitles = list(self.project.subtitles)
+        starts = [x.start_seconds for x in subtitles]
+        # Move both of the first two subtitles to index one.
+        self.project.set_start(0, starts[1] + 0.1)
+        assert self.project.subtitles[1] is subtitles[0]
+        self.project.set_start(0, starts[1] + 0.2)
+        assert self.project.subtitles[1] is subtitles[1]
+        assert len(self.project.undoables) == 2
+        self.project.undo(2)
+        assert [x.start_seconds for x in subtitles] == starts
+
+    def test_coalesce_actions__saved(self):
+        self.project.undo_coalesce_time = 60
+        self.project.set_text(0, MAIN, "a")
+        self.project.main_changed = 0
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+        self.project.undo()
+        assert self.project.main_changed == 0
+
+    def test_coalesce_actions__signal(self):
+        self.project.undo_coalesce_time = 60
+        actions = []
+        self.project.connect("action-done", lambda x, y: actions.append(y))
+        self.project.set_end(0, self.project.subtitles[0].end_seconds + 1)
+        self.project.set_end(0, self.project.subtitles[0].end_seconds + 1)
+        assert len(self.project.undoables) == 1
+        assert actions == [self.project.undoables[0]]
+
+    def test_cut_reversion_stacks(self):
+        self.project.undo_limit = 2
+        for i in range(3):
+            self.project.clear_texts((i,), MAIN)
+        assert len(self.project.undoables) == 2
+        self.project.undo(2)
+        assert self.project.subtitles[0].main_text == ""
+        assert self.project.subtitles[1].main_text != ""
+        assert len(self.project.redoables) == 2
+
+    def test_cut_reversion_stacks__memory(self):
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        size = self.project.undoables[0].get_size()
+        self.project.clear_texts(self.project.get_all_indices(), MAIN)
+        assert self.project.undoables.size > 3 * size
+        self.project.undo_memory_limit = 3 * size
+        assert len(self.project.undoables) == 1
+        self.project.undo_memory_limit = 0
+        assert len(self.project.undoables) == 1
+        self.project.undo()
+        assert self.project.undoables.size == 0
+        assert self.project.redoables.size > 0
+
     def test_redo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -44,6 +125,40 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    def test_set_undo_journal(self):
+        orig_texts = [x.main_text for x in self.project.subtitles]
+        self.project.set_undo_journal(limit=2)
+        for i in range(5):
+            self.project.clear_texts((i,), MAIN)
+        entries = [isinstance(x, aeidon.JournalEntry)
+                   for x in self.project.undoables]
+        assert entries == [False, False, True, True, True]
+        self.project.undo(4)
+        assert isinstance(self.project.redoables[2], aeidon.JournalEntry)
+        self.project.set_undo_journal(False)
+        assert not any(isinstance(x, aeidon.JournalEntry)
+                       for x in self.project.redoables)
+        self.project.undo()
+        texts = [x.main_text for x in self.project.subtitles]
+        assert texts == orig_texts
+
+    def test_set_undo_journal__unstorable(self):
+        orig_texts = [x.main_text for x in self.project.subtitles]
+        self.project.set_undo_journal(limit=2)
+        self.project.clear_texts((0,), MAIN)
+        # Actions with revert functions not found in the project
+        # cannot be written to the journal.
+        action = self.project.undoables[0]
+        action.revert_function = functools.partial(action.revert_function)
+        for i in range(1, 5):
+            self.project.clear_texts((i,), MAIN)
+        entries = [isinstance(x, aeidon.JournalEntry)
+                   for x in self.project.undoables]
+        assert entries == [False, False, True, True, False]
+        self.project.undo(5)
+        texts = [x.main_text for x in self.project.subtitles]
+        assert texts == orig_texts
+
     def test_undo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
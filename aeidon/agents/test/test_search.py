@@ -99,3 +99,30 @@ class TestSearchAgent(aeidon.TestCase):
         for i, text in enumerate(texts):
             assert self.project.subtitles[i].main_text == text
             assert self.project.subtitles[i].tran_text == text
+
+
+class TestSearchAgentIndexing(TestSearchAgent):
+
+    def setup_method(self, method):
+        TestSearchAgent.setup_method(self, method)
+        self.project.set_search_indexing(True)
+
+    def test_find_next__changed(self):
+        self.project.set_search_target(None, (MAIN,), wrap=False)
+        self.project.set_search_string("careful")
+        assert self.project.find_next() == (2, MAIN, (3, 10))
+        self.project.set_text(0, MAIN, "Be careful.")
+        assert self.project.find_next() == (0, MAIN, (3, 10))
+
+    def test_find_next__removed(self):
+        self.project.set_search_target(None, (MAIN,), wrap=False)
+        self.project.set_search_string("careful")
+        self.project.remove_subtitles((0,))
+        assert self.project.find_next() == (1, MAIN, (3, 10))
+        self.project.insert_subtitles((0, 1))
+        assert self.project.find_next() == (3, MAIN, (3, 10))
+
+    def test_set_search_indexing(self):
+        self.project.set_search_indexing(False)
+        self.project.set_search_string("careful")
+        assert self.project.find_next() == (2, MAIN, (3, 10))
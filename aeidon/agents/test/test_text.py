@@ -48,6 +48,23 @@ class TestTextAgent(aeidon.TestCase):
         for subtitle in self.project.subtitles:
             assert subtitle.main_text == "Test. Test I."
 
+    def test_capitalize__workers(self):
+        for i, subtitle in enumerate(self.project.subtitles):
+            subtitle.main_text = ("test. test." if i % 3 else "test")
+        project = self.new_project()
+        project.subtitles = [x.copy() for x in self.project.subtitles]
+        manager = aeidon.PatternManager("capitalization")
+        patterns = manager.get_patterns("Latn", "en")
+        indices = [x for x in self.project.get_all_indices() if x != 5]
+        project.capitalize(indices, aeidon.documents.MAIN, patterns)
+        self.project.capitalize(indices,
+                                aeidon.documents.MAIN,
+                                patterns,
+                                workers=4)
+
+        assert self.project.subtitles == project.subtitles
+        assert len(self.project.undoables) == 1
+
     def test_correct_common_errors(self):
         self.project.subtitles[0].main_text = "''Test''"
         self.project.subtitles[1].main_text = "123o456o789"
@@ -59,6 +76,19 @@ class TestTextAgent(aeidon.TestCase):
         assert self.project.subtitles[0].main_text == '"Test"'
         assert self.project.subtitles[1].main_text == "12304560789"
 
+    def test_correct_common_errors__workers(self):
+        for subtitle in self.project.subtitles:
+            subtitle.main_text = "''Test''"
+        manager = aeidon.PatternManager("common-error")
+        self.project.correct_common_errors(None,
+                                           aeidon.documents.MAIN,
+                                           manager.get_patterns("Latn"),
+                                           workers=2)
+
+        for subtitle in self.project.subtitles:
+            assert subtitle.main_text == '"Test"'
+        assert len(self.project.undoables) == 1
+
     def test_remove_hearing_impaired(self):
         orig_length = len(self.project.subtitles)
         self.project.subtitles[0].main_text = "[Boo] Test."
@@ -74,6 +104,23 @@ class TestTextAgent(aeidon.TestCase):
         assert self.project.subtitles[0].main_text == "Test."
         assert len(self.project.subtitles) == orig_length - 1
 
+    def test_remove_hearing_impaired__workers(self):
+        orig_length = len(self.project.subtitles)
+        for subtitle in self.project.subtitles:
+            subtitle.main_text = "[Boo] Test."
+        self.project.subtitles[1].main_text = "[Boo]"
+        manager = aeidon.PatternManager("hearing-impaired")
+        patterns = manager.get_patterns("Latn")
+        for pattern in patterns:
+            pattern.enabled = True
+        self.project.remove_hearing_impaired(None,
+                                             aeidon.documents.MAIN,
+                                             patterns,
+                                             workers=2)
+
+        assert self.project.subtitles[0].main_text == "Test."
+        assert len(self.project.subtitles) == orig_length - 1
+
     def test_spell_check_join_words(self):
         for subtitle in self.project.subtitles:
             subtitle.main_text = subtitle.main_text.replace("a", " a")
@@ -18,17 +18,19 @@
 """Automatic correcting of texts."""
 
 import aeidon
+import concurrent.futures
+import os
 import re
 
 from aeidon.i18n import _
 
+_re_capitalizable = re.compile(r"^\W*(?<!\.\.\.)(?<!…)\w")
+
 
 class TextAgent(aeidon.Delegate):
 
     """Automatic correcting of texts."""
 
-    _re_capitalizable = re.compile(r"^\W*(?<!\.\.\.)(?<!…)\w")
-
     @aeidon.deco.export
     @aeidon.deco.revertable
     def break_lines(self, indices, doc, patterns, length_func, max_length,
@@ -92,94 +94,74 @@ class TextAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     @aeidon.deco.revertable
-    def capitalize(self, indices, doc, patterns, register=-1):
+    def capitalize(self, indices, doc, patterns, workers=1, register=-1):
         """
         Capitalize texts as defined by `patterns`.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
-        :exc:`re.error` if a bad regular expression among `patterns`.
+        be a sequence of instances of :class:`aeidon.Pattern`. `workers` is
+        the amount of worker processes to split `indices` among or ``None``
+        for one per CPU. Raise :exc:`re.error` if a bad regular expression
+        among `patterns`.
         """
         new_indices = []
         new_texts = []
-        parser = self.get_parser(doc)
         patterns = [x for x in patterns if x.enabled]
-        indices = indices or self.get_all_indices()
-        for indices in aeidon.util.get_ranges(indices):
-            cap_next = False
-            for index in indices:
-                subtitle = self.subtitles[index]
-                parser.set_text(subtitle.get_text(doc))
-                if cap_next or index == 0:
-                    self._capitalize_first(parser, 0)
-                    cap_next = False
-                for pattern in patterns:
-                    string = pattern.get_field("Pattern")
-                    flags = pattern.get_flags()
-                    parser.set_regex(string, flags)
-                    parser.pos = 0
-                    cap_next = self._capitalize_text(parser, pattern, cap_next)
-                text = parser.get_text()
-                if text != subtitle.get_text(doc):
-                    new_indices.append(index)
-                    new_texts.append(text)
+        indices = sorted(set(indices or self.get_all_indices()))
+        texts = [self.subtitles[i].get_text(doc) for i in indices]
+        format = self._get_format_name(doc)
+        results, starts = self._map_texts(
+            _capitalize_texts, indices, texts, format, workers, patterns)
+        for start in starts[1:]:
+            # Chunks are capitalized in workers assuming that nothing is
+            # carried over from the previous subtitle. If something is,
+            # redo subtitles until the result no longer differs.
+            if indices[start] != indices[start-1] + 1: continue
+            cap_next = results[start-1][1]
+            for i in range(start, len(indices)):
+                if not cap_next: break
+                result = _capitalize_texts(indices[i:i+1],
+                                           texts[i:i+1],
+                                           format,
+                                           patterns,
+                                           cap_next)[0]
+
+                if result == results[i]: break
+                results[i] = result
+                cap_next = result[1]
+        for index, text, result in zip(indices, texts, results):
+            if result[0] != text:
+                new_indices.append(index)
+                new_texts.append(result[0])
         if not new_indices: return
         self.replace_texts(new_indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Capitalizing texts"))
 
-    def _capitalize_first(self, parser, pos):
-        """Capitalize the first alphanumeric character from `pos`."""
-        match = self._re_capitalizable.search(parser.text[pos:])
-        if match is not None:
-            i = pos + match.end() - 1
-            prefix = parser.text[:i]
-            text = parser.text[i:i+1].capitalize()
-            suffix = parser.text[i+1:]
-            parser.text = prefix + text + suffix
-        return match is not None
-
-    def _capitalize_text(self, parser, pattern, cap_next):
-        """Capitalize all matches of `pattern` in `parser`'s text."""
-        try:
-            a, z = parser.next()
-        except StopIteration:
-            return cap_next
-        if pattern.get_field("Capitalize") == "Start":
-            self._capitalize_first(parser, a)
-        if pattern.get_field("Capitalize") == "After":
-            cap_next = not self._capitalize_first(parser, z)
-        return self._capitalize_text(parser, pattern, cap_next)
-
     @aeidon.deco.export
     @aeidon.deco.revertable
-    def correct_common_errors(self, indices, doc, patterns, register=-1):
+    def correct_common_errors(self, indices, doc, patterns, workers=1,
+                              register=-1):
         """
         Correct common human and OCR errors in texts.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
-        :exc:`re.error` if a bad regular expression among `patterns`.
+        be a sequence of instances of :class:`aeidon.Pattern`. `workers` is
+        the amount of worker processes to split `indices` among or ``None``
+        for one per CPU. Raise :exc:`re.error` if a bad regular expression
+        among `patterns`.
         """
         new_indices = []
         new_texts = []
-        parser = self.get_parser(doc)
         patterns = [x for x in patterns if x.enabled]
-        re_patterns = self._get_substitutions(patterns)
-        repeats = [x.get_field_boolean("Repeat") for x in patterns]
-        for index in indices or self.get_all_indices():
-            subtitle = self.subtitles[index]
-            parser.set_text(subtitle.get_text(doc))
-            for i, item in enumerate(re_patterns):
-                string, flags, replacement = item
-                parser.set_regex(string, flags)
-                parser.replacement = replacement
-                count = parser.replace_all()
-                while repeats[i] and count:
-                    count = parser.replace_all()
-            text = parser.get_text()
-            if text != subtitle.get_text(doc):
+        indices = list(indices or self.get_all_indices())
+        texts = [self.subtitles[i].get_text(doc) for i in indices]
+        format = self._get_format_name(doc)
+        results, starts = self._map_texts(
+            _correct_texts, indices, texts, format, workers, patterns, True)
+        for index, text, result in zip(indices, texts, results):
+            if result != text:
                 new_indices.append(index)
-                new_texts.append(text)
+                new_texts.append(result)
         if not new_indices: return
         self.replace_texts(new_indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Correcting common errors"))
@@ -193,6 +175,11 @@ class TextAgent(aeidon.Delegate):
         dictionary.check("aeidon")
         return enchant.checker.SpellChecker(dictionary, "")
 
+    def _get_format_name(self, doc):
+        """Return name of `doc`'s format or ``None``."""
+        format = self.get_format(doc)
+        return format.name if format is not None else None
+
     def _get_misspelled_indices(self, checker):
         """Return a list of misspelled indices in `checker`'s text."""
         i = [list(range(x.wordpos, x.wordpos + len(x.word))) for x in checker]
@@ -207,40 +194,56 @@ class TextAgent(aeidon.Delegate):
             "value": float(x.get_field("Penalty")),
         } for x in patterns]
 
-    def _get_substitutions(self, patterns):
-        """Return a list of substitution definitions."""
-        return [(
-            x.get_field("Pattern"),
-            x.get_flags(),
-            x.get_field("Replacement"),
-        ) for x in patterns]
+    def _map_texts(self, function, indices, texts, format, workers, *args):
+        """
+        Return results of `function` for `texts` split among `workers`.
+
+        `function` is called with a chunk of `indices`, the corresponding
+        chunk of `texts`, `format` and `args` and should return a list of
+        results, one per text. Return a list of results for all `texts` and
+        a list of positions in `texts` at which chunks start.
+        """
+        workers = min(workers or os.cpu_count() or 1, len(texts))
+        if workers <= 1:
+            return function(indices, texts, format, *args), [0]
+        size = -(-len(texts) // workers)
+        starts = list(range(0, len(texts), size))
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(function,
+                                       indices[i:i+size],
+                                       texts[i:i+size],
+                                       format,
+                                       *args) for i in starts]
+
+            results = aeidon.util.flatten([x.result() for x in futures])
+        return results, starts
 
     @aeidon.deco.export
     @aeidon.deco.revertable
-    def remove_hearing_impaired(self, indices, doc, patterns, register=-1):
+    def remove_hearing_impaired(self, indices, doc, patterns, workers=1,
+                                register=-1):
         """
         Remove hearing impaired parts from subtitles.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
-        :exc:`re.error` if a bad regular expression among `patterns`.
+        be a sequence of instances of :class:`aeidon.Pattern`. `workers` is
+        the amount of worker processes to split `indices` among or ``None``
+        for one per CPU. Raise :exc:`re.error` if a bad regular expression
+        among `patterns`.
         """
         new_indices = []
         new_texts = []
         parser = self.get_parser(doc)
         patterns = [x for x in patterns if x.enabled]
-        re_patterns = self._get_substitutions(patterns)
-        for index in indices or self.get_all_indices():
-            subtitle = self.subtitles[index]
-            parser.set_text(subtitle.get_text(doc))
-            for string, flags, replacement in re_patterns:
-                parser.set_regex(string, flags)
-                parser.replacement = replacement
-                parser.replace_all()
-            text = parser.get_text()
-            if text != subtitle.get_text(doc):
+        indices = list(indices or self.get_all_indices())
+        texts = [self.subtitles[i].get_text(doc) for i in indices]
+        format = self._get_format_name(doc)
+        results, starts = self._map_texts(
+            _correct_texts, indices, texts, format, workers, patterns, False)
+        for index, text, result in zip(indices, texts, results):
+            if result != text:
                 new_indices.append(index)
-                new_texts.append(text)
+                new_texts.append(result)
         if not new_indices: return
         new_texts = self._remove_leftover_hi(new_texts, parser)
         self.replace_texts(new_indices, doc, new_texts, register=register)
@@ -371,3 +374,71 @@ class TextAgent(aeidon.Delegate):
         self.replace_texts(new_indices, doc, new_texts, register=register)
         description = _("Splitting words by spell-check suggestions")
         self.set_action_description(register, description)
+
+
+def _capitalize_first(parser, pos):
+    """Capitalize the first alphanumeric character from `pos`."""
+    match = _re_capitalizable.search(parser.text[pos:])
+    if match is not None:
+        i = pos + match.end() - 1
+        prefix = parser.text[:i]
+        text = parser.text[i:i+1].capitalize()
+        suffix = parser.text[i+1:]
+        parser.text = prefix + text + suffix
+    return match is not None
+
+def _capitalize_text(parser, pattern, cap_next):
+    """Capitalize all matches of `pattern` in `parser`'s text."""
+    while True:
+        try:
+            a, z = parser.next()
+        except StopIteration:
+            return cap_next
+        if pattern.get_field("Capitalize") == "Start":
+            _capitalize_first(parser, a)
+        if pattern.get_field("Capitalize") == "After":
+            cap_next = not _capitalize_first(parser, z)
+
+def _capitalize_texts(indices, texts, format, patterns, cap_next=False):
+    """
+    Return capitalized `texts` and whether to capitalize next after each.
+
+    `indices` should be sorted. `cap_next` is carried over only between
+    consecutive indices, starting with the first of `indices`.
+    """
+    results = []
+    parser = _new_parser(format)
+    for i, (index, text) in enumerate(zip(indices, texts)):
+        if i > 0 and index != indices[i-1] + 1:
+            cap_next = False
+        parser.set_text(text)
+        if cap_next or index == 0:
+            _capitalize_first(parser, 0)
+            cap_next = False
+        for pattern in patterns:
+            string = pattern.get_field("Pattern")
+            flags = pattern.get_flags()
+            parser.set_regex(string, flags)
+            parser.pos = 0
+            cap_next = _capitalize_text(parser, pattern, cap_next)
+        results.append((parser.get_text(), cap_next))
+    return results
+
+def _correct_texts(indices, texts, format, patterns, repeat):
+    """Return `texts` with substitutions of `patterns` applied."""
+    results = []
+    parser = _new_parser(format)
+    program = aeidon.PatternProgram(patterns, repeat)
+    for text in texts:
+        parser.set_text(text)
+        program.apply(parser)
+        results.append(parser.get_text())
+    return results
+
+def _new_parser(format):
+    """Return a new :class:`aeidon.Parser` instance for `format`."""
+    # Formats are passed by name to worker processes, where
+    # unpickled copies would not compare equal to the actual items.
+    if format is None: return aeidon.Parser()
+    markup = aeidon.markups.new(getattr(aeidon.formats, format))
+    return aeidon.Parser(markup.tag, markup.clean)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Converting multiple subtitle files in parallel."""
+
+import aeidon
+import concurrent.futures
+import os
+
+__all__ = ("BatchConverter", "BatchResult")
+
+
+class BatchConverter:
+
+    """
+    Converting multiple subtitle files in parallel.
+
+    :ivar encoding: Character encoding to read files with or ``None``
+    :ivar format: :attr:`aeidon.formats` item to convert files to
+    :ivar framerate: :attr:`aeidon.framerates` item or ``None``
+    :ivar newline: :attr:`aeidon.newlines` item or ``None``
+    :ivar queue_size: Maximum amount of files queued for workers at once
+    :ivar workers: Amount of worker processes or ``None`` for one per CPU
+
+    Files are read with :meth:`aeidon.Project.open_main` and written with
+    :meth:`aeidon.Project.save_main` in a pool of worker processes, one file
+    at a time per worker. Paths to convert are consumed only as workers
+    become free, so an arbitrarily long iterable of paths can be given.
+    Failure to convert one file does not affect the others, errors are
+    reported per file in :class:`BatchResult` instances.
+
+    If :attr:`encoding` is ``None``, the system default encoding is used to
+    read files and the encoding of each file is used to write it. If
+    :attr:`newline` is ``None``, the newline type of each file is kept. If
+    :attr:`workers` is 1, files are converted in the calling process.
+    """
+
+    def __init__(self, format, encoding=None, newline=None, framerate=None,
+                 workers=None, queue_size=None):
+        """Initialize a :class:`BatchConverter` instance."""
+        self.encoding = encoding
+        self.format = format
+        self.framerate = framerate
+        self.newline = newline
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size or 2 * self.workers
+
+    def convert(self, paths, directory=None):
+        """
+        Convert files at `paths` and return results in the same order.
+
+        `directory` can be ``None`` to write files next to the originals.
+        """
+        results = list(self.iter_convert(paths, directory))
+        results.sort(key=lambda x: x.index)
+        return results
+
+    def _get_args(self, path, directory):
+        """Return arguments for :func:`_convert` for file at `path`."""
+        return (path,
+                self.get_target(path, directory),
+                self.format.name,
+                self.encoding,
+                self.newline.name if self.newline else None,
+                self.framerate.name if self.framerate else None)
+
+    def get_summary(self, results):
+        """Return a summary report of `results` as a string."""
+        failed = [x for x in results if x.error is not None]
+        count = sum(x.count for x in results if x.error is None)
+        lines = ["{:d} files converted to {}, {:d} failed, {:d} subtitles"
+                 .format(len(results) - len(failed),
+                         self.format.label,
+                         len(failed),
+                         count)]
+
+        for result in failed:
+            lines.append("{}: {}".format(result.path, result.error))
+        return "\n".join(lines)
+
+    def get_target(self, path, directory=None):
+        """Return path of file to write converted file at `path` to."""
+        root = os.path.splitext(os.path.basename(path))[0]
+        directory = directory or os.path.dirname(os.path.abspath(path))
+        return os.path.join(directory, root + self.format.extension)
+
+    def iter_convert(self, paths, directory=None):
+        """
+        Convert files at `paths` and yield results one by one.
+
+        Results are yielded in the order conversions finish. Files that
+        would be written to the same target as an earlier file are not
+        converted, but reported as failed.
+        `directory` can be ``None`` to write files next to the originals.
+        """
+        targets = set()
+        if self.workers == 1:
+            for i, path in enumerate(paths):
+                args = self._get_args(path, directory)
+                try:
+                    self._reserve_target(args[1], targets)
+                    yield BatchResult(i, path, args[1], _convert(*args))
+                except Exception as error:
+                    yield BatchResult(i, path, args[1], error=error)
+            return
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+            pending = {}
+            for i, path in enumerate(paths):
+                if len(pending) >= self.queue_size:
+                    yield from self._wait(pending)
+                args = self._get_args(path, directory)
+                try:
+                    self._reserve_target(args[1], targets)
+                except ValueError as error:
+                    yield BatchResult(i, path, args[1], error=error)
+                    continue
+                future = executor.submit(_convert, *args)
+                pending[future] = (i, path, args[1])
+            while pending:
+                yield from self._wait(pending)
+
+    def _reserve_target(self, target, targets):
+        """
+        Add `target` to `targets` of files being written.
+
+        Raise :exc:`ValueError` if `target` is already in `targets`.
+        """
+        key = os.path.normcase(os.path.abspath(target))
+        if key in targets:
+            raise ValueError("Target used by another file: {}"
+                             .format(repr(target)))
+        targets.add(key)
+
+    def _wait(self, pending):
+        """Wait for at least one of `pending` and yield results."""
+        done, not_done = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            index, path, target = pending.pop(future)
+            error = future.exception()
+            if error is not None:
+                yield BatchResult(index, path, target, error=error)
+            else: # Converted successfully
+                yield BatchResult(index, path, target, future.result())
+
+
+class BatchResult:
+
+    """
+    Result of converting one file with :class:`BatchConverter`.
+
+    :ivar count: Amount of subtitles converted
+    :ivar error: String describing error if conversion failed, else ``None``
+    :ivar index: Index of file in paths given to convert
+    :ivar path: Full, absolute path to the original file
+    :ivar target: Full, absolute path to the converted file
+    """
+
+    def __init__(self, index, path, target, count=0, error=None):
+        """Initialize a :class:`BatchResult` instance."""
+        self.count = count
+        self.error = (None if error is None else
+                      "{}: {}".format(type(error).__name__, str(error)))
+
+        self.index = index
+        self.path = os.path.abspath(path)
+        self.target = os.path.abspath(target)
+
+
+def _convert(path, target, format, encoding, newline, framerate):
+    """Convert file at `path` to `target` and return amount of subtitles."""
+    if os.path.abspath(path) == os.path.abspath(target):
+        raise ValueError("Target is the same as source: {}"
+                         .format(repr(target)))
+    # Enumeration items are passed by name to worker processes, where
+    # unpickled copies would not compare equal to the actual items.
+    format = getattr(aeidon.formats, format)
+    framerate = (getattr(aeidon.framerates, framerate)
+                 if framerate is not None else None)
+
+    project = aeidon.Project(framerate, mapped=True)
+    project.open_main(path, encoding)
+    file = aeidon.files.new(format,
+                            target,
+                            project.main_file.encoding,
+                            project.main_file.newline)
+
+    if newline is not None:
+        file.newline = getattr(aeidon.newlines, newline)
+    project.save_main(file)
+    return len(project.subtitles)
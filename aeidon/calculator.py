@@ -18,16 +18,41 @@
 """Time and frame calculator."""
 
 import aeidon
+import array
 
 __all__ = ("Calculator",)
 
 
+def _is_numpy_array(values):
+    """Return ``True`` if `values` is a NumPy array."""
+    # Avoid importing NumPy, which is an optional dependency
+    # and would only ever be used if values are NumPy arrays.
+    cls = values.__class__
+    return cls.__name__ == "ndarray" and cls.__module__ == "numpy"
+
+def _new_sequence(values, items, typecode):
+    """Return `items` as the same kind of sequence as `values`."""
+    if _is_numpy_array(values):
+        import numpy
+        return numpy.array(items)
+    if isinstance(values, array.array):
+        return array.array(typecode, items)
+    return list(items)
+
+
 class Calculator:
 
     """
     Time and frame calculator.
 
     Times are handled as strings, frames as integers and seconds as floats.
+    Milliseconds, as integers, are available for exact internal storage.
+
+    Methods with plural names, e.g. :meth:`times_to_seconds`, convert whole
+    sequences of positions at once. They accept lists and other sequences,
+    :class:`array.array` instances and NumPy arrays and return the same kind
+    of sequence, except that times are always returned as a list of strings.
+    Using these is much faster than converting one position at a time.
     Only one instance of :class:`Calculator` exists for a given framerate.
     """
 
@@ -86,6 +111,18 @@ class Calculator:
         seconds = self.frame_to_seconds(frame)
         return self.seconds_to_time(seconds)
 
+    def frames_to_seconds(self, frames):
+        """Convert sequence of `frames` to seconds."""
+        if _is_numpy_array(frames):
+            return frames / self._framerate
+        framerate = self._framerate
+        seconds = [x / framerate for x in frames]
+        return _new_sequence(frames, seconds, "d")
+
+    def frames_to_times(self, frames):
+        """Convert sequence of `frames` to a list of times."""
+        return self.seconds_to_times(self.frames_to_seconds(frames))
+
     def get_middle(self, x, y):
         """Return time, frame or seconds halfway between `x` and `y`."""
         if aeidon.is_time(x):
@@ -141,6 +178,18 @@ class Calculator:
                 0 <= seconds  <=  59 and
                 0 <= mseconds <= 999)
 
+    def milliseconds_to_time(self, milliseconds):
+        """Convert integer `milliseconds` to time."""
+        sign = ("-" if milliseconds < 0 else "")
+        milliseconds = abs(milliseconds)
+        if milliseconds > 359999999:
+            return "{}99:59:59.999".format(sign)
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return ("{}{:02d}:{:02d}:{:02d}.{:03d}"
+                .format(sign, hours, minutes, seconds, milliseconds))
+
     def normalize_time(self, time):
         """
         Convert `time` to valid format.
@@ -186,6 +235,16 @@ class Calculator:
         """Convert `seconds` to frame."""
         return int(round(seconds * self._framerate, 0))
 
+    def seconds_to_frames(self, seconds):
+        """Convert sequence of `seconds` to frames."""
+        if _is_numpy_array(seconds):
+            import numpy
+            frames = numpy.rint(seconds * self._framerate)
+            return frames.astype(numpy.int64)
+        framerate = self._framerate
+        frames = [int(round(x * framerate, 0)) for x in seconds]
+        return _new_sequence(seconds, frames, "q")
+
     def seconds_to_time(self, seconds):
         """Convert `seconds` to time."""
         sign = ("-" if seconds < 0 else "")
@@ -199,11 +258,43 @@ class Calculator:
                         int(seconds % 60),
                         (seconds % 1) * 1000))
 
+    def seconds_to_times(self, seconds):
+        """Convert sequence of `seconds` to a list of times."""
+        if _is_numpy_array(seconds):
+            seconds = seconds.tolist()
+        times = []
+        format = "{:02d}:{:02d}:{:02d}.{:03d}".format
+        for value in seconds:
+            if value < 0:
+                # Leave negative values to the slow path.
+                times.append(self.seconds_to_time(value))
+                continue
+            # Round to three decimals first as seconds_to_time does,
+            # the second rounding only removes floating point error.
+            value = round(round(value, 3) * 1000)
+            if value > 359999999:
+                times.append(self.seconds_to_time(value / 1000))
+                continue
+            seconds, value = divmod(value, 1000)
+            minutes, seconds = divmod(seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            times.append(format(hours, minutes, seconds, value))
+        return times
+
     def time_to_frame(self, time):
         """Convert `time` to frame."""
         seconds = self.time_to_seconds(time)
         return self.seconds_to_frame(seconds)
 
+    def time_to_milliseconds(self, time):
+        """Convert `time` to integer milliseconds."""
+        coefficient = (-1 if time.startswith("-") else 1)
+        time = (time[1:] if time.startswith("-") else time)
+        return coefficient * (int(time[ :2]) * 3600000 +
+                              int(time[3:5]) * 60000 +
+                              int(time[6:8]) * 1000 +
+                              int(time[9: ]))
+
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
         coefficient = (-1 if time.startswith("-") else 1)
@@ -213,6 +304,31 @@ class Calculator:
                                   float(time[6:8]),
                                   float(time[9: ]) / 1000))
 
+    def times_to_frames(self, times):
+        """Convert sequence of `times` to frames."""
+        seconds = self.times_to_seconds(times)
+        return self.seconds_to_frames(seconds)
+
+    def times_to_seconds(self, times):
+        """Convert sequence of `times` to seconds."""
+        seconds = []
+        for time in times:
+            if (len(time) != 12 or
+                time[2] != ":" or
+                time[5] != ":" or
+                time[8] != "."):
+                # Leave negative and irregular times to the slow path.
+                seconds.append(self.time_to_seconds(time))
+                continue
+            # Parse all fields with a single call to int and add
+            # in the same order as time_to_seconds to get equal floats.
+            value = int(time[:2] + time[3:5] + time[6:8] + time[9:])
+            seconds.append((value // 10000000) * 3600 +
+                           (value // 100000 % 100) * 60 +
+                           (value // 1000 % 100) +
+                           (value % 1000) / 1000)
+        return _new_sequence(times, seconds, "d")
+
     def to_frame(self, pos):
         """Convert `pos` to frame."""
         if aeidon.is_time(pos):
@@ -224,6 +340,17 @@ class Calculator:
         raise ValueError("Invalid type for pos: {}"
                          .format(repr(type(pos))))
 
+    def to_milliseconds(self, pos):
+        """Convert `pos` to integer milliseconds."""
+        if aeidon.is_time(pos):
+            return self.time_to_milliseconds(pos)
+        if aeidon.is_frame(pos):
+            return int(round(1000 * pos / self._framerate, 0))
+        if aeidon.is_seconds(pos):
+            return int(round(1000 * pos, 0))
+        raise ValueError("Invalid type for pos: {}"
+                         .format(repr(type(pos))))
+
     def to_seconds(self, pos):
         """Convert `pos` to seconds."""
         if aeidon.is_time(pos):
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Command-line interface for operating on subtitle files."""
+
+import aeidon
+import argparse
+import os
+import sys
+import time
+
+from aeidon.i18n import _
+
+
+def _add_break_parser(subparsers):
+    """Add parser for the break-lines command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "break-lines",
+        help=_("break lines to fit length and count"))
+
+    _add_common_arguments(parser)
+    _add_pattern_arguments(parser)
+    parser.add_argument(
+        "--max-length",
+        action="store",
+        metavar=_("LENGTH"),
+        dest="max_length",
+        default=44,
+        type=int,
+        help=_("set the maximum line length in characters"))
+
+    parser.add_argument(
+        "--max-lines",
+        action="store",
+        metavar=_("LINES"),
+        dest="max_lines",
+        default=2,
+        type=int,
+        help=_("set the maximum amount of lines"))
+
+    parser.set_defaults(function=_break_lines)
+
+def _add_common_arguments(parser):
+    """Add arguments shared by all commands to `parser`."""
+    parser.add_argument(
+        "files",
+        metavar=_("FILE"),
+        nargs="+",
+        help=_("subtitle files to process, '-' to read paths from stdin"))
+
+    parser.add_argument(
+        "-e", "--encoding",
+        action="store",
+        metavar=_("ENCODING"),
+        dest="encoding",
+        default=None,
+        help=_("set the character encoding used to open files"))
+
+    parser.add_argument(
+        "-r", "--framerate",
+        action="store",
+        metavar=_("FRAMERATE"),
+        dest="framerate",
+        default=None,
+        type=_get_framerate,
+        help=_("set the framerate used for frame-based formats"))
+
+    parser.add_argument(
+        "-o", "--output-directory",
+        action="store",
+        metavar=_("DIRECTORY"),
+        dest="directory",
+        default=None,
+        help=_("write files to directory instead of in place"))
+
+def _add_convert_parser(subparsers):
+    """Add parser for the convert command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "convert",
+        help=_("convert files to another format"))
+
+    _add_common_arguments(parser)
+    parser.add_argument(
+        "-f", "--format",
+        action="store",
+        metavar=_("FORMAT"),
+        dest="format",
+        required=True,
+        type=_get_format,
+        help=_("format to convert to: {}").format(
+            ", ".join(x.name.lower() for x in aeidon.formats)))
+
+    parser.add_argument(
+        "-n", "--newline",
+        action="store",
+        metavar=_("NEWLINE"),
+        dest="newline",
+        default=None,
+        type=_get_newline,
+        help=_("set the newline type: mac, unix or windows"))
+
+    parser.add_argument(
+        "-j", "--jobs",
+        action="store",
+        metavar=_("JOBS"),
+        dest="workers",
+        default=None,
+        type=int,
+        help=_("set the amount of worker processes"))
+
+    parser.set_defaults(function=_convert)
+
+def _add_correct_parser(subparsers):
+    """Add parser for the correct-errors command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "correct-errors",
+        help=_("correct common human and OCR errors"))
+
+    _add_common_arguments(parser)
+    _add_pattern_arguments(parser)
+    parser.add_argument(
+        "-j", "--jobs",
+        action="store",
+        metavar=_("JOBS"),
+        dest="workers",
+        default=1,
+        type=int,
+        help=_("set the amount of worker processes per file"))
+
+    parser.set_defaults(function=_correct_common_errors)
+
+def _add_durations_parser(subparsers):
+    """Add parser for the adjust-durations command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "adjust-durations",
+        help=_("lengthen or shorten durations"))
+
+    _add_common_arguments(parser)
+    parser.add_argument(
+        "--speed",
+        action="store",
+        metavar=_("CHARS"),
+        dest="speed",
+        default=None,
+        type=float,
+        help=_("set the reading speed in characters per second"))
+
+    parser.add_argument(
+        "--lengthen",
+        action="store_true",
+        dest="lengthen",
+        default=False,
+        help=_("lengthen durations to match reading speed"))
+
+    parser.add_argument(
+        "--shorten",
+        action="store_true",
+        dest="shorten",
+        default=False,
+        help=_("shorten durations to match reading speed"))
+
+    parser.add_argument(
+        "--minimum",
+        action="store",
+        metavar=_("SECONDS"),
+        dest="minimum",
+        default=None,
+        type=float,
+        help=_("set the shortest allowed duration"))
+
+    parser.add_argument(
+        "--maximum",
+        action="store",
+        metavar=_("SECONDS"),
+        dest="maximum",
+        default=None,
+        type=float,
+        help=_("set the longest allowed duration"))
+
+    parser.add_argument(
+        "--gap",
+        action="store",
+        metavar=_("SECONDS"),
+        dest="gap",
+        default=None,
+        type=float,
+        help=_("set the gap to leave between subtitles"))
+
+    parser.set_defaults(function=_adjust_durations)
+
+def _add_framerate_parser(subparsers):
+    """Add parser for the convert-framerate command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "convert-framerate",
+        help=_("convert positions from one framerate to another"))
+
+    _add_common_arguments(parser)
+    parser.add_argument(
+        "--input",
+        action="store",
+        metavar=_("FRAMERATE"),
+        dest="framerate_in",
+        required=True,
+        type=_get_framerate,
+        help=_("set the framerate to convert from"))
+
+    parser.add_argument(
+        "--output",
+        action="store",
+        metavar=_("FRAMERATE"),
+        dest="framerate_out",
+        required=True,
+        type=_get_framerate,
+        help=_("set the framerate to convert to"))
+
+    parser.set_defaults(function=_convert_framerate)
+
+def _add_hearing_impaired_parser(subparsers):
+    """Add parser for the remove-hearing-impaired command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "remove-hearing-impaired",
+        help=_("remove hearing impaired parts"))
+
+    _add_common_arguments(parser)
+    _add_pattern_arguments(parser)
+    parser.add_argument(
+        "-j", "--jobs",
+        action="store",
+        metavar=_("JOBS"),
+        dest="workers",
+        default=1,
+        type=int,
+        help=_("set the amount of worker processes per file"))
+
+    parser.set_defaults(function=_remove_hearing_impaired)
+
+def _add_pattern_arguments(parser):
+    """Add arguments to select patterns to `parser`."""
+    parser.add_argument(
+        "--script",
+        action="store",
+        metavar=_("SCRIPT"),
+        dest="script",
+        default="Latn",
+        help=_("set the ISO 15924 script code of patterns to use"))
+
+    parser.add_argument(
+        "--language",
+        action="store",
+        metavar=_("LANGUAGE"),
+        dest="language",
+        default=None,
+        help=_("set the ISO 639 language code of patterns to use"))
+
+    parser.add_argument(
+        "--country",
+        action="store",
+        metavar=_("COUNTRY"),
+        dest="country",
+        default=None,
+        help=_("set the ISO 3166 country code of patterns to use"))
+
+def _add_shift_parser(subparsers):
+    """Add parser for the shift-positions command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "shift-positions",
+        help=_("make subtitles appear earlier or later"))
+
+    _add_common_arguments(parser)
+    parser.add_argument(
+        "--amount",
+        action="store",
+        metavar=_("POSITION"),
+        dest="amount",
+        required=True,
+        type=_get_position,
+        help=_("set the time, frames or seconds to shift by"))
+
+    parser.set_defaults(function=_shift_positions)
+
+def _add_transform_parser(subparsers):
+    """Add parser for the transform-positions command to `subparsers`."""
+    parser = subparsers.add_parser(
+        "transform-positions",
+        help=_("correct positions by a linear two-point correction"))
+
+    _add_common_arguments(parser)
+    for name in ("first", "second"):
+        parser.add_argument(
+            "--{}".format(name),
+            action="store",
+            nargs=2,
+            metavar=(_("NUMBER"), _("POSITION")),
+            dest=name,
+            required=True,
+            help=_("set the number of a subtitle and its correct position"))
+
+    parser.set_defaults(function=_transform_positions)
+
+def _adjust_durations(opts):
+    """Adjust durations in files and return exit status."""
+    return _process(opts, lambda project: project.adjust_durations(
+        speed=opts.speed,
+        lengthen=opts.lengthen,
+        shorten=opts.shorten,
+        minimum=opts.minimum,
+        maximum=opts.maximum,
+        gap=opts.gap))
+
+def _break_lines(opts):
+    """Break lines in files and return exit status."""
+    patterns = _get_patterns(opts, "line-break")
+    return _process(opts, lambda project: project.break_lines(
+        indices=None,
+        doc=aeidon.documents.MAIN,
+        patterns=patterns,
+        length_func=len,
+        max_length=opts.max_length,
+        max_lines=opts.max_lines))
+
+def _convert(opts):
+    """Convert files and return exit status."""
+    converter = aeidon.BatchConverter(format=opts.format,
+                                      encoding=opts.encoding,
+                                      newline=opts.newline,
+                                      framerate=opts.framerate,
+                                      workers=opts.workers)
+
+    start = time.time()
+    results = converter.convert(_get_paths(opts.files), opts.directory)
+    print(converter.get_summary(results))
+    print(_("Finished in {:.2f} s").format(time.time() - start))
+    return int(any(x.error is not None for x in results))
+
+def _convert_framerate(opts):
+    """Convert framerate of files and return exit status."""
+    return _process(opts, lambda project: project.convert_framerate(
+        None, opts.framerate_in, opts.framerate_out))
+
+def _correct_common_errors(opts):
+    """Correct common errors in files and return exit status."""
+    patterns = _get_patterns(opts, "common-error")
+    return _process(opts, lambda project: project.correct_common_errors(
+        None, aeidon.documents.MAIN, patterns, opts.workers))
+
+def _get_format(name):
+    """Return format matching `name`."""
+    for format in aeidon.formats:
+        if format.name.lower() == name.lower():
+            return format
+    raise argparse.ArgumentTypeError(
+        "Invalid format: {}".format(repr(name)))
+
+def _get_framerate(value):
+    """Return framerate matching `value`."""
+    for framerate in aeidon.framerates:
+        if "{:.3f}".format(framerate.value) == value:
+            return framerate
+    raise argparse.ArgumentTypeError(
+        "Invalid framerate: {}".format(repr(value)))
+
+def _get_newline(name):
+    """Return newline type matching `name`."""
+    for newline in aeidon.newlines:
+        if newline.name.lower() == name.lower():
+            return newline
+    raise argparse.ArgumentTypeError(
+        "Invalid newline: {}".format(repr(name)))
+
+def _get_paths(paths):
+    """Return paths with '-' replaced by paths read from stdin."""
+    for path in paths:
+        if path != "-":
+            yield path
+            continue
+        for line in sys.stdin:
+            if line.strip():
+                yield line.strip()
+
+def _get_patterns(opts, pattern_type):
+    """Return patterns of `pattern_type` matching codes in `opts`."""
+    manager = aeidon.PatternManager(pattern_type)
+    return manager.get_patterns(opts.script, opts.language, opts.country)
+
+def _get_position(value):
+    """Return position matching `value` as time, frame or seconds."""
+    try:
+        if ":" in value:
+            return aeidon.Calculator().normalize_time(value)
+        if "." in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "Invalid position: {}".format(repr(value)))
+
+def _process(opts, function):
+    """
+    Call `function` with projects of files in `opts` and return exit status.
+
+    Files are processed one at a time, each saved before the next is opened.
+    Errors are printed and processing continued with the next file. A file
+    that would be saved to the same path as an earlier file is an error.
+    """
+    failed = 0
+    targets = set()
+    for path in _get_paths(opts.files):
+        try:
+            target = path
+            if opts.directory is not None:
+                target = os.path.join(opts.directory, os.path.basename(path))
+            key = os.path.normcase(os.path.abspath(target))
+            if key in targets:
+                raise ValueError("Target used by another file: {}"
+                                 .format(repr(target)))
+            targets.add(key)
+            project = aeidon.Project(opts.framerate, mapped=True)
+            project.open_main(path, opts.encoding)
+            function(project)
+            file = project.main_file
+            if opts.directory is not None:
+                file = aeidon.files.new(file.format,
+                                        target,
+                                        file.encoding,
+                                        file.newline)
+
+            project.save_main(file)
+        except Exception as error:
+            failed += 1
+            print("{}: {}: {}".format(path, type(error).__name__, str(error)),
+                  file=sys.stderr)
+
+    return int(failed > 0)
+
+def _remove_hearing_impaired(opts):
+    """Remove hearing impaired parts in files and return exit status."""
+    patterns = _get_patterns(opts, "hearing-impaired")
+    return _process(opts, lambda project: project.remove_hearing_impaired(
+        None, aeidon.documents.MAIN, patterns, opts.workers))
+
+def _shift_positions(opts):
+    """Shift positions in files and return exit status."""
+    return _process(opts, lambda project: project.shift_positions(
+        None, opts.amount))
+
+def _transform_positions(opts):
+    """Transform positions in files and return exit status."""
+    try:
+        p1 = (int(opts.first[0]) - 1, _get_position(opts.first[1]))
+        p2 = (int(opts.second[0]) - 1, _get_position(opts.second[1]))
+    except (ValueError, argparse.ArgumentTypeError) as error:
+        print(str(error), file=sys.stderr)
+        return 2
+    return _process(opts, lambda project: project.transform_positions(
+        None, p1, p2))
+
+def main(args):
+    """Parse `args`, run command and exit."""
+    parser = argparse.ArgumentParser(prog="aeidon")
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="aeidon {}".format(aeidon.__version__))
+
+    subparsers = parser.add_subparsers(metavar=_("COMMAND"))
+    _add_durations_parser(subparsers)
+    _add_break_parser(subparsers)
+    _add_convert_parser(subparsers)
+    _add_framerate_parser(subparsers)
+    _add_correct_parser(subparsers)
+    _add_hearing_impaired_parser(subparsers)
+    _add_shift_parser(subparsers)
+    _add_transform_parser(subparsers)
+    opts = parser.parse_args(args)
+    if not hasattr(opts, "function"):
+        parser.print_usage(sys.stderr)
+        raise SystemExit(2)
+    raise SystemExit(opts.function(opts))
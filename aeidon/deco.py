@@ -22,6 +22,10 @@ import collections
 import functools
 import pickle
 import traceback
+import weakref
+
+_CacheInfo = collections.namedtuple("CacheInfo",
+                                    ("hits", "misses", "limit", "size"))
 
 # Python decorators normally do not preserve the signature of the original
 # function. We, however, absolutely need those function signatures kept to able
@@ -75,32 +79,87 @@ def _is_method(function, args):
     except (IndexError, AttributeError):
         return False
 
+def _get_key(args, kwargs):
+    """Return a hashable cache key for `args` and `kwargs`."""
+    key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+    try:
+        return _get_typed(key)
+    except TypeError:
+        # Fall back on pickling for other arguments, e.g. lists
+        # and objects that could hash by identity, to compare by value.
+        return pickle.dumps(key)
+
+def _get_typed(value):
+    """
+    Return `value` with types included to tell apart e.g. 1 and 1.0.
+
+    Raise :exc:`TypeError` if `value` is not made of simple values.
+    """
+    if type(value) is tuple:
+        return tuple(_get_typed(x) for x in value)
+    if type(value) in (bool, bytes, float, int, str, type(None)):
+        return (type(value), value)
+    raise TypeError("Not a simple value: {}".format(type(value).__name__))
+
 def memoize(limit=100):
     """
     Decorator for functions that cache their return values.
 
-    Use ``None`` for `limit` for a boundless cache.
+    Use ``None`` for `limit` for a boundless cache. The least recently used
+    value is discarded once `limit` is exceeded. Numbers, strings and tuples
+    of them are used as cache keys along with their types, other arguments
+    are pickled. Methods have a separate cache for each instance, discarded
+    along with the instance. The decorated function has ``cache_info`` to
+    return amounts of hits, misses and values cached and ``cache_clear`` to
+    clear all caches.
     """
     # Since 3.2 Python has functools.lru_cache,
     # but it doesn't seem to handle methods gracefully.
     def outer_wrapper(function):
         cache = collections.OrderedDict()
+        caches = {}
+        counts = [0, 0]
+        def get_cache(args):
+            if not _is_method(function, args): return cache, args
+            instance = args[0]
+            key = id(instance)
+            if key in caches:
+                return caches[key][1], args[1:]
+            try:
+                # Caches are removed when their instances
+                # are, before an id can be reused.
+                ref = weakref.ref(instance, lambda x: caches.pop(key, None))
+            except TypeError:
+                # Instance cannot be weakly referenced,
+                # keep values in the common cache by id.
+                return cache, (id(instance),) + args[1:]
+            caches[key] = (ref, collections.OrderedDict())
+            return caches[key][1], args[1:]
         @functools.wraps(function)
         def inner_wrapper(*args, **kwargs):
-            params = (args, kwargs)
-            if _is_method(function, args):
-                # XXX: Is id + hash + repr together unique enough?
-                params = (id(args[0]), hash(args[0]), repr(args[0]),
-                          args[1:], kwargs)
-
-            key = pickle.dumps(params)
-            with aeidon.util.silent(KeyError):
-                return cache[key]
-            cache[key] = function(*args, **kwargs)
+            values, params = get_cache(args)
+            key = _get_key(params, kwargs)
+            try:
+                value = values[key]
+                values.move_to_end(key)
+                counts[0] += 1
+                return value
+            except KeyError:
+                counts[1] += 1
+            value = values[key] = function(*args, **kwargs)
             if limit is not None:
-                while len(cache) > limit:
-                    cache.popitem(last=False)
-            return cache[key]
+                while len(values) > limit:
+                    values.popitem(last=False)
+            return value
+        def cache_clear():
+            cache.clear()
+            caches.clear()
+            counts[:] = [0, 0]
+        def cache_info():
+            size = len(cache) + sum(len(x[1]) for x in caches.values())
+            return _CacheInfo(counts[0], counts[1], limit, size)
+        inner_wrapper.cache_clear = cache_clear
+        inner_wrapper.cache_info = cache_info
         inner_wrapper.original = function
         return inner_wrapper
     if aeidon.RUNNING_SPHINX:
@@ -189,6 +248,7 @@ def revertable(function):
             value = function(*args, **kwargs)
         finally:
             project.unblock(register.signal)
+        project.coalesce_actions(register)
         project.cut_reversion_stacks()
         if (project.main_changed != main_changed or
             project.tran_changed != tran_changed):
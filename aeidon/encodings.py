@@ -171,44 +171,29 @@ def detect(path):
 
     Raise :exc:`IOError` if reading fails.
     """
-    bom_encoding = detect_bom(path)
-    if bom_encoding is not None:
-        return bom_encoding
-    from chardet import universaldetector
-    detector = universaldetector.UniversalDetector()
-    with open(path, "rb") as f:
-        detector.reset()
-        for line in f:
-            detector.feed(line)
-            if detector.done: break
-    detector.close()
-    code = detector.result["encoding"]
-    if code is None: return None
-    try:
-        # chardet returns what seem to be IANA names. They need to be
-        # translated to their Python equivalents. Some of the encodings
-        # returned by chardet are not supported by Python.
-        return translate_code(code)
-    except ValueError:
-        return None
+    return aeidon.Sniffer(path).detect_encoding()
 
 def detect_bom(path):
     """Return corresponding encoding if BOM found, else ``None``."""
     with open(path, "rb") as f:
-        line = f.readline()
-    if (line.startswith(codecs.BOM_UTF32_BE) and
+        # The longest BOM, that of UTF-32, is four bytes.
+        return find_bom(f.read(4))
+
+def find_bom(data):
+    """Return encoding corresponding to BOM at start of `data` or ``None``."""
+    if (data.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
-    if (line.startswith(codecs.BOM_UTF32_LE) and
+    if (data.startswith(codecs.BOM_UTF32_LE) and
         is_valid_code("utf_32_le")):
         return "utf_32_le"
-    if (line.startswith(codecs.BOM_UTF8) and
+    if (data.startswith(codecs.BOM_UTF8) and
         is_valid_code("utf_8_sig")):
         return "utf_8_sig"
-    if (line.startswith(codecs.BOM_UTF16_BE) and
+    if (data.startswith(codecs.BOM_UTF16_BE) and
         is_valid_code("utf_16_be")):
         return "utf_16_be"
-    if (line.startswith(codecs.BOM_UTF16_LE) and
+    if (data.startswith(codecs.BOM_UTF16_LE) and
         is_valid_code("utf_16_le")):
         return "utf_16_le"
     return None
@@ -19,8 +19,10 @@
 
 import aeidon
 import codecs
+import contextlib
+import io
+import mmap
 import os
-import re
 
 __all__ = ("SubtitleFile",)
 
@@ -32,6 +34,8 @@ class SubtitleFile:
 
     :cvar format: :attr:`aeidon.formats` item corresponding to file format
     :cvar mode: :attr:`aeidon.modes` item corresponding to native positions
+    :ivar bytes_read: Amount of bytes read from file, including sniffing
+    :ivar data: Contents of file as bytes, if already read, or ``None``
     :ivar encoding: Character encoding used to read and write file
     :ivar has_utf_16_bom: True if BOM found for UTF-16-BE or UTF-16-LE
     :ivar header: String of metadata at the top of the file
@@ -42,12 +46,17 @@ class SubtitleFile:
     template header read upon instantiation of the class, from either
     ``aeidon.DATA_DIR/headers`` or ``aeidon.DATA_HOME_DIR/headers``. If the
     read file contains a header, it will replace the template.
+
+    If :attr:`data` is set, e.g. from :class:`aeidon.Sniffer`, it is used and
+    cleared by the next read instead of reading the file again.
     """
     format = aeidon.formats.NONE
     mode = aeidon.modes.NONE
 
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubtitleFile` instance."""
+        self.bytes_read = 0
+        self.data = None
         self.encoding = encoding
         self.has_utf_16_bom = False
         self.header = (aeidon.util.get_template_header(self.format)
@@ -66,6 +75,128 @@ class SubtitleFile:
         """Return a new subtitle instance with proper properties."""
         return aeidon.Subtitle(self.mode)
 
+    def index(self):
+        """
+        Read file and return byte offsets and start positions of subtitles.
+
+        Return a tuple of two arrays, the first of byte offsets of subtitles
+        with the file size appended and the second of their start positions
+        as native integers, or ``None`` if format or encoding of the file
+        does not allow subtitles to be read separately.
+        Raise :exc:`IOError` if reading fails.
+        """
+        return None
+
+    def _iter_lines(self):
+        """
+        Read file and yield lines one by one.
+
+        All newlines are stripped.
+        Blank lines at the beginning are skipped, but not those at the end.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        if self.encoding.startswith("utf_16"):
+            # Broken UTF-16 linebreaks (see _read_lines) can only be
+            # detected by looking at all lines, so these cannot be streamed.
+            yield from self._read_lines()
+            return
+        yield from self._iter_lines_raw()
+
+    def _iter_lines_raw(self):
+        """
+        Read file and yield lines one by one.
+
+        File is read only once, with newline type and BOM detected from the
+        first line. All newlines are stripped. Blank lines at the beginning
+        are skipped, but not those at the end.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        data, self.data = self.data, None
+        raw = (open(self.path, "rb") if data is None else io.BytesIO(data))
+        with io.TextIOWrapper(raw, encoding=self.encoding, newline="") as f:
+            try:
+                line = self._strip_bom(f.readline())
+                for newline in (aeidon.newlines.WINDOWS,
+                                aeidon.newlines.UNIX,
+                                aeidon.newlines.MAC):
+                    if line.endswith(newline.value):
+                        self.newline = newline
+                        break
+                while line and not line.strip():
+                    line = f.readline()
+                if not line: return
+                yield line.rstrip("\r\n")
+                for line in f:
+                    yield line.rstrip("\r\n")
+            finally:
+                if data is None:
+                    self.bytes_read += raw.tell()
+
+    def iter_read(self):
+        """
+        Read file and yield subtitles one by one.
+
+        Formats that can be parsed incrementally override this to avoid ever
+        having the whole file in memory, others fall back to :meth:`read`.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        yield from self.read()
+
+    @contextlib.contextmanager
+    def _open_mapped(self):
+        """
+        Map file to memory and yield byte offset of data and mapped buffer.
+
+        The offset skips a possible UTF-8 BOM. ``None`` is yielded instead of
+        the buffer if the file is empty, its encoding is not ASCII compatible
+        or it uses Mac newlines, since such files cannot be scanned line by
+        line with byte regular expressions. Newline type is detected from the
+        first line.
+        Raise :exc:`IOError` if reading fails.
+        """
+        probe = "0123456789:;,.-> []{}|\r\n"
+        try:
+            # UTF-8-SIG is ASCII compatible except for the added BOM.
+            encoded = probe.encode(self.encoding.replace("_sig", ""))
+        except (LookupError, UnicodeError):
+            encoded = None
+        if encoded != probe.encode("ascii"):
+            yield 0, None
+            return
+        data, self.data = self.data, None
+        with contextlib.ExitStack() as stack:
+            buffer = data
+            if buffer is None:
+                f = stack.enter_context(open(self.path, "rb"))
+                with contextlib.suppress(ValueError):
+                    # Empty files cannot be mapped.
+                    buffer = stack.enter_context(mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ))
+                    self.bytes_read += len(buffer)
+            if not buffer:
+                yield 0, None
+                return
+            offset = 0
+            if (self.encoding.startswith("utf_8") and
+                buffer[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8):
+                self.encoding = "utf_8_sig"
+                offset = len(codecs.BOM_UTF8)
+            end = buffer.find(b"\n", offset)
+            line = buffer[offset:(end + 1 if end >= 0 else len(buffer))]
+            if b"\r" in line.rstrip(b"\r\n"):
+                # Leave data for the fallback reader to use.
+                self.data = data
+                yield offset, None
+                return
+            self.newline = (aeidon.newlines.WINDOWS
+                            if line.endswith(b"\r\n") else
+                            aeidon.newlines.UNIX)
+
+            yield offset, buffer
+
     def read(self):
         """
         Read file and return subtitles.
@@ -75,6 +206,16 @@ class SubtitleFile:
         """
         raise NotImplementedError
 
+    def read_cue(self, start, end):
+        """
+        Read and return subtitle between byte offsets `start` and `end`.
+
+        Offsets are those returned by :meth:`index`.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        raise NotImplementedError
+
     def _read_lines(self):
         """
         Read file to a list of lines.
@@ -85,39 +226,50 @@ class SubtitleFile:
         Raise :exc:`UnicodeError` if decoding fails.
         Return a list of lines read.
         """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
-        if newline is not None:
-            self.newline = newline
+        lines = list(self._iter_lines_raw())
+        while lines and not lines[-1].strip():
+            lines.pop(-1)
+        if self.encoding.startswith("utf_16"):
+            # Handle erroneous (?) UTF-16 encoded subtitles that use
+            # NULL-character filled linebreaks '\x00\r\x00\n', which
+            # readlines interprets as two separate linebreaks.
+            if not any(lines[i] for i in range(1, len(lines), 2)):
+                lines = [lines[i] for i in range(0, len(lines), 2)]
+        return lines
+
+    def read_mapped(self):
+        """
+        Read file mapped to memory and return subtitles.
+
+        Formats that can be scanned with byte regular expressions override
+        this to decode only the parts of the file kept, others fall back to
+        :meth:`read`. This is mostly useful for large read-only jobs.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return self.read()
+
+    def _strip_bom(self, line):
+        """Return first `line` of file with possible BOM removed."""
         if self.encoding == "utf_8":
             bom = str(codecs.BOM_UTF8, "utf_8")
-            if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
-                # UTF-8-SIG encoding, which automatically strips the BOM when
-                # reading and adds it when writing.
+            if line.startswith(bom):
+                # If a UTF-8 BOM (a.k.a. signature) is found, switch to
+                # UTF-8-SIG encoding, which automatically strips the BOM
+                # when reading and adds it when writing. Decoding the rest
+                # of the file works the same with both.
                 self.encoding = "utf_8_sig"
-                return SubtitleFile._read_lines(self)
+                return line[len(bom):]
         if self.encoding.startswith("utf_16"):
             # Python automatically strips the UTF-16 BOM when reading, but only
             # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
             # kept at the beginning of the first line. It is read correctly, so
             # it should FE FF for both BE and LE.
             bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
-            if lines and lines[0].startswith(bom):
+            if line.startswith(bom):
                 self.has_utf_16_bom = True
-                lines[0] = lines[0].replace(bom, "")
-            # Handle erroneous (?) UTF-16 encoded subtitles that use
-            # NULL-character filled linebreaks '\x00\r\x00\n', which
-            # readlines interprets as two separate linebreaks.
-            if not any(lines[i] for i in range(1, len(lines), 2)):
-                lines = [lines[i] for i in range(0, len(lines), 2)]
-        return lines
+                return line[len(bom):]
+        return line
 
     def write(self, subtitles, doc):
         """
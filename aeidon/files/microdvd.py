@@ -30,26 +30,61 @@ class MicroDVD(aeidon.SubtitleFile):
     format = aeidon.formats.MICRODVD
     mode = aeidon.modes.FRAME
     _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
+    # Match at line starts, including right after a UTF-8 BOM,
+    # since a search from after it does not count as a line start.
+    _re_line_bytes = re.compile(
+        rb"(?:^|(?<=\A\xef\xbb\xbf))"
+        rb"(?:\{(-?\d+)\}\{(-?\d+)\}|(\{DEFAULT\}))([^\r\n]*)",
+        re.MULTILINE)
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one by one.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is not None:
                 subtitle = self._get_subtitle()
                 subtitle.start_frame = int(match.group(1))
                 subtitle.end_frame = int(match.group(2))
                 subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
+                yield subtitle
             elif line.startswith("{DEFAULT}"):
                 self.header = line
-        return subtitles
+
+    def read(self):
+        """
+        Read file and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self.iter_read())
+
+    def read_mapped(self):
+        """
+        Read file mapped to memory and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        with self._open_mapped() as (offset, buffer):
+            if buffer is None:
+                return self.read()
+            subtitles = []
+            for match in self._re_line_bytes.finditer(buffer, offset):
+                text = match.group(4).decode(self.encoding)
+                if match.group(3) is not None:
+                    self.header = "{DEFAULT}" + text
+                    continue
+                subtitle = self._get_subtitle()
+                subtitle._set_native(int(match.group(1)), int(match.group(2)))
+                subtitle.main_text = text.replace("|", "\n")
+                subtitles.append(subtitle)
+            return subtitles
 
     def write_to_file(self, subtitles, doc, f):
         """
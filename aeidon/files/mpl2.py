@@ -30,24 +30,58 @@ class MPL2(aeidon.SubtitleFile):
     format = aeidon.formats.MPL2
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*?)$")
+    # Match at line starts, including right after a UTF-8 BOM,
+    # since a search from after it does not count as a line start.
+    _re_line_bytes = re.compile((
+            rb"(?:^|(?<=\A\xef\xbb\xbf))"
+            rb"\[(-?\d+)\]\[(-?\d+)\]([^\r\n]*)"),
+            re.MULTILINE)
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one by one.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_seconds = float(match.group(1)) / 10
             subtitle.end_seconds = float(match.group(2)) / 10
             subtitle.main_text = match.group(3).replace("|", "\n")
-            subtitles.append(subtitle)
-        return subtitles
+            yield subtitle
+
+    def read(self):
+        """
+        Read file and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self.iter_read())
+
+    def read_mapped(self):
+        """
+        Read file mapped to memory and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        with self._open_mapped() as (offset, buffer):
+            if buffer is None:
+                return self.read()
+            subtitles = []
+            for match in self._re_line_bytes.finditer(buffer, offset):
+                subtitle = self._get_subtitle()
+                # Positions are in tenths of a second.
+                subtitle._set_native(int(match.group(1)) * 100,
+                                     int(match.group(2)) * 100)
+                text = match.group(3).decode(self.encoding)
+                subtitle.main_text = text.replace("|", "\n")
+                subtitles.append(subtitle)
+            return subtitles
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -18,6 +18,8 @@
 """SubRip file."""
 
 import aeidon
+import array
+import io
 import re
 
 __all__ = ("SubRip",)
@@ -39,21 +41,84 @@ class SubRip(aeidon.SubtitleFile):
             r" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
             r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?\s*$"))
 
-    def read(self):
+    _re_newline = re.compile(r"\r\n|\r|\n")
+
+    # Match at line starts, including right after a UTF-8 BOM,
+    # since a search from after it does not count as a line start.
+    _re_time_line_bytes = re.compile((
+            rb"(?:^|(?<=\A\xef\xbb\xbf))"
+            rb"(-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3}) -->"
+            rb" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
+            rb"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?([^\r\n]*)\r*$"),
+            re.MULTILINE)
+
+    def _bytes_to_milliseconds(self, time):
+        """Convert time line field `time` to milliseconds."""
+        hours, minutes, seconds = time.lstrip(b"-").split(b":")
+        seconds, fraction = seconds.split(b",")
+        value = (int(hours) * 3600000 +
+                 int(minutes) * 60000 +
+                 int(seconds) * 1000 +
+                 int(fraction.ljust(3, b"0")))
+        return -value if time.startswith(b"-") else value
+
+    def index(self):
         """
-        Read file and return subtitles.
+        Read file and return byte offsets and start positions of subtitles.
+
+        Return a tuple of two arrays, the first of byte offsets of subtitles
+        with the file size appended and the second of their start positions
+        as native integers, or ``None`` if format or encoding of the file
+        does not allow subtitles to be read separately.
+        Raise :exc:`IOError` if reading fails.
+        """
+        with self._open_mapped() as (offset, buffer):
+            if buffer is None: return None
+            offsets = array.array("q")
+            starts = array.array("q")
+            for match in self._iter_time_lines(buffer, offset):
+                offsets.append(match.start())
+                starts.append(self._bytes_to_milliseconds(match.group(1)))
+            offsets.append(len(buffer))
+            return offsets, starts
+
+    def _iter_time_lines(self, buffer, offset):
+        """Yield matches of time lines in `buffer` starting at `offset`."""
+        for match in self._re_time_line_bytes.finditer(buffer, offset):
+            # Allow the same trailing whitespace as when reading text,
+            # which includes non-ASCII whitespace in the file's encoding.
+            tail = match.group(8)
+            if tail and not tail.decode(self.encoding).isspace(): continue
+            yield match
+
+    def iter_read(self):
+        """
+        Read file and yield subtitles one by one.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        yield from self._iter_subtitles(self._iter_lines())
+
+    def _iter_subtitles(self, source):
+        """Parse lines from `source` and yield subtitles one by one."""
+        subtitle = None
+        lines = []
+        for line in source:
             match = self._re_time_line.match(line)
             if match is None:
-                if subtitles[-1].main_text:
-                    subtitles[-1].main_text += "\n"
-                subtitles[-1].main_text += line
+                # Keep lines until the next time line, which tells
+                # whether the last of these are the number and blank
+                # line of the next subtitle or part of this one's text.
+                lines.append(line)
                 continue
+            if lines and lines[-1].strip().isdigit():
+                lines.pop(-1)
+                if lines and not lines[-1].strip():
+                    lines.pop(-1)
+            if subtitle is not None:
+                self._set_text(subtitle, lines)
+                yield subtitle
             subtitle = self._get_subtitle()
             subtitle.start_time = subtitle.calc.normalize_time(match.group(1))
             subtitle.end_time = subtitle.calc.normalize_time(match.group(2))
@@ -62,22 +127,95 @@ class SubRip(aeidon.SubtitleFile):
                 subtitle.subrip.x2 = int(match.group(5))
                 subtitle.subrip.y1 = int(match.group(6))
                 subtitle.subrip.y2 = int(match.group(7))
-            subtitles.append(subtitle)
-        return subtitles
-
-    def _read_lines(self):
-        """Read file to a unicoded list of lines."""
-        lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
-            lines.append(line)
-            match = self._re_time_line.match(line)
-            if match is None: continue
-            # Remove numbers and blank lines above them.
-            if lines[-2].strip().isdigit():
-                if not lines[-3].strip():
-                    lines.pop(-3)
-                lines.pop(-2)
-        return lines
+            lines = []
+        while lines and not lines[-1].strip():
+            lines.pop(-1)
+        if subtitle is not None:
+            self._set_text(subtitle, lines)
+            yield subtitle
+
+    def read(self):
+        """
+        Read file and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self.iter_read())
+
+    def read_cue(self, start, end):
+        """
+        Read and return subtitle between byte offsets `start` and `end`.
+
+        Offsets are those returned by :meth:`index`.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+            # Include the time line of the next subtitle to be able to tell
+            # its number from text the same way as when reading all at once.
+            data += f.readline()
+        self.bytes_read += len(data)
+        text = data.decode(self.encoding)
+        lines = (x.rstrip("\r\n") for x in io.StringIO(text, newline=""))
+        return next(self._iter_subtitles(lines))
+
+    def read_mapped(self):
+        """
+        Read file mapped to memory and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        with self._open_mapped() as (offset, buffer):
+            if buffer is None:
+                return self.read()
+            subtitles = []
+            matches = self._iter_time_lines(buffer, offset)
+            match = next(matches, None)
+            while match is not None:
+                subtitle = self._get_subtitle()
+                subtitle._set_native(
+                    self._bytes_to_milliseconds(match.group(1)),
+                    self._bytes_to_milliseconds(match.group(2)))
+                if match.group(3) is not None:
+                    subtitle.subrip.x1 = int(match.group(4))
+                    subtitle.subrip.x2 = int(match.group(5))
+                    subtitle.subrip.y1 = int(match.group(6))
+                    subtitle.subrip.y2 = int(match.group(7))
+                next_match = next(matches, None)
+                end = (len(buffer) if next_match is None else
+                       next_match.start())
+                text = buffer[match.end():end].decode(self.encoding)
+                # Skip the newline of the time line.
+                lines = self._re_newline.split(text)[1:]
+                if next_match is not None:
+                    # Skip the newline before the next time line as well
+                    # as the number and blank line of the next subtitle.
+                    lines.pop(-1)
+                    if lines and lines[-1].strip().isdigit():
+                        lines.pop(-1)
+                        if lines and not lines[-1].strip():
+                            lines.pop(-1)
+                else: # Last subtitle
+                    while lines and not lines[-1].strip():
+                        lines.pop(-1)
+                self._set_text(subtitle, lines)
+                subtitles.append(subtitle)
+                match = next_match
+            return subtitles
+
+    def _set_text(self, subtitle, lines):
+        """Set main text of `subtitle` from `lines`."""
+        # Leading blank lines are dropped, but blank
+        # lines in the middle and at the end are kept.
+        text = ""
+        for line in lines:
+            if text: text += "\n"
+            text += line
+        subtitle.main_text = text
 
     def write_to_file(self, subtitles, doc, f):
         """
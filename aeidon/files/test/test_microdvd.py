@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import codecs
 
 
 class TestMicroDVD(aeidon.TestCase):
@@ -27,9 +28,26 @@ class TestMicroDVD(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_read(self):
+        subtitles = list(self.file.iter_read())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
+    def test_read_mapped(self):
+        assert self.file.read_mapped() == self.file.read()
+
+    def test_read_mapped__bom(self):
+        with open(self.file.path, "rb") as f:
+            text = f.read()
+        with open(self.file.path, "wb") as f:
+            f.write(codecs.BOM_UTF8 + text)
+        path = self.file.path
+        subtitles = aeidon.files.new(self.format, path, "utf_8").read()
+        file = aeidon.files.new(self.format, path, "utf_8")
+        assert file.read_mapped() == subtitles
+
     def test_write(self):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
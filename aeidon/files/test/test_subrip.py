@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import codecs
 
 
 class TestSubRip(aeidon.TestCase):
@@ -27,9 +28,54 @@ class TestSubRip(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_index(self):
+        offsets, starts = self.file.index()
+        assert len(offsets) == len(starts) + 1
+        assert len(starts) == len(self.file.read())
+
+    def test_iter_read(self):
+        subtitles = list(self.file.iter_read())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
+    def test_read_cue(self):
+        offsets, starts = self.file.index()
+        subtitles = self.file.read()
+        for i in range(len(starts)):
+            subtitle = self.file.read_cue(offsets[i], offsets[i+1])
+            assert subtitle == subtitles[i]
+
+    def test_read_mapped(self):
+        assert self.file.read_mapped() == self.file.read()
+
+    def test_read_mapped__bom(self):
+        with open(self.file.path, "rb") as f:
+            # Drop the number to have a time line right after the BOM.
+            text = f.read().split(b"\n", 1)[1]
+        with open(self.file.path, "wb") as f:
+            f.write(codecs.BOM_UTF8 + text)
+        path = self.file.path
+        subtitles = aeidon.files.new(self.format, path, "utf_8").read()
+        file = aeidon.files.new(self.format, path, "utf_8")
+        assert len(file.index()[1]) == len(subtitles)
+        file = aeidon.files.new(self.format, path, "utf_8")
+        assert file.read_mapped() == subtitles
+
+    def test_read_mapped__whitespace(self):
+        with open(self.file.path, "w", encoding="utf_8") as f:
+            f.write("1\n00:00:01,000 --> 00:00:02,000\u00a0\nx\n\n")
+            f.write("2\n00:00:03,000 --> 00:00:04,000 \t\r\ny\n\n")
+            f.write("3\n00:00:05,000 --> 00:00:06,000 z\nz\n")
+        path = self.file.path
+        subtitles = aeidon.files.new(self.format, path, "utf_8").read()
+        assert len(subtitles) == 2
+        file = aeidon.files.new(self.format, path, "utf_8")
+        assert len(file.index()[1]) == len(subtitles)
+        file = aeidon.files.new(self.format, path, "utf_8")
+        assert file.read_mapped() == subtitles
+
     def test_write(self):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
@@ -27,6 +27,10 @@ class TestTMPlayerOneDigitHour(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_iter_read(self):
+        subtitles = list(self.file.iter_read())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
@@ -43,15 +43,18 @@ class TMPlayer(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.two_digit_hour = other.two_digit_hour
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one by one.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        # End positions are taken from the start positions of following
+        # subtitles, so each subtitle is yielded only once the next is read.
+        previous = None
+        for line in self._iter_lines():
+            subtitle = None
             match = self._re_one_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
@@ -62,22 +65,31 @@ class TMPlayer(aeidon.SubtitleFile):
                     time = time[1:]
                 time = sign + "0" + time
                 subtitle.start_time = time
-                subtitles[-1].end_time = time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
                 self.two_digit_hour = False
             match = self._re_two_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
                 subtitle = self._get_subtitle()
                 subtitle.start_time = line[:i-1] + ".000"
-                subtitles[-1].end_time = subtitle.start_time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
                 self.two_digit_hour = True
-        subtitles.pop(0)
-        subtitles[-1].duration_seconds = 5
-        return subtitles
+            if subtitle is None: continue
+            if previous is not None:
+                previous.end_time = subtitle.start_time
+                yield previous
+            previous = subtitle
+        previous.duration_seconds = 5
+        yield previous
+
+    def read(self):
+        """
+        Read file and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self.iter_read())
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -17,6 +17,7 @@
 
 """String and regular expression finder and replacer."""
 
+import bisect
 import re
 
 __all__ = ("Finder",)
@@ -30,6 +31,7 @@ class Finder:
     :ivar ignore_case: ``True`` to ignore case when finding matches
     :ivar match: Regular expression object for the latest match of pattern
     :ivar match_span: Tuple of start and end position for match
+    :ivar _matches: Tuple of text, pattern and its matches, starts and ends
     :ivar pattern: String or regular expression object to find
     :ivar pos: Current offset from the beginning of the text
     :ivar replacement: Plain- or regular expression replacement string
@@ -41,11 +43,46 @@ class Finder:
         self.ignore_case = False
         self.match = None
         self.match_span = None
+        self._matches = None
         self.pattern = None
         self.pos = None
         self.replacement = None
         self.text = None
 
+    def _find_all(self):
+        """Return a list of spans of all matches of a string pattern."""
+        text = self.text
+        pattern = self.pattern
+        if self.ignore_case:
+            text = text.lower()
+            pattern = pattern.lower()
+        spans = []
+        index = text.find(pattern)
+        while index >= 0:
+            spans.append((index, index + len(pattern)))
+            index = text.find(pattern, index + len(pattern))
+        return spans
+
+    def _get_matches(self, build=True):
+        """
+        Return lists of matches, starts and ends of a regular expression.
+
+        Matches are cached for the current text and pattern. If `build` is
+        ``False``, return ``None`` instead of finding matches not cached.
+        """
+        if (self._matches is None or
+            self._matches[0] != self.text or
+            self._matches[1] != self.pattern):
+            if not build: return None
+            matches = list(self.pattern.finditer(self.text))
+            self._matches = (self.text,
+                             self.pattern,
+                             matches,
+                             [x.start() for x in matches],
+                             [x.end() for x in matches])
+
+        return self._matches[2:]
+
     def next(self):
         """
         Find the next match of pattern.
@@ -68,7 +105,7 @@ class Finder:
                 raise StopIteration
             self.match_span = (index, index + len(pattern))
         else: # Regular expression
-            match = self.pattern.search(self.text, self.pos)
+            match = self._next_match()
             if match is None:
                 raise StopIteration
             # Avoid getting stuck with zero-length regular expressions.
@@ -82,6 +119,20 @@ class Finder:
         self.pos = self.match_span[1]
         return self.match_span
 
+    def _next_match(self):
+        """Return the next match of a regular expression or ``None``."""
+        # Building a list of matches would make replacing all quadratic,
+        # but if the list is available, use it unless position is inside
+        # a match, in which case a search could find overlapping matches.
+        cached = self._get_matches(build=False)
+        if cached is None:
+            return self.pattern.search(self.text, self.pos)
+        matches, starts, ends = cached
+        i = bisect.bisect_left(starts, self.pos)
+        if i > 0 and ends[i-1] > self.pos:
+            return self.pattern.search(self.text, self.pos)
+        return (matches[i] if i < len(matches) else None)
+
     def previous(self):
         """
         Find the previous match of pattern.
@@ -104,16 +155,9 @@ class Finder:
                 raise StopIteration
             self.match_span = (index, index + len(pattern))
         else: # Regular expression
-            iterator = self.pattern.finditer(self.text)
-            match = None
-            while True:
-                try:
-                    candidate = next(iterator)
-                    if candidate.end() > self.pos:
-                        raise StopIteration
-                except StopIteration:
-                    break
-                match = candidate
+            matches, starts, ends = self._get_matches()
+            i = bisect.bisect_right(ends, self.pos)
+            match = (matches[i-1] if i > 0 else None)
             if match is None:
                 raise StopIteration
             # Avoid getting stuck with zero-length regular expressions.
@@ -140,6 +184,7 @@ class Finder:
         if not isinstance(self.pattern, str):
             replacement = self.match.expand(self.replacement)
         self.text = self.text[:a] + replacement + self.text[z:]
+        self._matches = None
         shift = len(self.text) - orig_length
         self.pos = ((z + shift) if next else a)
         # Adapt match span to new text length to avoid
@@ -157,6 +202,14 @@ class Finder:
         self.pos = 0
         self.match = None
         self.match_span = None
+        if isinstance(self.pattern, str) and self.pattern:
+            # Matches of a plain string do not depend on earlier
+            # replacements, so find them all in the original text
+            # and build the new text once.
+            spans = self._find_all()
+            self._replace_spans(spans)
+            self.pos = len(self.text)
+            return len(spans)
         count = 0
         while True:
             try:
@@ -169,6 +222,17 @@ class Finder:
             count += 1
         return count
 
+    def _replace_spans(self, spans):
+        """Replace text at `spans` with :attr:`replacement`."""
+        pieces = []
+        pos = 0
+        for a, z in spans:
+            pieces.append(self.text[pos:a])
+            pieces.append(self.replacement)
+            pos = z
+        pieces.append(self.text[pos:])
+        self.text = "".join(pieces)
+
     def set_regex(self, pattern, flags=re.DOTALL|re.MULTILINE):
         """
         Set and use regular expression as pattern.
@@ -180,10 +244,12 @@ class Finder:
         if self.ignore_case:
             flags = flags | re.IGNORECASE
         self.pattern = re.compile(pattern, flags)
+        self._matches = None
 
     def set_text(self, text):
         """Set the target text to search in and reset position."""
         self.text = text
         self.match = None
         self.match_span = None
+        self._matches = None
         self.pos = None
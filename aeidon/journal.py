@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Journal file of revertable actions paged out of memory."""
+
+import aeidon
+import io
+import pickle
+import sys
+import zlib
+
+__all__ = ("JournalEntry", "UndoJournal",)
+
+
+class JournalEntry:
+
+    """
+    Reference to a revertable action stored in a journal file.
+
+    :ivar description: Short one line description of the action
+    :ivar length: Length of the record in bytes
+    :ivar offset: Position of the record in the journal file
+    """
+
+    def __init__(self, description, offset, length):
+        """Initialize a :class:`JournalEntry` instance."""
+        self.description = description
+        self.length = length
+        self.offset = offset
+
+    def get_size(self):
+        """Return estimated memory use in bytes."""
+        return sys.getsizeof(self) + sys.getsizeof(self.description)
+
+
+class _Pickler(pickle.Pickler):
+
+    """Pickler that refers to shared constants by name."""
+
+    def persistent_id(self, obj):
+        """Return a reference to enumeration items and calculators."""
+        if isinstance(obj, aeidon.EnumerationItem):
+            for name in aeidon.enums.__all__:
+                if getattr(aeidon, name) is obj.parent:
+                    return ("enum", name, obj.name)
+            return None
+        if isinstance(obj, aeidon.Calculator):
+            return ("calc", obj._framerate)
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+
+    """Unpickler that resolves references to shared constants."""
+
+    def persistent_load(self, pid):
+        """Return enumeration item or calculator referred to by `pid`."""
+        if pid[0] == "enum":
+            return getattr(getattr(aeidon, pid[1]), pid[2])
+        if pid[0] == "calc":
+            for framerate in aeidon.framerates:
+                if framerate.value == pid[1]:
+                    return aeidon.Calculator(framerate)
+            return aeidon.Calculator(pid[1])
+        raise pickle.UnpicklingError("Invalid persistent id: {}"
+                                     .format(repr(pid)))
+
+
+class UndoJournal:
+
+    """
+    Journal file of revertable actions paged out of memory.
+
+    :ivar master: Instance of :class:`aeidon.Project` reverting actions
+    :ivar path: Path to the journal file
+    :ivar _entries: Set of entries in use referring to records
+    :ivar _file: File object of the journal opened for reading and writing
+    :ivar _live: Total length of records referred to by entries in use
+
+    Actions are written as compressed pickles appended to the end of the
+    file, so that writing an action does not touch earlier records. Revert
+    functions are stored by name and looked up from :attr:`master` when
+    loading actions. Once records no longer referred to take more space
+    than those in use, records in use are moved over them to the start of
+    the file and offsets of their entries updated.
+    """
+
+    def __init__(self, master, path=None):
+        """Initialize a :class:`UndoJournal` instance."""
+        self.master = master
+        self.path = path or aeidon.temp.create(".journal")
+        self._entries = set()
+        self._file = open(self.path, "w+b")
+        self._live = 0
+
+    def close(self):
+        """Close and remove the journal file."""
+        self._file.close()
+        aeidon.temp.remove(self.path)
+
+    def _compact(self):
+        """Move records in use to the start of the file."""
+        offset = 0
+        for entry in sorted(self._entries, key=lambda x: x.offset):
+            if entry.offset != offset:
+                # Records only move towards the start, so
+                # records yet to be moved are not overwritten.
+                self._file.seek(entry.offset)
+                data = self._file.read(entry.length)
+                self._file.seek(offset)
+                self._file.write(data)
+                entry.offset = offset
+            offset += entry.length
+        self._file.truncate(offset)
+        self._file.flush()
+
+    def discard(self, entry):
+        """Mark the record of `entry` as no longer needed."""
+        self._entries.discard(entry)
+        self._live -= entry.length
+        size = self._file.seek(0, io.SEEK_END)
+        if size - self._live > self._live:
+            self._compact()
+
+    def _dump_action(self, action):
+        """Return a picklable tuple of values of `action`."""
+        if isinstance(action, aeidon.RevertableActionGroup):
+            return (None,
+                    action.description,
+                    [self._dump_action(x) for x in action.actions])
+        name = action.revert_function.__name__
+        if getattr(self.master, name, None) != action.revert_function:
+            raise ValueError("Revert function not found in master: {}"
+                             .format(repr(action.revert_function)))
+        return (name,
+                action.description,
+                action.docs,
+                action.register,
+                action.revert_args,
+                action.revert_kwargs,
+                action.target)
+
+    def load(self, entry):
+        """Read and return action referred to by `entry`."""
+        self._file.seek(entry.offset)
+        data = zlib.decompress(self._file.read(entry.length))
+        action = self._load_action(_Unpickler(io.BytesIO(data)).load())
+        self.discard(entry)
+        return action
+
+    def _load_action(self, values):
+        """Return action from values returned by :meth:`_dump_action`."""
+        if values[0] is None:
+            return aeidon.RevertableActionGroup(
+                description=values[1],
+                actions=[self._load_action(x) for x in values[2]])
+        return aeidon.RevertableAction(
+            revert_function=getattr(self.master, values[0]),
+            description=values[1],
+            docs=values[2],
+            register=values[3],
+            revert_args=values[4],
+            revert_kwargs=values[5],
+            target=values[6])
+
+    def store(self, action):
+        """
+        Write `action` to the journal and return an entry referring to it.
+
+        Raise :exc:`ValueError` if `action` cannot be stored.
+        """
+        data = io.BytesIO()
+        try:
+            values = self._dump_action(action)
+            _Pickler(data, pickle.HIGHEST_PROTOCOL).dump(values)
+        except (AttributeError, TypeError, pickle.PicklingError) as error:
+            raise ValueError("Cannot store action: {}"
+                             .format(str(error)))
+        data = zlib.compress(data.getvalue(), 1)
+        offset = self._file.seek(0, io.SEEK_END)
+        self._file.write(data)
+        self._file.flush()
+        entry = JournalEntry(action.description, offset, len(data))
+        self._entries.add(entry)
+        self._live += entry.length
+        return entry
@@ -18,7 +18,6 @@
 """Names and ISO 639 codes for languages and conversions between them."""
 
 import aeidon
-import os
 
 from aeidon.i18n import d_
 
@@ -27,17 +26,7 @@ _languages = {}
 
 def _init_languages():
     """Initialize the dictionary mapping codes to names."""
-    import xml.etree.ElementTree as ET
-    path = "/usr/share/xml/iso-codes/iso_639.xml"
-    if not os.path.isfile(path):
-        # Prefer files part of the iso-codes installation,
-        # use bundled copy as fallback.
-        path = os.path.join(aeidon.DATA_DIR, "iso-codes", "iso_639.xml")
-    for element in ET.parse(path).findall("iso_639_entry"):
-        code = element.get("iso_639_1_code", None)
-        name = element.get("name", None)
-        if not code or not name: continue
-        _languages[code] = name
+    _languages.update(aeidon.util.read_iso_codes("iso_639", "iso_639_1_code"))
 
 def code_to_name(code):
     """Convert ISO 639 `code` to localized language name."""
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""List of subtitles parsed from file on demand."""
+
+import aeidon
+import array
+import collections.abc
+
+__all__ = ("LazySubtitleList",)
+
+
+class LazySubtitleList(collections.abc.MutableSequence):
+
+    """
+    List of subtitles parsed from file on demand.
+
+    :ivar file: :class:`aeidon.SubtitleFile` instance subtitles are read from
+    :ivar framerate: :attr:`aeidon.framerates` item
+
+    Subtitles are initialized from byte offsets returned by
+    :meth:`aeidon.SubtitleFile.index` and parsed with
+    :meth:`aeidon.SubtitleFile.read_cue` when first accessed. Once parsed,
+    subtitles are kept and behave like items of a regular list, so memory use
+    grows only with the amount of subtitles accessed, inserted or edited.
+    """
+
+    def __init__(self, file, offsets, framerate=None):
+        """Initialize a :class:`LazySubtitleList` instance."""
+        self.file = file
+        self._framerate = framerate or aeidon.framerates.FPS_23_976
+        self._starts = array.array("q", offsets[:-1])
+        self._ends = array.array("q", offsets[1:])
+        self._subtitles = [None] * len(self._starts)
+
+    def __delitem__(self, index):
+        """Remove subtitle at `index`."""
+        del self._starts[index]
+        del self._ends[index]
+        del self._subtitles[index]
+
+    def __eq__(self, other):
+        """Compare subtitles by value with any sequence of subtitles."""
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return (len(self) == len(other) and
+                all(x == y for x, y in zip(self, other)))
+
+    __hash__ = None
+
+    def __getitem__(self, index):
+        """Return subtitle at `index` or a list of subtitles."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            return [self[i] for i in indices]
+        subtitle = self._subtitles[index]
+        if subtitle is None:
+            subtitle = self.file.read_cue(self._starts[index],
+                                          self._ends[index])
+
+            subtitle.framerate = self._framerate
+            self._subtitles[index] = subtitle
+        return subtitle
+
+    def __iter__(self):
+        """Iterate over all subtitles, parsing those not yet parsed."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        """Return the amount of subtitles."""
+        return len(self._subtitles)
+
+    def __setitem__(self, index, subtitle):
+        """Set `subtitle` at `index`."""
+        self._subtitles[index] = subtitle
+
+    def count_parsed(self):
+        """Return the amount of subtitles parsed or set."""
+        return sum(x is not None for x in self._subtitles)
+
+    @property
+    def framerate(self):
+        """Return framerate."""
+        return self._framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate of all subtitles, parsed or not, from `value`."""
+        self._framerate = value
+        for subtitle in self._subtitles:
+            if subtitle is None: continue
+            subtitle.framerate = value
+
+    def insert(self, index, subtitle):
+        """Insert `subtitle` at `index`."""
+        self._starts.insert(index, -1)
+        self._ends.insert(index, -1)
+        self._subtitles.insert(index, subtitle)
+
+    def is_parsed(self, index):
+        """Return ``True`` if subtitle at `index` has been parsed or set."""
+        return self._subtitles[index] is not None
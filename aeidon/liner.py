@@ -60,50 +60,6 @@ class Liner(aeidon.Parser):
         return  [" ".join(boxes[edges[i]:edges[i+1]])
                  for i in range(len(edges) - 1)]
 
-    def _break_lines(self, boxes, penalties, nlines):
-        """
-        Break `boxes` into lines and return break points and demerit.
-
-        If keeping all boxes on a single line results in a valid and better
-        result than splitting to `nlines` return an empty list. If no
-        valid break points can be found, return ``None``.
-        """
-        breaks = self._list_possible_breaks(boxes, penalties, nlines)
-        best_breaks = None
-        best_demerit = sys.maxsize
-        text = " ".join(boxes)
-        if self.length_func(text) <= self.max_length:
-            # Use a valid one-line solution as the benchmark,
-            # that any more-line solution must beat.
-            best_breaks = []
-            best_demerit = self._calculate_demerit(boxes, penalties, [])
-        if nlines == 1:
-            return best_breaks, best_demerit
-        if nlines == 2:
-            for i in breaks:
-                if penalties[i] > best_demerit: break
-                demerit = self._calculate_demerit(boxes, penalties, [i])
-                if demerit < best_demerit:
-                    best_breaks = [i]
-                    best_demerit = demerit
-            return best_breaks, best_demerit
-        # For more than two lines, loop over first break points and
-        # recursively figure out rest of the breaks in each case.
-        for i in breaks:
-            # Use the maximum total negative penalty
-            # that can accumulate from all later breaks.
-            negpen = sorted(x for x in penalties[i+1:] if x < 0)
-            negpen = sum(negpen[:min(len(negpen), nlines - 2)])
-            if (penalties[i] + negpen) > best_demerit: break
-            value = self._break_lines(boxes[i+1:], penalties[i+1:], nlines-1)
-            if value[0] is None: continue
-            later = [i+1+x for x in value[0]]
-            demerit = self._calculate_demerit(boxes, penalties, [i] + later)
-            if demerit < best_demerit:
-                best_breaks = [i] + later
-                best_demerit = demerit
-        return best_breaks, best_demerit
-
     def break_lines(self):
         """Break lines and return text."""
         self.text = self.text.replace("\n", " ")
@@ -116,18 +72,21 @@ class Liner(aeidon.Parser):
         penalties = self._detect_penalties(boxes)
         best_breaks = None
         best_demerit = sys.maxsize
-        # We can probably handle up to ten lines of text
-        # before finding break points gets intolerably slow.
+        # Allow up to ten lines of text, which should be plenty
+        # for anything that can be presented as one subtitle.
         min_nlines = min(2, self.max_lines)
         max_nlines = min(10, len(boxes))
-        for nlines in range(min_nlines, max_nlines+1):
-            breaks, demerit = self._break_lines(boxes, penalties, nlines)
+        candidates = self._iter_breaks(boxes, penalties, max_nlines)
+        for nlines, breaks in enumerate(candidates, 1):
+            if breaks is not None:
+                demerit = self._calculate_demerit(boxes, penalties, breaks)
+                if demerit < best_demerit:
+                    best_breaks = breaks
+                    best_demerit = demerit
+            # Use the best solution with up to the smallest amount
+            # of lines, not less than max_lines, that has a solution.
             if breaks is None: continue
-            if demerit < best_demerit:
-                best_breaks = breaks
-                best_demerit = demerit
-            if nlines < self.max_lines:
-                continue
+            if nlines < max(min_nlines, self.max_lines): continue
             pos = -1
             for i in range(len(boxes)):
                 pos = pos + 1 + len(boxes[i])
@@ -183,56 +142,88 @@ class Liner(aeidon.Parser):
             penalties[i] = textpen[pos]
         return penalties
 
-    @aeidon.deco.memoize(100)
-    def _list_possible_breaks(self, boxes, penalties, nlines):
+    def _iter_breaks(self, boxes, penalties, max_nlines):
         """
-        Return a list of all possible break points for `boxes`.
+        Iterate over the best break points for each amount of lines.
 
-        All break points that would necessarily cause `max_length` to be
-        violated are discarded. Breaks are returned sorted in ascending order
-        of associated `penalties`, so that all remaining breaks can be
-        discarded once a demerit threshold is crossed.
+        Yield break points for one line, two lines, etc. up to `max_nlines`
+        or ``None`` if `boxes` cannot be broken into that many lines without
+        any line exceeding :attr:`max_length`.
         """
-        breaks = list(range(len(boxes) - (nlines - 1)))
-        breakpen = penalties[:len(breaks)]
-        if nlines == 1:
-            return []
-        if nlines == 2:
-            keep = [False] * len(breaks)
-            for i in range(len(breaks)):
-                lines = self._boxes_to_lines(boxes, breaks=[i])
-                lengths = map(self.length_func, lines)
-                keep[i] = max(lengths) <= self.max_length
-            breaks = [breaks[i] for i in range(len(breaks)) if keep[i]]
-            breakpen = [breakpen[i] for i in range(len(breakpen)) if keep[i]]
-            # Sort breaks in ascending order by penalties,
-            # so that all remaining breaks can be discarded once
-            # a demerit threshold is crossed.
-            if not breaks: return []
-            points = sorted(zip(breakpen, breaks))
-            breakpen, breaks = zip(*points)
-            return(breaks)
-        # For more than two lines, loop over first break points and
-        # recursively figure out rest of the breaks in each case.
-        keep = [False] * len(breaks)
-        for i in range(len(breaks)):
-            lines = self._boxes_to_lines(boxes, breaks=[i])
-            alength = self.length_func(lines[0])
-            if alength > self.max_length: break
-            later = self._list_possible_breaks(boxes[i+1:],
-                                               penalties[i+1:],
-                                               nlines-1)
+        # Find the best breaks for each amount of lines at once by dynamic
+        # programming over states of the last line's first and end box.
+        # Penalties, squared line lengths and pyramid add up line by line.
+        # The mean line length used in the deviation measure depends only
+        # on the amount of lines if line lengths add up from box lengths,
+        # which allows the sum of squared line lengths to be minimized in
+        # its place. Final results are compared by the full demerit.
+        n = len(boxes)
+        weight = 50 / self.max_length**2
+        lengths = self._list_line_lengths(boxes)
+        if self.length_func(" ".join(boxes)) <= self.max_length:
+            yield []
+        else: # Does not fit on one line.
+            yield None
+        # Skip states from which the remaining boxes cannot fit into
+        # the remaining lines, counted by filling lines greedily.
+        need = [0] * (n + 1)
+        for i in reversed(range(n)):
+            need[i] = (1 + need[max(lengths[i])]
+                       if lengths[i] else max_nlines + 1)
+        layers = [{(0, j): (weight * x**2, None)
+                   for j, x in lengths[0].items()
+                   if need[j] < max_nlines}]
+
+        for nlines in range(2, max_nlines+1):
+            layer = {}
+            for (h, i), (cost, prev) in layers[-1].items():
+                if i == n: continue
+                a = lengths[h][i]
+                for j, b in lengths[i].items():
+                    if nlines + need[j] > max_nlines: continue
+                    new_cost = cost + penalties[i-1] + weight * b**2
+                    if a > b: new_cost += weight * (a - b)**2
+                    if (i, j) in layer and layer[(i, j)][0] <= new_cost:
+                        continue
+                    layer[(i, j)] = (new_cost, (h, i))
+            layers.append(layer)
+            ends = sorted(x for x in layer if x[1] == n)
+            if not ends:
+                yield None
+                continue
+            state = min(ends, key=lambda x: layer[x][0])
+            breaks = []
+            for states in reversed(layers[1:]):
+                breaks.insert(0, state[0] - 1)
+                state = states[state][1]
+            yield breaks
+
+    def _list_line_lengths(self, boxes):
+        """
+        Return a list of lengths of lines that fit in :attr:`max_length`.
 
-            keep[i] = bool(later)
-        breaks = [breaks[i] for i in range(len(breaks)) if keep[i]]
-        breakpen = [breakpen[i] for i in range(len(breakpen)) if keep[i]]
-        # Sort breaks in ascending order by penalties,
-        # so that all remaining breaks can be discarded once
-        # a demerit threshold is crossed.
-        if not breaks: return []
-        points = sorted(zip(breakpen, breaks))
-        breakpen, breaks = zip(*points)
-        return(breaks)
+        Items in the returned list are dictionaries mapping the end of line
+        to length of line for lines starting at each box.
+        """
+        lengths = [{} for i in range(len(boxes))]
+        if self.length_func is len:
+            # Sum character counts of boxes and spaces between them
+            # instead of measuring each possible line separately.
+            ends = [-1]
+            for box in boxes:
+                ends.append(ends[-1] + 1 + len(box))
+            for i in range(len(boxes)):
+                for j in range(i+1, len(boxes)+1):
+                    length = ends[j] - ends[i] - 1
+                    if length > self.max_length: break
+                    lengths[i][j] = length
+            return lengths
+        for i in range(len(boxes)):
+            for j in range(i+1, len(boxes)+1):
+                length = self.length_func(" ".join(boxes[i:j]))
+                if length > self.max_length: break
+                lengths[i][j] = length
+        return lengths
 
     def set_penalties(self, penalties):
         """
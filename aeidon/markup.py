@@ -18,6 +18,7 @@
 """Base class for text markup."""
 
 import aeidon
+import collections
 import re
 
 __all__ = ("Markup",)
@@ -32,6 +33,8 @@ class Markup(aeidon.Singleton):
     format, which has the following BBcode-style tags with angle brackets.
     Conversions are best done via the ``_decode_*`` and ``_encode_*`` methods
     rather than hard-coding internal tags in regular expression substitutions.
+    These find all opening and closing tags of one kind at once, pair them and
+    replace them in a single pass over the text.
 
      * ``<b>...................</b>``
      * ``<i>...................</i>``
@@ -73,57 +76,64 @@ class Markup(aeidon.Singleton):
         text = self._main_decode(text)
         return self._post_decode(text)
 
-    def _decode_apply(self, text, regex, replacement, groups):
+    def _decode_apply(self, text, opening, closing, tags, groups=(),
+                      key=None):
         """
-        Return `text` with all matches of `regex` replaced.
+        Return `text` with pairs of `opening` and `closing` tags replaced.
 
-        `replacement` may contain one or more of ``{}``, which are replaced
-        with parts of the match as defined by `groups`, a ``tuple`` of numbers.
+        `tags` should be a ``tuple`` of internal opening and closing tags, of
+        which the opening tag may contain one or more of ``{}``, which are
+        replaced with groups of the opening tag as defined by `groups`, a
+        ``tuple`` of numbers. See :meth:`_pair_tags` for `key`.
         """
-        orig_text = text
-        match = regex.search(text)
-        if match is None: return text
-        a, z = match.span()
-        new = replacement.format(*tuple(map(match.group, groups)))
-        text = "".join((text[:a], new, text[z:]))
-        if text == orig_text: return text
-        return self._decode_apply(text, regex, replacement, groups)
-
-    def _decode_b(self, text, pattern, target, flags=0):
+        replacements = []
+        for start, end in self._pair_tags(text, opening, closing, key):
+            values = tuple(map(start.group, groups))
+            replacements.append((start.span(), tags[0].format(*values)))
+            replacements.append((end.span(), tags[1]))
+        return self._replace_spans(text, replacements)
+
+    def _decode_b(self, text, opening, closing, key=None, flags=0):
         """Return `text` with bold markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<b>{}</b>"
-        return self._decode_apply(text, regex, replacement, (target,))
+        opening = self._get_regex(opening, flags)
+        closing = self._get_regex(closing, flags)
+        tags = ("<b>", "</b>")
+        return self._decode_apply(text, opening, closing, tags, (), key)
 
-    def _decode_c(self, text, pattern, value, target, flags=0):
+    def _decode_c(self, text, opening, closing, value, key=None, flags=0):
         """Return `text` with color markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<color=#{}>{}</color>"
-        return self._decode_apply(text, regex, replacement, (value, target))
+        opening = self._get_regex(opening, flags)
+        closing = self._get_regex(closing, flags)
+        tags = ("<color=#{}>", "</color>")
+        return self._decode_apply(text, opening, closing, tags, (value,), key)
 
-    def _decode_f(self, text, pattern, value, target, flags=0):
+    def _decode_f(self, text, opening, closing, value, key=None, flags=0):
         """Return `text` with font markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<font={}>{}</font>"
-        return self._decode_apply(text, regex, replacement, (value, target))
+        opening = self._get_regex(opening, flags)
+        closing = self._get_regex(closing, flags)
+        tags = ("<font={}>", "</font>")
+        return self._decode_apply(text, opening, closing, tags, (value,), key)
 
-    def _decode_i(self, text, pattern, target, flags=0):
+    def _decode_i(self, text, opening, closing, key=None, flags=0):
         """Return `text` with italic markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<i>{}</i>"
-        return self._decode_apply(text, regex, replacement, (target,))
+        opening = self._get_regex(opening, flags)
+        closing = self._get_regex(closing, flags)
+        tags = ("<i>", "</i>")
+        return self._decode_apply(text, opening, closing, tags, (), key)
 
-    def _decode_s(self, text, pattern, value, target, flags=0):
+    def _decode_s(self, text, opening, closing, value, key=None, flags=0):
         """Return `text` with size markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<size={}>{}</size>"
-        return self._decode_apply(text, regex, replacement, (value, target))
+        opening = self._get_regex(opening, flags)
+        closing = self._get_regex(closing, flags)
+        tags = ("<size={}>", "</size>")
+        return self._decode_apply(text, opening, closing, tags, (value,), key)
 
-    def _decode_u(self, text, pattern, target, flags=0):
+    def _decode_u(self, text, opening, closing, key=None, flags=0):
         """Return `text` with underline markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<u>{}</u>"
-        return self._decode_apply(text, regex, replacement, (target,))
+        opening = self._get_regex(opening, flags)
+        closing = self._get_regex(closing, flags)
+        tags = ("<u>", "</u>")
+        return self._decode_apply(text, opening, closing, tags, (), key)
 
     def encode(self, text):
         """Return `text` with markup converted from internal to this format."""
@@ -134,56 +144,59 @@ class Markup(aeidon.Singleton):
         text = self._encode_s(text)
         return self._encode_u(text)
 
-    def _encode_apply(self, text, regex, method, target, value=None):
+    def _encode_apply(self, text, opening, closing, method, value=None):
         """
-        Return `text` with internal tags removed and `method` applied.
+        Return `text` with internal tags replaced by those of `method`.
 
         `method` should be one the tagging methods, e.g. meth:`bolden`.
-        `target` and `value` should be group numbers in `regex`.
+        `value` should be a group number in `opening`. Tagging methods are
+        assumed to only add tags before and after the given bounds, which
+        allows all pairs of tags to be replaced in one pass. Subclasses, where
+        tagging depends on the surrounding text, need to override this.
         """
-        orig_text = text
-        match = regex.search(text)
-        if match is None: return text
-        text = regex.sub(r"\{}".format(target), text, 1)
-        a = match.start()
-        z = a + len(match.group(target))
-        args = (text, (a, z))
-        if value is not None:
-            args = (text, match.group(value), (a, z))
-        with aeidon.util.silent(NotImplementedError):
-            text = method(*args)
-        if text == orig_text: return text
-        return self._encode_apply(text, regex, method, target, value)
+        replacements = []
+        for start, end in self._pair_tags(text, opening, closing):
+            values = () if value is None else (start.group(value),)
+            tags = self._get_tags(method, *values)
+            replacements.append((start.span(), tags[0]))
+            replacements.append((end.span(), tags[1]))
+        return self._replace_spans(text, replacements)
 
     def _encode_b(self, text):
         """Return `text` with bold markup converted to this format."""
-        regex = self._get_regex(r"<b>(.*?)</b>")
-        return self._encode_apply(text, regex, self.bolden, 1)
+        opening = self._get_regex(r"<b>")
+        closing = self._get_regex(r"</b>")
+        return self._encode_apply(text, opening, closing, self.bolden)
 
     def _encode_c(self, text):
         """Return `text` with color markup converted to this format."""
-        regex = self._get_regex(r"<color=#([a-fA-F0-9]{6})>(.*?)</color>")
-        return self._encode_apply(text, regex, self.colorize, 2, 1)
+        opening = self._get_regex(r"<color=#([a-fA-F0-9]{6})>")
+        closing = self._get_regex(r"</color>")
+        return self._encode_apply(text, opening, closing, self.colorize, 1)
 
     def _encode_f(self, text):
         """Return `text` with font markup converted to this format."""
-        regex = self._get_regex(r"<font=(.+?)>(.*?)</font>")
-        return self._encode_apply(text, regex, self.fontify, 2, 1)
+        opening = self._get_regex(r"<font=(.+?)>")
+        closing = self._get_regex(r"</font>")
+        return self._encode_apply(text, opening, closing, self.fontify, 1)
 
     def _encode_i(self, text):
         """Return `text` with italic markup converted to this format."""
-        regex = self._get_regex(r"<i>(.*?)</i>")
-        return self._encode_apply(text, regex, self.italicize, 1)
+        opening = self._get_regex(r"<i>")
+        closing = self._get_regex(r"</i>")
+        return self._encode_apply(text, opening, closing, self.italicize)
 
     def _encode_s(self, text):
         """Return `text` with size markup converted to this format."""
-        regex = self._get_regex(r"<size=(\d+)>(.*?)</size>")
-        return self._encode_apply(text, regex, self.scale, 2, 1)
+        opening = self._get_regex(r"<size=(\d+)>")
+        closing = self._get_regex(r"</size>")
+        return self._encode_apply(text, opening, closing, self.scale, 1)
 
     def _encode_u(self, text):
         """Return `text` with underline markup converted to this format."""
-        regex = self._get_regex(r"<u>(.*?)</u>")
-        return self._encode_apply(text, regex, self.underline, 1)
+        opening = self._get_regex(r"<u>")
+        closing = self._get_regex(r"</u>")
+        return self._encode_apply(text, opening, closing, self.underline)
 
     def fontify(self, text, font, bounds=None):
         """Return `text` changed to `font`."""
@@ -195,6 +208,14 @@ class Markup(aeidon.Singleton):
         flags = self._flags | flags
         return re.compile(pattern, flags)
 
+    def _get_tags(self, method, *args):
+        """Return opening and closing tags added by tagging `method`."""
+        with aeidon.util.silent(NotImplementedError):
+            # Tag a single placeholder character and
+            # split the result into what came before and after.
+            return tuple(method("\0", *args).split("\0", 1))
+        return ("", "")
+
     @property
     def italic_tag(self):
         """Regular expression for an italic markup tag or ``None``."""
@@ -208,6 +229,35 @@ class Markup(aeidon.Singleton):
         """Return `text` with decodable markup decoded."""
         return text
 
+    def _pair_tags(self, text, opening, closing, key=None):
+        """
+        Return a list of matches of `opening` and `closing` tags that pair.
+
+        Each opening tag is paired with the first unpaired closing tag after it
+        and, if `key` is given, with the same value of group `key` in both
+        `opening` and `closing`. Opening tags without a closing tag after them
+        and closing tags without an opening tag before them are left unpaired.
+        """
+        closings = {}
+        for match in closing.finditer(text):
+            closings.setdefault(match.group(key) if key else None,
+                                collections.deque()).append(match)
+        pairs = []
+        paired = set()
+        for match in opening.finditer(text):
+            # Closing tags can also match the opening pattern,
+            # but once paired are no longer available as openings.
+            if match.start() in paired: continue
+            queue = closings.get(match.group(key) if key else None)
+            # Closing tags before this opening tag are before all
+            # later opening tags too and can never be paired.
+            while queue and queue[0].start() < match.end():
+                queue.popleft()
+            if not queue: continue
+            pairs.append((match, queue.popleft()))
+            paired.add(pairs[-1][1].start())
+        return pairs
+
     def _post_decode(self, text):
         """Return `text` with markup finalized after decoding."""
         return text
@@ -216,6 +266,18 @@ class Markup(aeidon.Singleton):
         """Return `text` with markup prepared for decoding."""
         return text
 
+    def _replace_spans(self, text, replacements):
+        """Return `text` with ``(span, string)`` `replacements` made."""
+        if not replacements: return text
+        parts = []
+        pos = 0
+        for (a, z), string in sorted(replacements, key=lambda x: x[0]):
+            parts.append(text[pos:a])
+            parts.append(string)
+            pos = z
+        parts.append(text[pos:])
+        return "".join(parts)
+
     def scale(self, text, size, bounds=None):
         """Return `text` scaled to `size`."""
         raise NotImplementedError
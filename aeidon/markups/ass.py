@@ -46,8 +46,8 @@ class AdvSubStationAlpha(aeidon.markups.SubStationAlpha):
 
     def _main_decode(self, text):
         """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"\{\\b[1-9]\d*\}(.*?)\{\\b[0\\]\}", 1)
-        text = self._decode_u(text, r"\{\\u1\}(.*?)\{\\u[0\\]\}", 1)
+        text = self._decode_b(text, r"\{\\b[1-9]\d*\}", r"\{\\b[0\\]\}")
+        text = self._decode_u(text, r"\{\\u1\}", r"\{\\u[0\\]\}")
         return aeidon.markups.SubStationAlpha._main_decode(self, text)
 
     def underline(self, text, bounds=None):
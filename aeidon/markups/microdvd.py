@@ -54,6 +54,32 @@ class MicroDVD(aeidon.Markup):
         color = "${}{}{}".format(color[4:], color[2:4], color[:2])
         return self._style(text, "C", "c", color, bounds)
 
+    def _encode_apply(self, text, opening, closing, method, value=None):
+        """
+        Return `text` with internal tags replaced by those of `method`.
+
+        MicroDVD tags depend on the text surrounding them and can be dropped
+        by `method`, so pairs of tags are replaced one by one, each time
+        calling `method` with the whole text.
+        """
+        while True:
+            pairs = self._pair_tags(text, opening, closing)
+            if not pairs: return text
+            start, end = pairs[0]
+            new_text = "".join((text[:start.start()],
+                                text[start.end():end.start()],
+                                text[end.end():]))
+
+            a = start.start()
+            z = a + end.start() - start.end()
+            args = (new_text, (a, z))
+            if value is not None:
+                args = (new_text, start.group(value), (a, z))
+            with aeidon.util.silent(NotImplementedError):
+                new_text = method(*args)
+            if new_text == text: return text
+            text = new_text
+
     def fontify(self, text, font, bounds=None):
         """Return `text` changed to `font`."""
         return self._style(text, "F", "f", font, bounds)
@@ -69,12 +95,23 @@ class MicroDVD(aeidon.Markup):
 
     def _main_decode(self, text):
         """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"\{([Yy]:b)\}(.*?)\{/\1\}", 2)
-        text = self._decode_c(text, r"\{([Cc]:#(.*?))\}(.*?)\{/\1\}", 2, 3)
-        text = self._decode_f(text, r"\{([Ff]:(.*?))\}(.*?)\{/\1\}", 2, 3)
-        text = self._decode_i(text, r"\{([Yy]:i)\}(.*?)\{/\1\}", 2)
-        text = self._decode_s(text, r"\{([Ss]:(.*?))\}(.*?)\{/\1\}", 2, 3)
-        text = self._decode_u(text, r"\{([Yy]:u)\}(.*?)\{/\1\}", 2)
+        # Opening and closing tags pair by their whole content,
+        # including case and value, given as group 1 of both.
+        text = self._decode_b(text, r"\{([Yy]:b)\}", r"\{/([Yy]:b)\}", 1)
+        text = self._decode_c(text,
+                              r"\{([Cc]:#(.*?))\}",
+                              r"\{/([Cc]:#.*?)\}", 2, 1)
+
+        text = self._decode_f(text,
+                              r"\{([Ff]:(.*?))\}",
+                              r"\{/([Ff]:.*?)\}", 2, 1)
+
+        text = self._decode_i(text, r"\{([Yy]:i)\}", r"\{/([Yy]:i)\}", 1)
+        text = self._decode_s(text,
+                              r"\{([Ss]:(.*?))\}",
+                              r"\{/([Ss]:.*?)\}", 2, 1)
+
+        text = self._decode_u(text, r"\{([Yy]:u)\}", r"\{/([Yy]:u)\}", 1)
         return text
 
     def _pre_decode(self, text):
@@ -90,17 +127,14 @@ class MicroDVD(aeidon.Markup):
 
         For example, ``{y:biu}`` is replaced with ``{y:b}{y:i}{y:u}``.
         """
+        def replace(match):
+            y = match.group(1)
+            return "".join("{{{}:{}}}".format(y, m)
+                           for m in ("b", "i", "u")
+                           if m in match.group(2))
         pattern = r"\{([Yy]):([^}]{2,})\}"
         regex = self._get_regex(pattern)
-        match = regex.search(text)
-        if match is None: return text
-        y = match.group(1)
-        replacement = ""
-        for m in ("b", "i", "u"):
-            if m in match.group(2):
-                replacement += "{{{}:{}}}".format(y, m)
-        text = regex.sub(replacement, text, 1)
-        return self._pre_decode_break(text)
+        return regex.sub(replace, text)
 
     def _pre_decode_close(self, text):
         """
@@ -129,13 +163,12 @@ class MicroDVD(aeidon.Markup):
 
         Color tags are converted from ``{c:$BBGGRR}`` to ``{c:#RRGGBB}``.
         """
+        def replace(match):
+            color = match.group(2)
+            color = "{}{}{}".format(color[4:], color[2:4], color[:2])
+            return "{{{}#{}}}".format(match.group(1), color)
         regex = self._get_regex(r"\{([Cc]:)\$([0-9A-Fa-f]{6})\}")
-        match = regex.search(text)
-        if match is None: return text
-        color = match.group(2)
-        color = "{}{}{}".format(color[4:], color[2:4], color[:2])
-        text = regex.sub(r"{{\1#{}}}".format(color), text, 1)
-        return self._pre_decode_color(text)
+        return regex.sub(replace, text)
 
     def scale(self, text, size, bounds=None):
         """Return `text` scaled to `size`."""
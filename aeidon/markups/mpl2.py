@@ -53,9 +53,9 @@ class MPL2(aeidon.markups.MicroDVD):
 
     def _main_decode(self, text):
         """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"<\\>(.*?)</\\>", 1)
-        text = self._decode_i(text, r"</>(.*?)<//>", 1)
-        text = self._decode_u(text, r"<_>(.*?)</_>", 1)
+        text = self._decode_b(text, r"<\\>", r"</\\>")
+        text = self._decode_i(text, r"</>", r"<//>")
+        text = self._decode_u(text, r"<_>", r"</_>")
         return aeidon.markups.MicroDVD._main_decode(self, text)
 
     def _pre_decode(self, text):
@@ -18,6 +18,7 @@
 """Text markup for the Sub Station Alpha format."""
 
 import aeidon
+import collections
 import re
 
 __all__ = ("SubStationAlpha",)
@@ -88,11 +89,11 @@ class SubStationAlpha(aeidon.Markup):
 
     def _main_decode(self, text):
         """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"\{\\b1\}(.*?)\{\\b[0\\]\}", 1)
-        text = self._decode_c(text, r"\{\\c#(.+?)\}(.*?)\{\\c\\\}", 1, 2)
-        text = self._decode_f(text, r"\{\\fn(.+?)\}(.*?)\{\\fn\\\}", 1, 2)
-        text = self._decode_i(text, r"\{\\i1\}(.*?)\{\\i[0\\]\}", 1)
-        text = self._decode_s(text, r"\{\\fs(\d+)\}(.*?)\{\\fs\\\}", 1, 2)
+        text = self._decode_b(text, r"\{\\b1\}", r"\{\\b[0\\]\}")
+        text = self._decode_c(text, r"\{\\c#(.+?)\}", r"\{\\c\\\}", 1)
+        text = self._decode_f(text, r"\{\\fn(.+?)\}", r"\{\\fn\\\}", 1)
+        text = self._decode_i(text, r"\{\\i1\}", r"\{\\i[0\\]\}")
+        text = self._decode_s(text, r"\{\\fs(\d+)\}", r"\{\\fs\\\}", 1)
         return text
 
     def _post_decode(self, text):
@@ -114,12 +115,17 @@ class SubStationAlpha(aeidon.Markup):
         For example, ``{\\b1\\i1}`` is replaced with ``{\\b1}{\\i1}``.
         """
         parts = text.split("\\")
+        inside = False
         for i in range(1, len(parts)):
-            text_so_far = "\\".join(parts[:i])
-            if text_so_far.endswith("{"): continue
-            opening_index = text_so_far.rfind("{")
-            closing_index = text_so_far.rfind("}")
-            if opening_index > closing_index:
+            # Track whether the text so far ends inside braces
+            # instead of joining and searching it again each time.
+            part = parts[i - 1]
+            opening_index = part.rfind("{")
+            closing_index = part.rfind("}")
+            if opening_index != closing_index:
+                inside = opening_index > closing_index
+            if part.endswith("{"): continue
+            if inside:
                 parts[i - 1] += "}{"
         return "\\".join(parts)
 
@@ -129,14 +135,13 @@ class SubStationAlpha(aeidon.Markup):
 
         Color tags are converted from ``{\\c&HBBGGRR&}`` to ``{\\c#RRGGBB}``.
         """
+        def replace(match):
+            color = ("{:0>6s}".format(match.group(1))).replace(" ", "0")
+            color = "{}{}{}".format(color[4:], color[2:4], color[:2])
+            return "{{\\c#{}}}".format(color)
         pattern = r"\{\\c&H([0-9a-fA-F]*)&\}"
         regex = self._get_regex(pattern)
-        match = regex.search(text)
-        if match is None: return text
-        color = ("{:0>6s}".format(match.group(1))).replace(" ", "0")
-        color = "{}{}{}".format(color[4:], color[2:4], color[:2])
-        text = regex.sub(r"{{\\c#{}}}".format(color), text, 1)
-        return self._pre_decode_color(text)
+        return regex.sub(replace, text)
 
     def _pre_decode_reset(self, text):
         """
@@ -150,19 +155,20 @@ class SubStationAlpha(aeidon.Markup):
         re_reset = self._get_regex(self._reset_pattern)
         parts = re_reset.split(text + "{\\r}")
         for i, part in enumerate(parts):
-            opening_matches = [x for x in re_opening.finditer(part)]
-            closing_matches = [x for x in re_closing.finditer(part)]
-            # Find out which tags have already been closed.
-            for j in reversed(range(len(closing_matches))):
-                closing_core = closing_matches[j].group(1)
-                for k in range(len(opening_matches)):
-                    opening_core = opening_matches[k].group(1)
-                    if opening_core == closing_core:
-                        opening_matches.pop(k)
-                        break
+            # Each closing tag has closed the first
+            # opening tag with the same name.
+            closed = collections.Counter(
+                x.group(1) for x in re_closing.finditer(part))
+            opened = []
+            for match in re_opening.finditer(part):
+                core = match.group(1)
+                if closed[core] > 0:
+                    closed[core] -= 1
+                else: # Not closed
+                    opened.append(core)
             # Add artificial closing tags to close remaining tags.
-            for j in reversed(range(len(opening_matches))):
-                parts[i] += "{{\\{}\\}}".format(opening_matches[j].group(1))
+            parts[i] += "".join("{{\\{}\\}}".format(x)
+                                for x in reversed(opened))
         return "".join(parts)
 
     def scale(self, text, size, bounds=None):
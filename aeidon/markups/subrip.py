@@ -75,11 +75,11 @@ class SubRip(aeidon.Markup):
 
     def _main_decode(self, text):
         """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"<b>(.*?)</b>", 1)
-        text = self._decode_i(text, r"<i>(.*?)</i>", 1)
-        text = self._decode_u(text, r"<u>(.*?)</u>", 1)
-        pattern = r'<font color="#([0-9a-fA-F]{6})">(.*?)</font>'
-        return self._decode_c(text, pattern, 1, 2)
+        text = self._decode_b(text, r"<b>", r"</b>")
+        text = self._decode_i(text, r"<i>", r"</i>")
+        text = self._decode_u(text, r"<u>", r"</u>")
+        opening = r'<font color="#([0-9a-fA-F]{6})">'
+        return self._decode_c(text, opening, r"</font>", 1)
 
     @property
     def tag(self):
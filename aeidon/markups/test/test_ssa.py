@@ -71,6 +71,17 @@ class TestSubStationAlpha(aeidon.TestCase):
             "<i>All</i> things weird are normal\n"
             "in this whore of cities.")
 
+    def test_decode__many(self):
+        text = "{\\i1}All{\\i0} " * 10000
+        assert self.markup.decode(text) == "<i>All</i> " * 10000
+
+    def test_decode__nested(self):
+        text = ("{\\b1}All things {\\b1}weird{\\b0} are normal\n"
+                "in this whore{\\b0} of cities.")
+        assert self.markup.decode(text) == (
+            "<b>All things <b>weird</b> are normal\n"
+            "in this whore</b> of cities.")
+
     def test_decode__reset(self):
         text = ("{\\b1\\i1}All{\\i0} things weird are normal\n"
                 "{\\fs12}in this whore of cities{\\r}.")
@@ -113,6 +124,10 @@ class TestSubStationAlpha(aeidon.TestCase):
             "All {\\i1}things{\\i0} weird are normal\n"
             "in {\\i1}this{\\i0} whore of cities.")
 
+    def test_encode__many(self):
+        text = "<i>All</i> " * 10000
+        assert self.markup.encode(text) == "{\\i1}All{\\i0} " * 10000
+
     def test_encode__size(self):
         text = ("All things weird are normal\n"
                 "in this whore of <size=12>cities</size>.")
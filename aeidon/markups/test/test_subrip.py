@@ -71,6 +71,13 @@ class TestSubRip(aeidon.TestCase):
             "<i>All</i> things weird are normal\n"
             "in this whore of cities.")
 
+    def test_decode__mixed_case(self):
+        text = ("<i>All</i> things weird are normal\n"
+                "in <I>this</I> whore of cities.")
+        assert self.markup.decode(text) == (
+            "<i>All</i> things weird are normal\n"
+            "in <i>this</i> whore of cities.")
+
     def test_decode__underline(self):
         text = ("All things weird are normal\n"
                 "in this <U>whore</U> of cities.")
@@ -29,8 +29,9 @@ class Parser(aeidon.Finder):
 
     :ivar clean_func: Function to clean tags or ``None``
     :ivar _margins: Start tag, end tag that every line is wrapped in
+    :ivar _pending: Index of first tag, floor and shift pending for tags
     :ivar re_tag: Regular expression object to match any tag
-    :ivar _tags: List of lists of markup tag, position
+    :ivar _tags: List of lists of position in text without tags, markup tag
 
     The purpose of :class:`Parser` is to split text to the actual text and its
     markup tags, allowing the text to be edited while keeping its tags separate
@@ -54,6 +55,7 @@ class Parser(aeidon.Finder):
         aeidon.Finder.__init__(self)
         self.clean_func = clean_func
         self._margins = None
+        self._pending = (0, 0, 0)
         self.re_tag = re_tag
         self._tags = None
 
@@ -62,9 +64,15 @@ class Parser(aeidon.Finder):
         if not self.text:
             self._margins = []
             self._tags = []
-        text = self.text[:]
-        for pos, tag in self._tags:
-            text = text[:pos] + tag + text[pos:]
+        self._settle_tags()
+        pieces = []
+        pos = 0
+        for tag_pos, tag in self._tags:
+            pieces.append(self.text[pos:tag_pos])
+            pieces.append(tag)
+            pos = tag_pos
+        pieces.append(self.text[pos:])
+        text = "".join(pieces)
         if self._margins:
             text = text.replace("\n", "{1}\n{0}".format(*self._margins))
             text = self._margins[0] + text + self._margins[1]
@@ -80,10 +88,24 @@ class Parser(aeidon.Finder):
         beginning. Raise :exc:`re.error` if bad replacement.
         """
         a = self.match_span[0]
-        orig_text = self.text[:]
+        orig_text = self.text
         aeidon.Finder.replace(self, next)
         shift = len(self.text) - len(orig_text)
-        self._shift_tags(a, shift, orig_text)
+        # Try to determine whether a tag at position a would be an opening
+        # or a closing tag, i.e. attached to the next or the previous word.
+        opening = a < len(orig_text) and not orig_text[a].isspace()
+        self._shift_tags(a, shift, opening)
+
+    def _replace_spans(self, spans):
+        """Replace text at `spans` with :attr:`replacement`."""
+        orig_text = self.text
+        aeidon.Finder._replace_spans(self, spans)
+        shift = 0
+        for a, z in spans:
+            change = len(self.replacement) - (z - a)
+            opening = not orig_text[a].isspace()
+            self._shift_tags(a + shift, change, opening)
+            shift += change
 
     def _set_margins(self, text):
         """Find the margin markup tags in `text` if such exist."""
@@ -115,14 +137,17 @@ class Parser(aeidon.Finder):
 
     def _set_tags(self, text):
         """Find markup tags in `text`."""
+        removed = 0
         for match in self.re_tag.finditer(text):
             a, z = match.span()
-            self._tags.append([a, text[a:z]])
+            self._tags.append([a - removed, text[a:z]])
+            removed += z - a
 
     def set_text(self, text):
         """Set the target text to search in and parse it."""
         aeidon.Finder.set_text(self, text)
         self._margins = []
+        self._pending = (0, 0, 0)
         self._tags = []
         if self.re_tag is None: return
         if text.count("\n"):
@@ -131,36 +156,42 @@ class Parser(aeidon.Finder):
             self._set_tags(text)
         self.text = self.re_tag.sub("", text)
 
-    def _shift_tags(self, pos, shift, orig_text):
-        """Shift all markup tags after `pos`."""
+    def _settle_tags(self):
+        """Apply pending shifts to positions of markup tags."""
+        index, floor, shift = self._pending
+        for tag in self._tags[index:]:
+            tag[0] = max(floor, tag[0] + shift)
+        self._pending = (len(self._tags), 0, 0)
+
+    def _shift_tags(self, pos, shift, opening):
+        """
+        Shift all markup tags after `pos` by `shift`.
+
+        `opening` should be ``True`` if a tag at `pos` would be an opening
+        tag, i.e. attached to the next word instead of the previous.
+        """
         if not shift: return
         if not self._tags: return
-        # Try to determine whether a tag at position pos would be an opening
-        # or a closing tag, i.e. attached to the next or the previous word.
-        opening = True
-        if pos < len(orig_text):
-            if orig_text[pos].isspace():
-                opening = False
-        elif pos == len(orig_text):
-            opening = False
-        closing = not opening
-        # Get length of tags *before* position. Try to add strings (positive
-        # shift) inside tags and remove strings (negative shift) after tags.
-        pos_with_tags = pos
-        for tag_pos, tag in self._tags:
-            if shift > 0 and closing:
-                if tag_pos < pos_with_tags:
-                    pos_with_tags += len(tag)
-            elif tag_pos <= pos_with_tags:
-                pos_with_tags += len(tag)
-        between_length = 0
-        for i, (tag_pos, tag) in enumerate(self._tags):
-            orig_end = pos_with_tags - shift + between_length
-            if (shift < 0) and (pos_with_tags < tag_pos < orig_end):
-                # If tag is in the middle of what is being removed, it must be
-                # shifted to the start of the removal block, but not so far
-                # that it would overlap with preceding tags.
-                self._tags[i][0] = pos_with_tags + between_length
-                between_length += len(tag)
-            elif tag_pos >= pos_with_tags:
-                self._tags[i][0] += shift
+        # Try to add strings (positive shift) inside tags and remove strings
+        # (negative shift) after tags. Tags in the middle of what is being
+        # removed are shifted to the start of the removal block.
+        if shift > 0 and not opening:
+            stays = lambda x: x < pos
+        else: # Removal or opening tag
+            stays = lambda x: x <= pos
+        # Shifts are left pending for tags after the latest edit, which
+        # makes a series of edits from start to end, such as replacing
+        # all matches, linear instead of quadratic in the amount of tags.
+        index, floor, total = self._pending
+        if index > 0 and not stays(self._tags[index-1][0]):
+            self._settle_tags()
+            index, floor, total = self._pending
+            while index > 0 and not stays(self._tags[index-1][0]):
+                index -= 1
+        while index < len(self._tags):
+            tag_pos = max(floor, self._tags[index][0] + total)
+            if not stays(tag_pos): break
+            self._tags[index][0] = tag_pos
+            index += 1
+        floor = max(floor + shift, pos) if shift < 0 else floor + shift
+        self._pending = (index, floor, total + shift)
@@ -19,7 +19,9 @@
 
 import aeidon
 import os
+import pickle
 import re
+import sys
 import xml.etree.ElementTree as ET
 
 __all__ = ("PatternManager",)
@@ -30,18 +32,25 @@ class PatternManager:
     """
     Managing regular expression substitutions for subtitle texts.
 
+    :ivar _filtered: Dictionary mapping code tuples to filtered patterns
     :ivar _patterns: Dictionary mapping codes to pattern lists
     :ivar pattern_type: String to indentify what the pattern matches
 
     :attr:`pattern_type` should be a string with value "line-break",
     "common-error", "capitalization" or "hearing-impaired". Codes are of form
     ``Script[-language-[COUNTRY]]`` using the corresponding ISO codes.
+
+    Parsed patterns and filtered pattern lists for all codes found are cached
+    on disk in :attr:`aeidon.CACHE_HOME_DIR`. The cache is used as long as
+    the paths, modification times and sizes of all pattern and configuration
+    files match those the cache was written from.
     """
     _re_comment = re.compile(r"^\s*#.*$")
 
     def __init__(self, pattern_type):
         """Initialize a :class:`PatternManager` instance."""
         self.pattern_type = pattern_type
+        self._filtered = {}
         self._patterns = {}
         self._read_patterns()
 
@@ -55,20 +64,20 @@ class PatternManager:
         Order is maintained so that all patterns with the same name are always
         located in the position of the earliest of such patterns.
         """
-        filtered_patterns = []
+        # Group patterns by name in order of first appearance.
+        groups = {}
         for pattern in patterns:
-            name = pattern.get_name(False)
-            policy = pattern.get_field("Policy")
-            last_index = len(filtered_patterns) - 1
-            for j, filtered_pattern in enumerate(filtered_patterns):
-                if filtered_pattern.get_name() == name:
-                    last_index = j
-                    if policy == "Replace":
-                        filtered_patterns[j] = None
-            filtered_patterns.insert(last_index+1, pattern)
-            while None in filtered_patterns:
-                filtered_patterns.remove(None)
-        return filtered_patterns
+            name = pattern.get_name(localize=False)
+            if pattern.get_field("Policy") == "Replace":
+                groups[name] = [pattern]
+            else: # Append
+                groups.setdefault(name, []).append(pattern)
+        return [x for group in groups.values() for x in group]
+
+    def _get_cache_path(self):
+        """Return path to the cache file."""
+        basename = "{}.pickle".format(self.pattern_type)
+        return os.path.join(aeidon.CACHE_HOME_DIR, "patterns", basename)
 
     def _get_codes(self, script=None, language=None, country=None):
         """Return a sequence of all codes to be used by arguments."""
@@ -81,6 +90,12 @@ class PatternManager:
             codes.append("{}-{}-{}".format(script, language, country))
         return tuple(codes)
 
+    def _get_directories(self):
+        """Return pattern data and configuration directories."""
+        return (os.path.join(aeidon.DATA_DIR, "patterns"),
+                os.path.join(aeidon.DATA_HOME_DIR, "patterns"),
+                os.path.join(aeidon.CONFIG_HOME_DIR, "patterns"))
+
     def get_countries(self, script, language):
         """Return a sequence of countries for which patterns exist."""
         codes = list(self._patterns.keys())
@@ -99,8 +114,10 @@ class PatternManager:
 
     def get_patterns(self, script=None, language=None, country=None):
         """Return patterns for `script`, `language` and `country`."""
-        patterns = []
         codes = self._get_codes(script, language, country)
+        if codes in self._filtered:
+            return list(self._filtered[codes])
+        patterns = []
         for code in codes:
             for pattern in self._patterns.get(code, []):
                 # Skip patterns that define exceptions to their use
@@ -108,7 +125,8 @@ class PatternManager:
                 skip = pattern.get_field_list("SkipIn", [])
                 if set(skip) & set(codes): continue
                 patterns.append(pattern)
-        return self._filter_patterns(patterns)
+        self._filtered[codes] = self._filter_patterns(patterns)
+        return list(self._filtered[codes])
 
     def get_scripts(self):
         """Return a sequence of scripts for which patterns exist."""
@@ -118,6 +136,34 @@ class PatternManager:
         scripts = [x.split("-")[0] for x in codes]
         return tuple(aeidon.util.get_unique(scripts))
 
+    def _get_stamp(self):
+        """Return a tuple identifying all files patterns are read from."""
+        stamp = [aeidon.__version__]
+        extensions = tuple(".{}{}".format(self.pattern_type, x)
+                           for x in ("", ".in", ".conf"))
+
+        for directory in self._get_directories():
+            if not os.path.isdir(directory): continue
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith(extensions): continue
+                path = os.path.join(directory, name)
+                st = os.stat(path)
+                stamp.append((path, st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def _read_cache(self, stamp):
+        """Read patterns from cache and return ``True`` if it matches."""
+        path = self._get_cache_path()
+        if not os.path.isfile(path): return False
+        with aeidon.util.silent(Exception):
+            with open(path, "rb") as f:
+                cache_stamp, patterns, filtered = pickle.load(f)
+            if cache_stamp != stamp: return False
+            self._patterns = patterns
+            self._filtered = filtered
+            return True
+        return False
+
     def _read_config_from_directory(self, directory, encoding):
         """Read configurations from files in `directory`."""
         if not os.path.isdir(directory): return
@@ -134,26 +180,35 @@ class PatternManager:
         extension = ".{}.conf".format(self.pattern_type)
         code = basename.replace(extension, "")
         if not code in self._patterns: return
-        patterns = self._patterns[code]
+        patterns = {}
+        for pattern in self._patterns[code]:
+            name = pattern.get_name(localize=False)
+            patterns.setdefault(name, []).append(pattern)
         for element in ET.parse(path).findall("pattern"):
             name = element.get("name")
             name = name.replace("&quot;", '"')
             name = name.replace("&amp;", "&")
             enabled = (element.get("enabled") == "true")
-            for pattern in patterns:
-                if pattern.get_name(localize=False) == name:
-                    pattern.enabled = enabled
+            for pattern in patterns.get(name, []):
+                pattern.enabled = enabled
 
     def _read_patterns(self):
-        """Read all patterns of :attr:`pattern_type` from files."""
-        data_dir = os.path.join(aeidon.DATA_DIR, "patterns")
-        data_home_dir = os.path.join(aeidon.DATA_HOME_DIR, "patterns")
-        config_home_dir = os.path.join(aeidon.CONFIG_HOME_DIR, "patterns")
+        """Read all patterns of :attr:`pattern_type` from cache or files."""
+        stamp = self._get_stamp()
+        if self._read_cache(stamp): return
+        data_dir, data_home_dir, config_home_dir = self._get_directories()
         encoding = aeidon.util.get_default_encoding()
         self._read_patterns_from_directory(data_dir, "utf_8")
         self._read_patterns_from_directory(data_home_dir, encoding)
         self._read_config_from_directory(data_dir, "utf_8")
         self._read_config_from_directory(config_home_dir, encoding)
+        self._validate_patterns()
+        for code in list(self._patterns.keys()):
+            # Filter patterns for all codes found in advance
+            # so that filtered lists are cached too.
+            args = [x for x in code.split("-") if x != "Zyyy"]
+            self.get_patterns(*args)
+        self._write_cache(stamp)
 
     def _read_patterns_from_directory(self, directory, encoding):
         """Read all patterns from files in `directory`."""
@@ -200,6 +255,31 @@ class PatternManager:
         for code in (x for x in codes if x in self._patterns):
             self._write_config_to_file(code, "utf_8")
 
+    def _validate_patterns(self):
+        """Remove patterns with invalid regular expressions."""
+        for code, patterns in self._patterns.items():
+            for pattern in patterns[:]:
+                try:
+                    re.compile(pattern.get_field("Pattern", ""),
+                               pattern.get_flags())
+                except (AttributeError, re.error) as error:
+                    print("Invalid pattern {} for {}: {}"
+                          .format(repr(pattern.get_name(False)),
+                                  repr(code),
+                                  str(error)),
+                          file=sys.stderr)
+                    patterns.remove(pattern)
+
+    def _write_cache(self, stamp):
+        """Write patterns and filtered patterns to cache."""
+        path = self._get_cache_path()
+        with aeidon.util.silent(Exception):
+            # Caching is an optimization, ignore any failures.
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with aeidon.util.atomic_open(path, "wb") as f:
+                pickle.dump((stamp, self._patterns, self._filtered),
+                            f, pickle.HIGHEST_PROTOCOL)
+
     def _write_config_to_file(self, code, encoding):
         """Write configurations of all patterns to file."""
         local_dir = os.path.join(aeidon.CONFIG_HOME_DIR, "patterns")
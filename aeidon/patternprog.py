@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Regular expression substitutions compiled for use on many texts."""
+
+import re
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+__all__ = ("PatternProgram",)
+
+
+class PatternProgram:
+
+    """
+    Regular expression substitutions compiled for use on many texts.
+
+    :ivar substitutions: List of regular expression, replacement, repeat,
+                         required characters
+
+    Substitutions are compiled once from a sequence of
+    :class:`aeidon.Pattern` instances and applied in the same order as the
+    patterns. Each substitution has a prefilter of characters derived from
+    its regular expression that a text must contain for the regular
+    expression to be able to match. The prefilter is checked with set
+    operations against the characters of the text, followed by a single
+    regular expression search, so that only substitutions that actually
+    match are passed on to :meth:`aeidon.Parser.replace_all`.
+    """
+
+    def __init__(self, patterns, repeat=True):
+        """
+        Initialize a :class:`PatternProgram` instance.
+
+        `repeat` should be ``False`` to ignore the ``Repeat`` field of
+        `patterns` and apply each substitution only once.
+        Raise :exc:`re.error` if a bad regular expression among `patterns`.
+        """
+        self.substitutions = []
+        for pattern in patterns:
+            string = pattern.get_field("Pattern")
+            flags = pattern.get_flags()
+            self.substitutions.append((
+                re.compile(string, flags),
+                pattern.get_field("Replacement"),
+                repeat and bool(pattern.get_field_boolean("Repeat")),
+                self._get_required(string, flags),
+            ))
+
+    def apply(self, parser):
+        """
+        Apply substitutions to the text of `parser`.
+
+        Raise :exc:`re.error` if bad replacement.
+        Return the amount of substitutions made.
+        """
+        total = 0
+        chars = set(parser.text)
+        for regex, replacement, repeat, required in self.substitutions:
+            if not required[0] <= chars: continue
+            if (required[1] and
+                any(chars.isdisjoint(x) for x in required[1])): continue
+            if regex.search(parser.text) is None: continue
+            parser.pattern = regex
+            parser.replacement = replacement
+            count = parser.replace_all()
+            total += count
+            while repeat and count:
+                count = parser.replace_all()
+                total += count
+            chars = set(parser.text)
+        return total
+
+    def _get_required(self, string, flags):
+        """
+        Return characters required for `string` to match.
+
+        Return a tuple of a set of characters that all need to be present and
+        a tuple of sets of characters, of which at least one character from
+        each set needs to be present.
+        """
+        try:
+            subpattern = sre_parse.parse(string, flags)
+            if subpattern.state.flags & re.IGNORECASE:
+                return (frozenset(), ())
+            required = set(self._get_required_from(subpattern))
+        except Exception:
+            # Prefilters are only an optimization, if the parse tree
+            # is not what is expected, check with the regex alone.
+            return (frozenset(), ())
+        return (frozenset().union(*(x for x in required if len(x) == 1)),
+                tuple(x for x in required if len(x) > 1))
+
+    def _get_required_from(self, subpattern):
+        """Return a list of sets of characters required by `subpattern`."""
+        c = sre_constants
+        required = []
+        for op, av in subpattern:
+            if op == c.LITERAL:
+                required.append(frozenset(chr(av)))
+            elif op == c.IN:
+                if not all(x[0] == c.LITERAL for x in av): continue
+                required.append(frozenset(chr(x[1]) for x in av))
+            elif op == c.SUBPATTERN:
+                if av[1] & re.IGNORECASE: continue
+                required.extend(self._get_required_from(av[-1]))
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                if av[0] < 1: continue
+                required.extend(self._get_required_from(av[2]))
+            elif op == c.ASSERT:
+                required.extend(self._get_required_from(av[1]))
+            elif op == c.BRANCH:
+                # Any alternative can match, so require
+                # the first requirement of any alternative.
+                alternatives = [self._get_required_from(x) for x in av[1]]
+                if not all(alternatives): continue
+                required.append(frozenset().union(
+                    *(x[0] for x in alternatives)))
+        return required
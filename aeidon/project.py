@@ -18,6 +18,7 @@
 """Model for subtitle data."""
 
 import aeidon
+import contextlib
 
 __all__ = ("Project",)
 
@@ -57,8 +58,10 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
+    :ivar columnar: ``True`` to keep subtitles in a :class:`aeidon.SubtitleStore`
     :ivar _delegations: Dictionary mapping method names to agent methods
     :ivar framerate: :attr:`aeidon.framerates` item corresponding to video
+    :ivar lazy: ``True`` to parse subtitles of main file only when accessed
     :ivar main_changed: Integer, status of main document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -66,8 +69,18 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one and undoing decreases value by one.
 
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
-    :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar mapped: ``True`` to read files with :meth:`SubtitleFile.read_mapped`
+    :ivar redoables: :class:`aeidon.RevertableStack` of actions to redo
+    :ivar _signal_batch: :class:`aeidon.SignalBatch` collecting or ``None``
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
+
+       If :attr:`columnar` is ``True``, an :class:`aeidon.SubtitleStore`
+       instead, which uses far less memory for large amounts of subtitles
+       and allows position operations to be done on whole columns at once.
+       If :attr:`lazy` is ``True`` and the main file can be indexed, an
+       :class:`aeidon.LazySubtitleList` instead, which parses subtitles only
+       once accessed.
+
     :ivar tran_changed: Integer, status of translation document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -75,8 +88,20 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one  and undoing decreases value by one.
 
     :ivar tran_file: Translation instance of :class:`aeidon.SubtitleFile`
+    :ivar undo_coalesce_time: Seconds to merge edits of one field or None
+
+       Consecutive edits of the same field of the same subtitle, done within
+       this many seconds of the previous, are merged into one action, which
+       reverts the field to its value before the first edit.
+
     :ivar undo_limit: Maximum size of undo/redo stacks or None for no limit
-    :ivar undoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar undo_memory_limit: Maximum memory use of undo/redo stacks or None
+
+       Memory use is estimated in bytes separately for both stacks. Actions
+       are discarded, oldest first, until within limit, but the most recent
+       action is always kept.
+
+    :ivar undoables: :class:`aeidon.RevertableStack` of actions to undo
     :ivar video_path: Full, absolute path to the video file on disk
 
     Signals and their arguments for callback functions:
@@ -111,25 +136,66 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "translation-texts-changed",
     )
 
-    def __init__(self, framerate=None):
+    def __init__(self, framerate=None, columnar=False, lazy=False,
+                 mapped=False):
         """Initialize a :class:`Project` instance."""
         aeidon.Observable.__init__(self)
         framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
+        self.columnar = columnar
         self._delegations = {}
+        self._signal_batch = None
         self.framerate = framerate
+        self.lazy = lazy
         self.main_changed = 0
         self.main_file = None
-        self.redoables = []
-        self.subtitles = []
+        self.mapped = mapped
+        self.redoables = aeidon.RevertableStack()
+        self.subtitles = (aeidon.SubtitleStore(framerate=framerate)
+                          if columnar else [])
+
         self.tran_changed = None
         self.tran_file = None
+        self.undo_coalesce_time = None
         self.undo_limit = 100000
-        self.undoables = []
+        self.undo_memory_limit = None
+        self.undoables = aeidon.RevertableStack()
         self.video_path = None
         self._init_delegations()
 
+    @contextlib.contextmanager
+    def batch_signals(self):
+        """
+        Collect row signals and emit each only once when done.
+
+        Signals with indices as the only argument, i.e. ``*-changed``,
+        ``subtitles-inserted`` and ``subtitles-removed``, are not emitted
+        within the context, but collected and emitted once at its end with
+        indices merged and translated. ``subtitles-removed`` is emitted first
+        with indices before any changes, followed by ``subtitles-inserted``
+        and other signals with final indices. Nested calls do nothing.
+        """
+        if self._signal_batch is not None:
+            yield
+            return
+        batch = self._signal_batch = aeidon.SignalBatch()
+        try:
+            yield
+        finally:
+            self._signal_batch = None
+            for signal, indices in batch.get_emissions():
+                self.emit(signal, indices)
+
+    def emit(self, signal, *args):
+        """Send notification of ``signal`` or collect it if batching."""
+        if (self._signal_batch is not None and
+            signal in self._signal_batch.signals and
+            not self._blocked_state and
+            not signal in self._blocked_signals):
+            return self._signal_batch.add(signal, *args)
+        return aeidon.Observable.emit(self, signal, *args)
+
     def __getattr__(self, name):
         """Return method delegated to an agent."""
         try:
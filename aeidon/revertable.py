@@ -18,8 +18,33 @@
 """Actions that can be reverted, i.e. undone and redone."""
 
 import aeidon
+import collections
+import sys
 
-__all__ = ("RevertableAction", "RevertableActionGroup",)
+__all__ = ("RevertableAction", "RevertableActionGroup", "RevertableStack",)
+
+
+def _get_size(value, seen):
+    """Return estimated memory use of `value` in bytes."""
+    if id(value) in seen: return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float)):
+        return size
+    if isinstance(value, dict):
+        items = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set, frozenset, collections.deque)):
+        items = list(value)
+    elif hasattr(value, "__dict__") and not callable(value):
+        items = list(vars(value).values())
+    else: # Function or object without a dictionary.
+        return size
+    if not items: return size
+    # Estimate large collections, e.g. copies of all subtitles,
+    # from a sample of items to keep registering actions fast.
+    sample = items[::max(1, len(items) // 100)]
+    sample_size = sum(_get_size(x, seen) for x in sample)
+    return size + round(sample_size * len(items) / len(sample))
 
 
 class RevertableAction:
@@ -33,6 +58,10 @@ class RevertableAction:
     :ivar revert_args: Arguments passed to the revert method
     :ivar revert_function: Method called to revert this action
     :ivar revert_kwargs: Keyword arguments passed to the revert method
+    :ivar target: Hashable identifier of the single field changed or None
+
+    Consecutive actions with equal, not ``None`` :attr:`target` can be merged
+    into the first one, which reverts the field to its original value.
     """
 
     def __init__(self, **kwargs):
@@ -50,6 +79,8 @@ class RevertableAction:
         self.revert_args = ()
         self.revert_function = None
         self.revert_kwargs = {}
+        self.target = None
+        self._size = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -62,6 +93,16 @@ class RevertableAction:
         raise ValueError("Invalid register: {}"
                          .format(repr(self.register)))
 
+    def get_size(self):
+        """Return estimated memory use of reversion arguments in bytes."""
+        if self._size is None:
+            seen = set()
+            self._size = (sys.getsizeof(self) +
+                          _get_size(self.revert_args, seen) +
+                          _get_size(self.revert_kwargs, seen))
+
+        return self._size
+
     def revert(self):
         """Call the reversion function."""
         kwargs = self.revert_kwargs.copy()
@@ -90,3 +131,137 @@ class RevertableActionGroup:
         self.description = None
         for key, value in kwargs.items():
             setattr(self, key, value)
+
+    def get_size(self):
+        """Return estimated memory use of reversion arguments in bytes."""
+        return sum(x.get_size() for x in self.actions)
+
+
+class RevertableStack(collections.deque):
+
+    """
+    Stack of revertable actions with the most recent action first.
+
+    :ivar journal: :class:`aeidon.UndoJournal` to page actions out to or None
+    :ivar resident_limit: Amount of most recent actions to keep in memory
+    :ivar _resident: Amount of most recent actions not yet paged out
+    :ivar _size: Estimated memory use of actions or ``None`` if not known
+
+    Actions are pushed and popped at the left end and discarded, oldest
+    first, from the right end, all of which take constant time. Memory use
+    is estimated only once first asked for, after which only
+    :meth:`appendleft`, :meth:`clear`, :meth:`pop` and :meth:`popleft`
+    keep it up to date.
+
+    If :attr:`journal` is set, all but :attr:`resident_limit` most recent
+    actions are replaced with :class:`aeidon.JournalEntry` instances and
+    read back from the journal when they become the most recent action.
+    Actions that cannot be written to the journal are kept in memory among
+    the entries.
+    """
+
+    def __init__(self):
+        """Initialize a :class:`RevertableStack` instance."""
+        collections.deque.__init__(self)
+        self.journal = None
+        self.resident_limit = None
+        self._resident = None
+        self._size = None
+
+    def appendleft(self, action):
+        """Push `action` to the top of the stack."""
+        collections.deque.appendleft(self, action)
+        if self._size is not None:
+            self._size += action.get_size()
+        if self.journal is not None:
+            self._resident += 1
+            self._page_out()
+
+    def clear(self):
+        """Remove all actions from the stack."""
+        while self.journal is not None and len(self) > self._resident:
+            action = collections.deque.pop(self)
+            if isinstance(action, aeidon.JournalEntry):
+                self.journal.discard(action)
+        collections.deque.clear(self)
+        if self._size is not None:
+            self._size = 0
+        if self.journal is not None:
+            self._resident = 0
+
+    def _page_in(self):
+        """Read the most recent action back if paged out."""
+        if self.journal is None: return
+        if self._resident > 0 or not self: return
+        self._resident = 1
+        entry = self[0]
+        if not isinstance(entry, aeidon.JournalEntry): return
+        action = self.journal.load(entry)
+        self[0] = action
+        if self._size is not None:
+            self._size += action.get_size() - entry.get_size()
+
+    def _page_out(self):
+        """Write the oldest actions in memory to journal if over limit."""
+        # Always keep the most recent action in memory to allow
+        # checking its type and description without reading it.
+        while self._resident > max(1, self.resident_limit):
+            action = self[self._resident - 1]
+            self._resident -= 1
+            try:
+                entry = self.journal.store(action)
+            except ValueError:
+                # Keep actions that cannot be written in memory
+                # and continue paging out newer actions past them.
+                continue
+            self[self._resident] = entry
+            if self._size is not None:
+                self._size += entry.get_size() - action.get_size()
+
+    def pop(self):
+        """Remove and return the oldest action or its journal entry."""
+        action = collections.deque.pop(self)
+        if self._size is not None:
+            self._size -= action.get_size()
+        if self.journal is not None:
+            if len(self) < self._resident:
+                self._resident -= 1
+            elif isinstance(action, aeidon.JournalEntry):
+                self.journal.discard(action)
+        return action
+
+    def popleft(self):
+        """Remove and return the most recent action."""
+        action = collections.deque.popleft(self)
+        if self._size is not None:
+            self._size -= action.get_size()
+        if self.journal is not None:
+            self._resident -= 1
+            self._page_in()
+        return action
+
+    def set_journal(self, journal, resident_limit=1000):
+        """
+        Page all but `resident_limit` most recent actions out to `journal`.
+
+        `journal` can be ``None`` to read all actions back into memory.
+        """
+        if self.journal is not None:
+            for i in range(self._resident, len(self)):
+                entry = self[i]
+                if not isinstance(entry, aeidon.JournalEntry): continue
+                self[i] = self.journal.load(entry)
+                if self._size is not None:
+                    self._size += self[i].get_size() - entry.get_size()
+        self.journal = journal
+        self.resident_limit = resident_limit
+        self._resident = len(self)
+        if journal is not None:
+            self._page_out()
+
+    @property
+    def size(self):
+        """Return estimated memory use of actions in bytes."""
+        if self._size is None:
+            self._size = sum(x.get_size() for x in self)
+        return self._size
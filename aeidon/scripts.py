@@ -18,7 +18,6 @@
 """Names and ISO 15924 codes for scripts and conversions between them."""
 
 import aeidon
-import os
 
 from aeidon.i18n import d_
 
@@ -27,17 +26,7 @@ _scripts = {}
 
 def _init_scripts():
     """Initialize the dictionary mapping codes to scripts."""
-    import xml.etree.ElementTree as ET
-    path = "/usr/share/xml/iso-codes/iso_15924.xml"
-    if not os.path.isfile(path):
-        # Prefer files part of the iso-codes installation,
-        # use bundled copy as fallback.
-        path = os.path.join(aeidon.DATA_DIR, "iso-codes", "iso_15924.xml")
-    for element in ET.parse(path).findall("iso_15924_entry"):
-        code = element.get("alpha_4_code", None)
-        name = element.get("name", None)
-        if not code or not name: continue
-        _scripts[code] = name
+    _scripts.update(aeidon.util.read_iso_codes("iso_15924", "alpha_4_code"))
 
 def code_to_name(code):
     """Convert ISO 15924 `code` to localized script name."""
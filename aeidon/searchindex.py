@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Index of trigrams in texts for finding candidates for matches."""
+
+import array
+import bisect
+import heapq
+import itertools
+import re
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+__all__ = ("SearchIndex",)
+
+
+class SearchIndex:
+
+    """
+    Index of trigrams in texts for finding candidates for matches.
+
+    :ivar changes: Amount of texts changed, inserted or removed since building
+    :ivar dirty: Set of indices of texts changed or inserted since building
+    :ivar _edits: List of inserted or removed indices since building
+    :ivar _postings: Dictionary mapping trigrams to arrays of indices
+    :ivar size: Amount of texts
+
+    Texts are indexed by trigrams of their lower case versions, so that
+    the same index serves both case-sensitive and case-insensitive string
+    patterns. A string pattern, or a regular expression containing a
+    literal string, can only match in texts that contain all trigrams of
+    that string. Candidates are only a superset of texts with matches and
+    need to be checked with an actual search.
+
+    Changed and inserted texts are not indexed, but given as candidates for
+    any pattern via :attr:`dirty` until the index is built again. Indices
+    of texts indexed are translated to current indices via :attr:`_edits`.
+    """
+
+    def __init__(self, texts=()):
+        """Initialize a :class:`SearchIndex` instance."""
+        self.changes = 0
+        self.dirty = set()
+        self._edits = []
+        self._postings = {}
+        self.size = 0
+        self.build(texts)
+
+    def _bisect(self, posting, index):
+        """Return position of the first item not before current `index`."""
+        a, z = 0, len(posting)
+        while a < z:
+            i = (a + z) // 2
+            if self._translate(posting[i])[0] < index:
+                a = i + 1
+            else: # Not before index.
+                z = i
+        return a
+
+    def build(self, texts):
+        """Index `texts`, discarding anything indexed before."""
+        self.changes = 0
+        self.dirty = set()
+        self._edits = []
+        self._postings = {}
+        self.size = 0
+        for index, text in enumerate(texts):
+            text = self._normalize(text)
+            for gram in set(text[i:i+3] for i in range(len(text) - 2)):
+                if not gram in self._postings:
+                    self._postings[gram] = array.array("l")
+                self._postings[gram].append(index)
+            self.size += 1
+
+    def _contains(self, posting, index):
+        """Return ``True`` if sorted `posting` contains `index`."""
+        i = bisect.bisect_left(posting, index)
+        return i < len(posting) and posting[i] == index
+
+    def _get_literal(self, pattern):
+        """Return the longest literal string in `pattern` or ``None``."""
+        if isinstance(pattern, str):
+            return pattern
+        if pattern.flags & re.IGNORECASE:
+            return None
+        try:
+            subpattern = sre_parse.parse(pattern.pattern, pattern.flags)
+        except Exception:
+            # Literals are only an optimization, if the pattern
+            # cannot be parsed, check all texts.
+            return None
+        # Only consider literals at the top level of the expression,
+        # since those are required for any match.
+        literals = [""]
+        for op, av in subpattern:
+            if op == sre_constants.LITERAL:
+                literals[-1] += chr(av)
+            else: # Anything else breaks the literal.
+                literals.append("")
+        return max(literals, key=len)
+
+    def insert(self, indices):
+        """Insert new texts at `indices`."""
+        indices = tuple(sorted(indices))
+        self.dirty = set(self._insert(x, indices) for x in self.dirty)
+        self.dirty.update(indices)
+        self._edits.append((True, indices))
+        self.changes += len(indices)
+        self.size += len(indices)
+
+    def _insert(self, index, indices):
+        """Return `index` shifted by texts inserted at `indices`."""
+        for i in indices:
+            if i > index: break
+            index += 1
+        return index
+
+    def iter_candidates(self, pattern, start, stop, reverse=False,
+                        include=()):
+        """
+        Return an iterator over indices of texts that can match `pattern`.
+
+        `pattern` can be a string or a regular expression object. Indices are
+        limited to ``range(start, stop)`` and in ascending order or if
+        `reverse` is ``True`` in descending order. `include` can be given
+        indices to always include. Return ``None`` if `pattern` has no
+        literal long enough to look up in the index.
+        """
+        literal = self._get_literal(pattern)
+        if literal is None: return None
+        literal = self._normalize(literal)
+        if len(literal) < 3: return None
+        grams = set(literal[i:i+3] for i in range(len(literal) - 2))
+        empty = array.array("l")
+        postings = [self._postings.get(x, empty) for x in grams]
+        postings.sort(key=len)
+        candidates = self._iter_postings(postings, start, stop, reverse)
+        extra = sorted((x for x in itertools.chain(self.dirty, include)
+                        if start <= x < stop), reverse=reverse)
+
+        if not extra:
+            return candidates
+        return self._iter_unique(
+            heapq.merge(candidates, extra, reverse=reverse))
+
+    def _iter_postings(self, postings, start, stop, reverse):
+        """Iterate over current indices found in all `postings`."""
+        first, rest = postings[0], postings[1:]
+        a = self._bisect(first, start)
+        z = self._bisect(first, stop)
+        for i in (reversed(range(a, z)) if reverse else range(a, z)):
+            if not all(self._contains(x, first[i]) for x in rest): continue
+            index, removed = self._translate(first[i])
+            if not removed:
+                yield index
+
+    def _iter_unique(self, indices):
+        """Iterate over `indices`, skipping consecutive duplicates."""
+        prev = None
+        for index in indices:
+            if index != prev:
+                yield index
+            prev = index
+
+    def _normalize(self, text):
+        """Return `text` in lower case with all sigmas as non-final."""
+        # Python lower cases capital sigma by context, which would make
+        # lower cased substrings differ from substrings of lower cased text.
+        return text.lower().replace("ς", "σ")
+
+    def remove(self, indices):
+        """Remove texts at `indices`."""
+        indices = tuple(sorted(indices))
+        self.dirty = set(x - bisect.bisect_left(indices, x)
+                         for x in self.dirty
+                         if not self._contains(indices, x))
+
+        self._edits.append((False, indices))
+        self.changes += len(indices)
+        self.size -= len(indices)
+
+    def _translate(self, index):
+        """
+        Translate `index` of indexed text to current index.
+
+        Return current index and ``True`` if text has been removed, in which
+        case current index is that of the first text after it.
+        """
+        removed = False
+        for inserted, indices in self._edits:
+            if inserted:
+                index = self._insert(index, indices)
+                continue
+            i = bisect.bisect_left(indices, index)
+            if i < len(indices) and indices[i] == index:
+                removed = True
+            index -= i
+        return index, removed
+
+    def update(self, indices):
+        """Mark texts at `indices` as changed."""
+        indices = set(indices)
+        self.changes += len(indices - self.dirty)
+        self.dirty.update(indices)
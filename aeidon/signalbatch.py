@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Row signals collected to be emitted only once each."""
+
+import bisect
+
+__all__ = ("SignalBatch",)
+
+
+class SignalBatch:
+
+    """
+    Row signals collected to be emitted only once each.
+
+    :cvar signals: Tuple of signals with indices as the only argument
+    :ivar changed: Dictionary mapping signals to sets of current indices
+    :ivar inserted: Sorted list of current indices of inserted subtitles
+    :ivar removed: Sorted list of original indices of removed subtitles
+
+    Indices of ``subtitles-inserted`` are positions after inserting and
+    indices of ``subtitles-removed`` positions before removing. Indices of
+    other signals are current positions at the time of emission. Collected,
+    indices are translated so that emitting ``subtitles-removed`` with
+    original indices, followed by ``subtitles-inserted`` and then the rest
+    with final indices, is equivalent to the signals emitted separately.
+    """
+
+    signals = (
+        "main-texts-changed",
+        "positions-changed",
+        "subtitles-changed",
+        "subtitles-inserted",
+        "subtitles-removed",
+        "translation-texts-changed",
+    )
+
+    def __init__(self):
+        """Initialize a :class:`SignalBatch` instance."""
+        self.changed = {}
+        self.inserted = []
+        self.removed = []
+
+    def add(self, signal, indices):
+        """Collect emission of `signal` with `indices`."""
+        if signal == "subtitles-inserted":
+            return self.insert(indices)
+        if signal == "subtitles-removed":
+            return self.remove(indices)
+        self.changed.setdefault(signal, set()).update(indices)
+
+    def get_emissions(self):
+        """Return a list of tuples of signals to emit and their indices."""
+        emissions = []
+        if self.removed:
+            emissions.append(("subtitles-removed", list(self.removed)))
+        if self.inserted:
+            emissions.append(("subtitles-inserted", list(self.inserted)))
+        inserted = set(self.inserted)
+        for signal, indices in self.changed.items():
+            # Inserted subtitles are emitted whole.
+            indices = sorted(indices - inserted)
+            if indices:
+                emissions.append((signal, indices))
+        return emissions
+
+    def _get_original(self, index):
+        """Return original index of a not inserted subtitle at `index`."""
+        index -= bisect.bisect_left(self.inserted, index)
+        for i in self.removed:
+            if i > index: break
+            index += 1
+        return index
+
+    def insert(self, indices):
+        """Insert new subtitles at `indices`."""
+        indices = sorted(indices)
+        self.inserted = [self._insert(x, indices) for x in self.inserted]
+        for signal in self.changed:
+            self.changed[signal] = set(self._insert(x, indices)
+                                       for x in self.changed[signal])
+
+        for index in indices:
+            bisect.insort(self.inserted, index)
+
+    def _insert(self, index, indices):
+        """Return `index` shifted by subtitles inserted at `indices`."""
+        for i in indices:
+            if i > index: break
+            index += 1
+        return index
+
+    def remove(self, indices):
+        """Remove subtitles at `indices`."""
+        indices = sorted(indices)
+        removed = set(indices)
+        inserted = set(self.inserted)
+        originals = [self._get_original(x)
+                     for x in indices if not x in inserted]
+
+        for index in originals:
+            bisect.insort(self.removed, index)
+        self.inserted = [x - bisect.bisect_left(indices, x)
+                         for x in self.inserted if not x in removed]
+
+        for signal in self.changed:
+            self.changed[signal] = set(x - bisect.bisect_left(indices, x)
+                                       for x in self.changed[signal]
+                                       if not x in removed)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Detecting properties of subtitle files from a prefix read once."""
+
+import aeidon
+import codecs
+import os
+import re
+
+__all__ = ("Sniffer",)
+
+
+class Sniffer:
+
+    """
+    Detecting properties of subtitle files from a prefix read once.
+
+    :cvar size: Default maximum amount of bytes to read as prefix
+    :ivar bytes_read: Amount of bytes read from file so far
+    :ivar complete: ``True`` if :attr:`prefix` contains the whole file
+    :ivar path: Full, absolute path to the file on disk
+    :ivar prefix: Bytes read from the beginning of the file
+
+    BOM, encoding, newline type and format are all detected from
+    :attr:`prefix`. The rest of the file is read only if detecting encoding
+    or format is not conclusive based on the prefix alone. If
+    :attr:`complete` is ``True``, :attr:`prefix` can be given to
+    :class:`aeidon.SubtitleFile` as its :attr:`data` to avoid reading again.
+    """
+
+    _re_formats = {}
+    size = 65536
+
+    def __init__(self, path, size=None):
+        """Initialize a :class:`Sniffer` instance."""
+        size = size or self.size
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as f:
+            self.prefix = f.read(size)
+        self.bytes_read = len(self.prefix)
+        self.complete = len(self.prefix) < size
+
+    def detect_bom(self):
+        """Return corresponding encoding if BOM found, else ``None``."""
+        return aeidon.encodings.find_bom(self.prefix)
+
+    def detect_encoding(self):
+        """
+        Detect the encoding of file and return code or ``None``.
+
+        Raise :exc:`IOError` if reading fails.
+        """
+        bom_encoding = self.detect_bom()
+        if bom_encoding is not None:
+            return bom_encoding
+        from chardet import universaldetector
+        detector = universaldetector.UniversalDetector()
+        detector.feed(self.prefix)
+        if not detector.done and not self.complete:
+            with open(self.path, "rb") as f:
+                f.seek(len(self.prefix))
+                for line in f:
+                    self.bytes_read += len(line)
+                    detector.feed(line)
+                    if detector.done: break
+        detector.close()
+        code = detector.result["encoding"]
+        if code is None: return None
+        try:
+            # chardet returns what seem to be IANA names. They need to be
+            # translated to their Python equivalents. Some of the encodings
+            # returned by chardet are not supported by Python.
+            return aeidon.encodings.translate_code(code)
+        except ValueError:
+            return None
+
+    def detect_format(self, encoding):
+        """
+        Detect and return format of file.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Return an :attr:`aeidon.formats` enumeration item.
+        """
+        regex, formats = self._get_format_regex()
+        decoder = codecs.getincrementaldecoder(encoding)()
+        text = decoder.decode(self.prefix, final=self.complete)
+        text = self._normalize_newlines(text)
+        match = regex.search(text)
+        if match is None and not self.complete:
+            # Continue line by line, starting from the last line of
+            # the prefix, which could have been cut in the middle.
+            text = text[text.rfind("\n")+1:]
+            with open(self.path, "rb") as f:
+                f.seek(len(self.prefix))
+                for line in f:
+                    self.bytes_read += len(line)
+                    text += self._normalize_newlines(decoder.decode(line))
+                    match = regex.search(text)
+                    if match is not None: break
+                    text = ""
+            if match is None: decoder.decode(b"", final=True)
+        if match is None:
+            raise aeidon.FormatError("Failed to detect format of file {}"
+                                     .format(repr(self.path)))
+
+        for name, value in match.groupdict().items():
+            if value is not None:
+                return formats[name]
+
+    def detect_newline(self, encoding):
+        """Return the newline type of the first line or ``None``."""
+        decoder = codecs.getincrementaldecoder(encoding)("replace")
+        text = decoder.decode(self.prefix, final=self.complete)
+        match = re.search(r"\r\n|\r|\n", text)
+        if match is None: return None
+        return aeidon.newlines.find_item("value", match.group(0))
+
+    def _get_format_regex(self):
+        """Return regular expression matching any format and format names."""
+        identifiers = tuple(x.identifier for x in aeidon.formats)
+        if not identifiers in self._re_formats:
+            # Combine format identifiers into one regular expression of named
+            # alternatives, tried in order of formats for each line.
+            formats = dict(("f{:d}".format(i), x)
+                           for i, x in enumerate(aeidon.formats))
+
+            pattern = "|".join("(?P<f{:d}>{})".format(i, x)
+                               for i, x in enumerate(identifiers))
+
+            regex = re.compile(pattern, re.MULTILINE)
+            self._re_formats[identifiers] = (regex, formats)
+        return self._re_formats[identifiers]
+
+    def _normalize_newlines(self, text):
+        """Return `text` with all newlines converted to Unix newlines."""
+        return text.replace("\r\n", "\n").replace("\r", "\n")
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Columnar, array-backed storage of subtitles."""
+
+import aeidon
+import array
+import collections.abc
+import copy
+
+__all__ = ("SubtitleStore", "SubtitleView")
+
+
+class SubtitleStore(collections.abc.MutableSequence):
+
+    """
+    Columnar, array-backed storage of subtitles.
+
+    :ivar calc: :class:`aeidon.Calculator` instance used
+    :ivar framerate: :attr:`aeidon.framerates` item
+    :ivar mode: :attr:`aeidon.modes` item
+
+    Start and end positions are stored in arrays of integers in the native
+    unit of :attr:`mode`, i.e. milliseconds for times and frames for frames,
+    texts in plain lists and format-specific containers in a list that is
+    only filled for subtitles whose containers have been instantiated.
+
+    Items are returned as :class:`SubtitleView` instances, which are
+    lightweight :class:`aeidon.Subtitle` look-alikes that read and write
+    directly to the columns. Views refer to subtitles by index and are thus
+    valid only until subtitles are inserted or removed. Items inserted or
+    assigned are copied into the columns and items popped are returned as
+    detached :class:`aeidon.Subtitle` instances.
+    """
+
+    def __init__(self, mode=None, framerate=None, subtitles=()):
+        """Initialize a :class:`SubtitleStore` instance."""
+        self._mode = mode or aeidon.modes.TIME
+        self._framerate = framerate or aeidon.framerates.FPS_23_976
+        self.calc = aeidon.Calculator(self._framerate)
+        self._starts = array.array("q")
+        self._ends = array.array("q")
+        self._main_texts = []
+        self._tran_texts = []
+        self._containers = []
+        self.extend(subtitles)
+
+    def __delitem__(self, index):
+        """Remove subtitle at `index`."""
+        del self._starts[index]
+        del self._ends[index]
+        del self._main_texts[index]
+        del self._tran_texts[index]
+        del self._containers[index]
+
+    def __eq__(self, other):
+        """Compare subtitles by value with any sequence of subtitles."""
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return (len(self) == len(other) and
+                all(x == y for x, y in zip(self, other)))
+
+    __hash__ = None
+
+    def __getitem__(self, index):
+        """Return view of subtitle at `index` or a list of views."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            return [SubtitleView(self, i) for i in indices]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range: {}"
+                             .format(repr(index)))
+
+        return SubtitleView(self, index)
+
+    def __iter__(self):
+        """Iterate over views of all subtitles."""
+        for i in range(len(self)):
+            yield SubtitleView(self, i)
+
+    def __len__(self):
+        """Return the amount of subtitles."""
+        return len(self._starts)
+
+    def __setitem__(self, index, subtitle):
+        """Copy values of `subtitle` to `index`."""
+        start, end = self._get_native_positions(subtitle)
+        self._starts[index] = start
+        self._ends[index] = end
+        self._main_texts[index] = subtitle.main_text
+        self._tran_texts[index] = subtitle.tran_text
+        self._containers[index] = self._copy_containers(subtitle)
+
+    def convert_framerate(self, framerate):
+        """Set framerate and convert all positions to it."""
+        coefficient = framerate.value / self._framerate.value
+        for column in (self._starts, self._ends):
+            if self._mode == aeidon.modes.TIME:
+                column[:] = array.array("q", [
+                    round(x / coefficient) for x in column])
+            if self._mode == aeidon.modes.FRAME:
+                column[:] = array.array("q", [
+                    round(coefficient * x) for x in column])
+        self.framerate = framerate
+
+    def _copy_containers(self, subtitle):
+        """Return a dictionary of instantiated containers of `subtitle`."""
+        if isinstance(subtitle, SubtitleView):
+            containers = subtitle._store._containers[subtitle._index]
+            return copy.deepcopy(containers)
+        names = [x.container for x in aeidon.formats]
+        names = [x for x in names if x and subtitle.has_container(x)]
+        if not names: return None
+        return dict((x, copy.deepcopy(getattr(subtitle, x))) for x in names)
+
+    @property
+    def framerate(self):
+        """Return framerate."""
+        return self._framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate from `value`."""
+        self._framerate = value
+        self.calc = aeidon.Calculator(value)
+
+    def _get_native_positions(self, subtitle):
+        """Return start and end positions of `subtitle` as native values."""
+        if subtitle._mode == self._mode:
+            return subtitle._start, subtitle._end
+        return (self._to_native(subtitle.start),
+                self._to_native(subtitle.end))
+
+    def extend_positions(self, subtitles):
+        """Append positions of `subtitles` with blank texts."""
+        for subtitle in subtitles:
+            start, end = self._get_native_positions(subtitle)
+            self._starts.append(start)
+            self._ends.append(end)
+        count = len(self._starts) - len(self._main_texts)
+        self._main_texts.extend([""] * count)
+        self._tran_texts.extend([""] * count)
+        self._containers.extend([None] * count)
+
+    def get_subtitle(self, index):
+        """Return a detached :class:`aeidon.Subtitle` copy of `index`."""
+        subtitle = aeidon.Subtitle(self._mode, self._framerate)
+        subtitle._start = self._starts[index]
+        subtitle._end = self._ends[index]
+        subtitle.main_text = self._main_texts[index]
+        subtitle.tran_text = self._tran_texts[index]
+        containers = self._containers[index] or {}
+        for name, container in containers.items():
+            setattr(subtitle, name, copy.deepcopy(container))
+        return subtitle
+
+    def insert(self, index, subtitle):
+        """Insert a copy of `subtitle` at `index`."""
+        start, end = self._get_native_positions(subtitle)
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+        self._main_texts.insert(index, subtitle.main_text)
+        self._tran_texts.insert(index, subtitle.tran_text)
+        self._containers.insert(index, self._copy_containers(subtitle))
+
+    @property
+    def mode(self):
+        """Return current position mode."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set current position mode and convert all positions to it."""
+        if mode == self._mode: return
+        positions = {}
+        for name in ("_starts", "_ends"):
+            column = getattr(self, name)
+            positions[name] = [self._to_position(x) for x in column]
+        self._mode = mode
+        for name, values in positions.items():
+            column = array.array("q", map(self._to_native, values))
+            setattr(self, name, column)
+
+    def pop(self, index=-1):
+        """Remove and return a detached copy of subtitle at `index`."""
+        subtitle = self.get_subtitle(index)
+        del self[index]
+        return subtitle
+
+    def replace_positions(self, indices, subtitles):
+        """Replace positions at `indices` with those from `subtitles`."""
+        if (isinstance(subtitles, SubtitleStore) and
+            subtitles.mode == self._mode):
+            # Copy native values directly if possible.
+            for i, index in enumerate(indices):
+                self._starts[index] = subtitles._starts[i]
+                self._ends[index] = subtitles._ends[i]
+            return
+        for i, index in enumerate(indices):
+            start, end = self._get_native_positions(subtitles[i])
+            self._starts[index] = start
+            self._ends[index] = end
+
+    def scale_positions(self, value):
+        """Multiply all start and end positions by `value`."""
+        for column in (self._starts, self._ends):
+            column[:] = array.array("q", [round(x * value) for x in column])
+
+    def shift_positions(self, value):
+        """Add `value` to all start and end positions."""
+        value = self._to_native(value)
+        for column in (self._starts, self._ends):
+            column[:] = array.array("q", [x + value for x in column])
+
+    def sort(self):
+        """Sort subtitles by start position, keeping order of equals."""
+        order = sorted(range(len(self)), key=self._starts.__getitem__)
+        self._starts = array.array("q", [self._starts[i] for i in order])
+        self._ends = array.array("q", [self._ends[i] for i in order])
+        self._main_texts = [self._main_texts[i] for i in order]
+        self._tran_texts = [self._tran_texts[i] for i in order]
+        self._containers = [self._containers[i] for i in order]
+
+    def take(self, indices):
+        """Return a new detached store of subtitles at `indices`."""
+        store = SubtitleStore(self._mode, self._framerate)
+        store._starts = array.array("q", [self._starts[i] for i in indices])
+        store._ends = array.array("q", [self._ends[i] for i in indices])
+        store._main_texts = [self._main_texts[i] for i in indices]
+        store._tran_texts = [self._tran_texts[i] for i in indices]
+        store._containers = [copy.deepcopy(self._containers[i])
+                             for i in indices]
+
+        return store
+
+    def take_positions(self, indices):
+        """Return a new detached store of positions at `indices`."""
+        store = SubtitleStore(self._mode, self._framerate)
+        store._starts = array.array("q", [self._starts[i] for i in indices])
+        store._ends = array.array("q", [self._ends[i] for i in indices])
+        store._main_texts = [""] * len(store._starts)
+        store._tran_texts = [""] * len(store._starts)
+        store._containers = [None] * len(store._starts)
+        return store
+
+    def _to_native(self, pos):
+        """Return `pos` converted to native integer value."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.to_milliseconds(pos)
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.to_frame(pos)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
+
+    def _to_position(self, value):
+        """Return native integer `value` as time or frame."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(value)
+        if self._mode == aeidon.modes.FRAME:
+            return value
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
+
+
+class SubtitleView(aeidon.Subtitle):
+
+    """
+    Lightweight view of a subtitle in a :class:`SubtitleStore`.
+
+    Views are created by :class:`SubtitleStore` and read and write directly
+    to its columns. Mode and framerate are shared by all subtitles in a store
+    and setting either of them via a view will convert the whole store.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        """Initialize a :class:`SubtitleView` instance."""
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, name):
+        """Return lazily instantiated format-specific attribute container."""
+        if name in (x.container for x in aeidon.formats):
+            containers = self._store._containers[self._index]
+            if containers is None:
+                containers = self._store._containers[self._index] = {}
+            if not name in containers:
+                containers[name] = aeidon.containers.new(name)
+            return containers[name]
+        raise AttributeError("Invalid container name: {}"
+                             .format(repr(name)))
+
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance used."""
+        return self._store.calc
+
+    def copy(self):
+        """Return a new subtitle instance with the same values."""
+        return self._store.get_subtitle(self._index)
+
+    @property
+    def _end(self):
+        """Return end position as a native integer."""
+        return self._store._ends[self._index]
+
+    @_end.setter
+    def _end(self, value):
+        """Set end position from native integer `value`."""
+        self._store._ends[self._index] = value
+
+    # Columns can change under a view, so never cache time strings.
+    _end_str = property(lambda self: None, lambda self, value: None)
+    _start_str = property(lambda self: None, lambda self, value: None)
+
+    @property
+    def _framerate(self):
+        """Return framerate."""
+        return self._store.framerate
+
+    @property
+    def framerate(self):
+        """Return framerate."""
+        return self._store.framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate of the whole store from `value`."""
+        self._store.framerate = value
+
+    def has_container(self, name):
+        """Return ``True`` if container has been instantiated."""
+        containers = self._store._containers[self._index]
+        return bool(containers) and name in containers
+
+    @property
+    def _main_text(self):
+        """Return main text."""
+        return self._store._main_texts[self._index]
+
+    @_main_text.setter
+    def _main_text(self, value):
+        """Set main text from `value`."""
+        self._store._main_texts[self._index] = value
+
+    @property
+    def _mode(self):
+        """Return current position mode."""
+        return self._store.mode
+
+    @property
+    def mode(self):
+        """Return current position mode."""
+        return self._store.mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set position mode of the whole store from `mode`."""
+        self._store.mode = mode
+
+    @property
+    def _start(self):
+        """Return start position as a native integer."""
+        return self._store._starts[self._index]
+
+    @_start.setter
+    def _start(self, value):
+        """Set start position from native integer `value`."""
+        self._store._starts[self._index] = value
+
+    @property
+    def _tran_text(self):
+        """Return translation text."""
+        return self._store._tran_texts[self._index]
+
+    @_tran_text.setter
+    def _tran_text(self, value):
+        """Set translation text from `value`."""
+        self._store._tran_texts[self._index] = value
@@ -50,6 +50,10 @@ class Subtitle:
     Use :func:`aeidon.as_time`, :func:`aeidon.as_frame` or
     :func:`aeidon.as_seconds` if necessary to ensure correct type.
 
+    Positions are stored internally as integers in the native unit of
+    :attr:`mode`, i.e. milliseconds for times and frames for frames. Time
+    strings are produced only when asked for and cached until changed.
+
     Additional format-specific attributes are kept under separate containers,
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
@@ -58,15 +62,15 @@ class Subtitle:
 
     def __init__(self, mode=None, framerate=None):
         """Initialize a :class:`Subtitle` instance."""
-        self._start = None
-        self._end = None
+        self._start = 0
+        self._start_str = None
+        self._end = 0
+        self._end_str = None
         self._main_text = ""
         self._tran_text = ""
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
@@ -91,71 +95,35 @@ class Subtitle:
 
     def __ge__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds >= other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame >= other.start_frame
-        raise ValueError("Invalid mode: {}"
-                         .format(repr(self._mode)))
+        x, y = self._get_comparable_starts(other)
+        return x >= y
 
     def __gt__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds > other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame > other.start_frame
-        raise ValueError("Invalid mode: {}"
-                         .format(repr(self._mode)))
+        x, y = self._get_comparable_starts(other)
+        return x > y
 
     def __le__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds <= other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame <= other.start_frame
-        raise ValueError("Invalid mode: {}"
-                         .format(repr(self._mode)))
+        x, y = self._get_comparable_starts(other)
+        return x <= y
 
     def __lt__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds < other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame < other.start_frame
-        raise ValueError("Invalid mode: {}"
-                         .format(repr(self._mode)))
+        x, y = self._get_comparable_starts(other)
+        return x < y
 
     def convert_framerate(self, framerate):
         """Set framerate and convert positions to it."""
         coefficient = framerate.value / self._framerate.value
         if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds / coefficient
-            self.end_seconds = self.end_seconds / coefficient
+            self._set_native(round(self._start / coefficient),
+                             round(self._end / coefficient))
         if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(coefficient * self.start_frame)
-            self.end_frame = round(coefficient * self.end_frame)
+            self._set_native(round(coefficient * self._start),
+                             round(coefficient * self._end))
         self.framerate = framerate
 
-    def _convert_position(self, value):
-        """Return `value` of position in correct mode."""
-        if aeidon.is_time(value):
-            if self._mode == aeidon.modes.TIME:
-                return value
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.time_to_frame(value)
-        if aeidon.is_frame(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.frame_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return value
-        if aeidon.is_seconds(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.seconds_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.seconds_to_frame(value)
-        raise ValueError("Invalid type for value: {}"
-                         .format(repr(type(value))))
-
     def copy(self):
         """Return a new subtitle instance with the same values."""
         subtitle = Subtitle(self._mode, self._framerate)
@@ -183,8 +151,7 @@ class Subtitle:
     @duration.setter
     def duration(self, value):
         """Set duration from `value`."""
-        value = self._convert_position(value)
-        self._end = self.calc.add(self._start, value)
+        self._set_native(self._start, self._start + self._to_native(value))
 
     @property
     def duration_frame(self):
@@ -209,6 +176,8 @@ class Subtitle:
     @property
     def duration_time(self):
         """Return duration as time."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._end - self._start)
         return self.calc.seconds_to_time(self.duration_seconds)
 
     @duration_time.setter
@@ -219,18 +188,20 @@ class Subtitle:
     @property
     def end(self):
         """Return end position in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.end_time
         return self._end
 
     @end.setter
     def end(self, value):
         """Set end position from `value`."""
-        self._end = self._convert_position(value)
+        self._set_native(self._start, self._to_native(value))
 
     @property
     def end_frame(self):
         """Return end position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._end)
+            return self.calc.seconds_to_frame(self._end / 1000)
         if self._mode == aeidon.modes.FRAME:
             return self._end
         raise ValueError("Invalid mode: {}"
@@ -244,7 +215,12 @@ class Subtitle:
     @property
     def end_seconds(self):
         """Return end position as seconds."""
-        return self.calc.time_to_seconds(self.end_time)
+        if self._mode == aeidon.modes.TIME:
+            return self._end / 1000
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_seconds(self._end)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     @end_seconds.setter
     def end_seconds(self, value):
@@ -255,7 +231,11 @@ class Subtitle:
     def end_time(self):
         """Return end position as time."""
         if self._mode == aeidon.modes.TIME:
-            return self._end
+            time = self._end_str
+            if time is None:
+                time = self.calc.milliseconds_to_time(self._end)
+                self._end_str = time
+            return time
         if self._mode == aeidon.modes.FRAME:
             return self.calc.frame_to_time(self._end)
         raise ValueError("Invalid mode: {}"
@@ -277,6 +257,17 @@ class Subtitle:
         self._framerate = value
         self.calc = aeidon.Calculator(value)
 
+    def _get_comparable_starts(self, other):
+        """Return start positions of self and `other` in the same unit."""
+        if self._mode == aeidon.modes.TIME:
+            if other._mode == aeidon.modes.TIME:
+                return self._start, other._start
+            return self._start, round(other.start_seconds * 1000)
+        if self._mode == aeidon.modes.FRAME:
+            return self._start, other.start_frame
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
+
     def get_duration(self, mode):
         """Return duration in `mode`."""
         if mode == aeidon.modes.TIME:
@@ -336,21 +327,25 @@ class Subtitle:
     def mode(self, mode):
         """Set current position mode."""
         if mode == aeidon.modes.TIME:
-            self._start = self.start_time
-            self._end = self.end_time
+            start = self.calc.to_milliseconds(self.start)
+            end = self.calc.to_milliseconds(self.end)
         if mode == aeidon.modes.FRAME:
-            self._start = self.start_frame
-            self._end = self.end_frame
+            start = self.start_frame
+            end = self.end_frame
         self._mode = mode
+        self._set_native(start, end)
 
     def scale_positions(self, value):
         """Multiply start and end positions by `value`."""
-        if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds * value
-            self.end_seconds = self.end_seconds * value
-        if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(self._start * value)
-            self.end_frame = round(self._end * value)
+        self._set_native(round(self._start * value),
+                         round(self._end * value))
+
+    def _set_native(self, start, end):
+        """Set start and end positions from native integer values."""
+        self._start = start
+        self._start_str = None
+        self._end = end
+        self._end_str = None
 
     def set_text(self, doc, value):
         """Set text corresponding to `doc` to `value`."""
@@ -361,24 +356,26 @@ class Subtitle:
 
     def shift_positions(self, value):
         """Add `value` to start and end positions."""
-        self._start = self.calc.add(self._start, value)
-        self._end = self.calc.add(self._end, value)
+        value = self._to_native(value)
+        self._set_native(self._start + value, self._end + value)
 
     @property
     def start(self):
         """Return start position in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.start_time
         return self._start
 
     @start.setter
     def start(self, value):
         """Set start position from `value`."""
-        self._start = self._convert_position(value)
+        self._set_native(self._to_native(value), self._end)
 
     @property
     def start_frame(self):
         """Return start position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._start)
+            return self.calc.seconds_to_frame(self._start / 1000)
         if self._mode == aeidon.modes.FRAME:
             return self._start
         raise ValueError("Invalid mode: {}"
@@ -392,7 +389,12 @@ class Subtitle:
     @property
     def start_seconds(self):
         """Return start position as seconds."""
-        return self.calc.time_to_seconds(self.start_time)
+        if self._mode == aeidon.modes.TIME:
+            return self._start / 1000
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_seconds(self._start)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     @start_seconds.setter
     def start_seconds(self, value):
@@ -403,7 +405,11 @@ class Subtitle:
     def start_time(self):
         """Return start position as time."""
         if self._mode == aeidon.modes.TIME:
-            return self._start
+            time = self._start_str
+            if time is None:
+                time = self.calc.milliseconds_to_time(self._start)
+                self._start_str = time
+            return time
         if self._mode == aeidon.modes.FRAME:
             return self.calc.frame_to_time(self._start)
         raise ValueError("Invalid mode: {}"
@@ -414,6 +420,15 @@ class Subtitle:
         """Set start position from `value`."""
         self.start = aeidon.as_time(value)
 
+    def _to_native(self, value):
+        """Return position `value` as a native integer in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.to_milliseconds(value)
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.to_frame(value)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
+
     @property
     def tran_text(self):
         """Return translation text."""
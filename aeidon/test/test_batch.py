@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+
+class TestBatchConverter(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.paths = [self.new_subrip_file() for i in range(3)]
+        self.converter = aeidon.BatchConverter(aeidon.formats.MICRODVD,
+                                               encoding="ascii",
+                                               workers=1)
+
+    def test_convert(self):
+        results = self.converter.convert(self.paths)
+        assert [x.path for x in results] == self.paths
+        for result in results:
+            assert result.error is None
+            assert result.count > 0
+            file = aeidon.files.new(aeidon.formats.MICRODVD,
+                                    result.target,
+                                    "ascii")
+
+            assert len(file.read()) == result.count
+
+    def test_convert__directory(self):
+        directory = os.path.dirname(aeidon.temp.create())
+        results = self.converter.convert(self.paths, directory)
+        for result in results:
+            assert os.path.dirname(result.target) == directory
+            assert os.path.isfile(result.target)
+
+    def test_convert__duplicate_target(self):
+        paths = []
+        for i in range(2):
+            path = os.path.join(aeidon.temp.create_directory(), "x.srt")
+            os.rename(self.paths[i], path)
+            paths.append(path)
+        directory = aeidon.temp.create_directory()
+        for workers in (1, 2):
+            converter = aeidon.BatchConverter(aeidon.formats.MICRODVD,
+                                              encoding="ascii",
+                                              workers=workers)
+
+            results = converter.convert(paths, directory)
+            assert results[0].error is None
+            assert results[1].error.startswith("ValueError")
+            assert results[0].target == results[1].target
+
+    def test_convert__error(self):
+        path = aeidon.temp.create(".srt")
+        open(path, "w").write("x\n")
+        results = self.converter.convert(self.paths + [path])
+        assert results[-1].error.startswith("FormatError")
+        assert all(x.error is None for x in results[:-1])
+
+    def test_convert__same_target(self):
+        converter = aeidon.BatchConverter(aeidon.formats.SUBRIP, workers=1)
+        results = converter.convert(self.paths)
+        assert all(x.error.startswith("ValueError") for x in results)
+
+    def test_get_summary(self):
+        results = self.converter.convert(self.paths)
+        summary = self.converter.get_summary(results)
+        assert summary.startswith("3 files converted to MicroDVD")
+
+    def test_get_target(self):
+        target = self.converter.get_target("/tmp/a.srt", "/tmp/b")
+        assert target == "/tmp/b/a.sub"
+
+    def test_iter_convert(self):
+        converter = aeidon.BatchConverter(aeidon.formats.MPL2,
+                                          encoding="ascii",
+                                          workers=2,
+                                          queue_size=1)
+
+        results = list(converter.iter_convert(iter(self.paths)))
+        assert sorted(x.index for x in results) == [0, 1, 2]
+        assert all(x.error is None for x in results)
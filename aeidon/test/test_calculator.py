@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import array
 
 
 class TestCalculator(aeidon.TestCase):
@@ -51,6 +52,19 @@ class TestCalculator(aeidon.TestCase):
     def test_frame_to_time(self):
         assert self.calc.frame_to_time(2658) == "00:01:50.861"
 
+    def test_frames_to_seconds(self):
+        calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert calc.frames_to_seconds([127, 25]) == [5.08, 1.0]
+
+    def test_frames_to_seconds__array(self):
+        calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        seconds = calc.frames_to_seconds(array.array("q", [127, 25]))
+        assert seconds == array.array("d", [5.08, 1.0])
+
+    def test_frames_to_times(self):
+        times = self.calc.frames_to_times([2658, 0])
+        assert times == ["00:01:50.861", "00:00:00.000"]
+
     def test_get_middle__frame(self):
         assert self.calc.get_middle(300, 400) == 350
 
@@ -99,6 +113,11 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.is_valid_time("12:34:56.789")
         assert self.calc.is_valid_time("-12:34:56.789")
 
+    def test_milliseconds_to_time(self):
+        assert self.calc.milliseconds_to_time(68951154) == "19:09:11.154"
+        assert self.calc.milliseconds_to_time(-1500) == "-00:00:01.500"
+        assert self.calc.milliseconds_to_time(10**10) == "99:59:59.999"
+
     def test_normalize_time(self):
         assert self.calc.normalize_time("1:2:3.4") == "01:02:03.400"
         assert self.calc.normalize_time("-1:2:3,4") == "-01:02:03.400"
@@ -115,21 +134,64 @@ class TestCalculator(aeidon.TestCase):
     def test_seconds_to_frame(self):
         assert self.calc.seconds_to_frame(6552) == 157091
 
+    def test_seconds_to_frames(self):
+        frames = self.calc.seconds_to_frames([1.0, 10.0])
+        assert frames == [self.calc.seconds_to_frame(1.0),
+                          self.calc.seconds_to_frame(10.0)]
+
+    def test_seconds_to_frames__array(self):
+        frames = self.calc.seconds_to_frames(array.array("d", [1.0, 10.0]))
+        assert frames == array.array("q", [24, 240])
+
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
+    def test_seconds_to_times(self):
+        times = self.calc.seconds_to_times([68951.15388, -1.5])
+        assert times == ["19:09:11.154", "-00:00:01.500"]
+
+    def test_seconds_to_times__scalar(self):
+        seconds = [0.0005, 0.0015, 1.0005, 2.675, 359999.9995, -0.0001]
+        seconds += [x / 2000 for x in range(10000)]
+        times = [self.calc.seconds_to_time(x) for x in seconds]
+        assert self.calc.seconds_to_times(seconds) == times
+
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
+    def test_time_to_milliseconds(self):
+        assert self.calc.time_to_milliseconds("03:45:22.117") == 13522117
+        assert self.calc.time_to_milliseconds("-00:00:01.500") == -1500
+
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
+    def test_times_to_frames(self):
+        frames = self.calc.times_to_frames(["01:22:36.144", "00:00:00.000"])
+        assert frames == [118829, 0]
+
+    def test_times_to_seconds(self):
+        seconds = self.calc.times_to_seconds(["03:45:22.117", "-00:00:01.500"])
+        assert seconds == [13522.117, -1.5]
+
+    def test_times_to_seconds__scalar(self):
+        times = ["00:00:01.5", "00:00:01.0050", "00:00:01,005",
+                 "00:00:01.005", "02:46:39.999", "99:59:59.999"]
+        seconds = [self.calc.time_to_seconds(x) for x in times]
+        assert self.calc.times_to_seconds(times) == seconds
+
     def test_to_frame(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_frame("00:00:01.000") == 25
         assert self.calc.to_frame(25) == 25
         assert self.calc.to_frame(1.0) == 25
 
+    def test_to_milliseconds(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_milliseconds("00:00:01.000") == 1000
+        assert self.calc.to_milliseconds(25) == 1000
+        assert self.calc.to_milliseconds(1.0) == 1000
+
     def test_to_seconds(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_seconds("00:00:01.000") == 1.0
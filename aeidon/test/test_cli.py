@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import aeidon.cli
+import os
+import subprocess
+import sys
+
+
+class TestModule(aeidon.TestCase):
+
+    def main(self, *args):
+        try:
+            aeidon.cli.main(list(args))
+        except SystemExit as exit:
+            return exit.code
+
+    def test_main__adjust_durations(self):
+        path = self.new_subrip_file()
+        status = self.main("adjust-durations", "-e", "ascii",
+                           "--maximum", "1.0", path)
+        assert status == 0
+        project = aeidon.Project()
+        project.open_main(path, "ascii")
+        assert all(x.duration_seconds <= 1.0 for x in project.subtitles)
+
+    def test_main__break_lines(self):
+        path = self.new_subrip_file()
+        status = self.main("break-lines", "-e", "ascii",
+                           "--language", "en", "--max-length", "20", path)
+        assert status == 0
+
+    def test_main__convert(self):
+        path = self.new_subrip_file()
+        directory = os.path.dirname(aeidon.temp.create())
+        status = self.main("convert", "-f", "mpl2", "-e", "ascii",
+                           "-j", "1", "-o", directory, path)
+        assert status == 0
+        root = os.path.splitext(os.path.basename(path))[0]
+        assert os.path.isfile(os.path.join(directory, root + ".txt"))
+
+    def test_main__convert_error(self):
+        path = aeidon.temp.create(".srt")
+        open(path, "w").write("x\n")
+        assert self.main("convert", "-f", "mpl2", "-j", "1", path) == 1
+
+    def test_main__convert_framerate(self):
+        path = self.new_subrip_file()
+        project = aeidon.Project()
+        project.open_main(path, "ascii")
+        start = project.subtitles[1].start_seconds
+        status = self.main("convert-framerate", "-e", "ascii",
+                           "--input", "23.976", "--output", "25.000", path)
+        assert status == 0
+        project.open_main(path, "ascii")
+        assert project.subtitles[1].start_seconds != start
+
+    def test_main__correct_errors(self):
+        path = self.new_subrip_file()
+        status = self.main("correct-errors", "-e", "ascii",
+                           "--language", "en", path)
+        assert status == 0
+
+    def test_main__headless(self):
+        code = ("import sys, aeidon.cli; "
+                "assert not 'gi' in sys.modules; "
+                "assert not any(x.startswith('gi.') for x in sys.modules)")
+        root = os.path.dirname(os.path.dirname(aeidon.__file__))
+        env = dict(os.environ, PYTHONPATH=root)
+        subprocess.check_call([sys.executable, "-c", code], env=env)
+
+    def test_main__invalid_format(self):
+        path = self.new_subrip_file()
+        assert self.main("convert", "-f", "xxx", path) == 2
+
+    def test_main__output_directory(self):
+        path = self.new_subrip_file()
+        text = open(path, "r").read()
+        directory = aeidon.temp.create_directory()
+        status = self.main("shift-positions", "-e", "ascii",
+                           "-o", directory, "--amount", "1.0", path)
+        assert status == 0
+        assert open(path, "r").read() == text
+        target = os.path.join(directory, os.path.basename(path))
+        assert os.path.isfile(target)
+
+    def test_main__output_directory_duplicate(self):
+        paths = []
+        for i in range(2):
+            path = os.path.join(aeidon.temp.create_directory(), "x.srt")
+            os.rename(self.new_subrip_file(), path)
+            paths.append(path)
+        with open(paths[1], "w") as f:
+            f.write("1\n00:00:01,000 --> 00:00:02,000\nx\n")
+        directory = aeidon.temp.create_directory()
+        status = self.main("shift-positions", "-e", "ascii",
+                           "-o", directory, "--amount", "1.0", *paths)
+        assert status == 1
+        target = os.path.join(directory, "x.srt")
+        file = aeidon.files.new(aeidon.formats.SUBRIP, target, "ascii")
+        assert len(file.read()) > 1
+
+    def test_main__process_error(self):
+        path = aeidon.temp.create(".srt")
+        open(path, "w").write("x\n")
+        good = self.new_subrip_file()
+        status = self.main("shift-positions", "-e", "ascii",
+                           "--amount", "10", path, good)
+        assert status == 1
+
+    def test_main__remove_hearing_impaired(self):
+        path = self.new_subrip_file()
+        status = self.main("remove-hearing-impaired", "-e", "ascii",
+                           "--language", "en", path)
+        assert status == 0
+
+    def test_main__shift_positions(self):
+        path = self.new_subrip_file()
+        project = aeidon.Project()
+        project.open_main(path, "ascii")
+        start = project.subtitles[0].start_seconds
+        status = self.main("shift-positions", "-e", "ascii",
+                           "--amount", "00:00:01.500", path)
+        assert status == 0
+        project.open_main(path, "ascii")
+        assert project.subtitles[0].start_seconds == start + 1.5
+
+    def test_main__transform_positions(self):
+        path = self.new_subrip_file()
+        status = self.main("transform-positions", "-e", "ascii",
+                           "--first", "1", "00:00:01.000",
+                           "--second", "3", "00:00:10.000", path)
+        assert status == 0
+        project = aeidon.Project()
+        project.open_main(path, "ascii")
+        assert project.subtitles[0].start == "00:00:01.000"
+        assert project.subtitles[2].start == "00:00:10.000"
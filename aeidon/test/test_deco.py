@@ -16,6 +16,13 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import gc
+
+
+class PuppetValue:
+
+    def __init__(self, value):
+        self.value = value
 
 
 class TestModule(aeidon.TestCase):
@@ -23,6 +30,51 @@ class TestModule(aeidon.TestCase):
     def setup_method(self, method):
         self.project = self.new_project()
 
+    def test_memoize(self):
+        @aeidon.deco.memoize(2)
+        def function(x, y=0):
+            return [x, y]
+        assert function(1) is function(1)
+        assert function(1, y=1) is function(1, y=1)
+        assert function(1) is not function(1, y=1)
+        assert function.cache_info() == (4, 2, 2, 2)
+        function(2)
+        assert function.cache_info().size == 2
+        function.cache_clear()
+        assert function.cache_info() == (0, 0, 2, 0)
+
+    def test_memoize__method(self):
+        class Test:
+            @aeidon.deco.memoize(None)
+            def function(self, x):
+                return [x]
+        a, b = Test(), Test()
+        assert a.function(1) is a.function(1)
+        assert a.function(1) is not b.function(1)
+        assert Test.function.cache_info().size == 2
+        del a
+        gc.collect()
+        assert Test.function.cache_info().size == 1
+
+    def test_memoize__types(self):
+        @aeidon.deco.memoize(None)
+        def function(x):
+            return [x]
+        assert function(1) is function(1)
+        assert function(1) is not function(1.0)
+        assert function(1) is not function(True)
+        assert function((1,)) is not function((1.0,))
+        assert function(PuppetValue(1)) is function(PuppetValue(1))
+        assert function(PuppetValue(1)) is not function(PuppetValue(2))
+
+    def test_memoize__unhashable(self):
+        @aeidon.deco.memoize(None)
+        def function(x):
+            return list(x)
+        assert function([1, 2]) is function([1, 2])
+        assert function([1, 2]) is not function([1, 3])
+        assert function.cache_info() == (2, 2, None, 2)
+
     def test_silent(self):
         function = lambda: 0/0
         aeidon.deco.silent(ZeroDivisionError)(function)()
@@ -90,6 +90,12 @@ class TestModule(aeidon.TestCase):
         encoding = aeidon.encodings.detect_bom(path)
         assert encoding == "utf_8_sig"
 
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_find_bom(self):
+        encoding = aeidon.encodings.find_bom(codecs.BOM_UTF8 + b"x")
+        assert encoding == "utf_8_sig"
+        assert aeidon.encodings.find_bom(b"x") is None
+
     def test_get_locale_code(self):
         code = aeidon.encodings.get_locale_code()
         assert aeidon.encodings.is_valid_code(code)
@@ -69,3 +69,23 @@ class TestSubtitleFile(aeidon.TestCase):
             f.write(text)
         file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
         file.read()
+
+    def test_read_mapped__utf_16(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_16") as f:
+            f.write(text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_16")
+        assert file.read_mapped() == file.read()
+
+    def test_read_mapped__utf_8_sig(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_8_sig", newline="\r\n") as f:
+            f.write(text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
+        assert file.read_mapped() == file.read()
+        assert file.encoding == "utf_8_sig"
+        assert file.newline == aeidon.newlines.WINDOWS
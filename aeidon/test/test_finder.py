@@ -44,6 +44,15 @@ class TestFinder(aeidon.TestCase):
         pos = self.find_indices(next=True)
         assert pos == [0, 27]
 
+    def test_next__regex_cached(self):
+        self.finder.set_regex(r"\w+")
+        self.finder.previous()
+        self.finder.pos = 2
+        self.finder.next()
+        assert self.finder.match_span == (2, 3)
+        self.finder.next()
+        assert self.finder.match_span == (4, 8)
+
     def test_next__regex_ignore_case(self):
         self.finder.ignore_case = True
         self.finder.set_regex(r"O")
@@ -66,6 +75,14 @@ class TestFinder(aeidon.TestCase):
         pos = self.find_indices(next=False)
         assert pos == [52, 49, 41, 32, 26, 18, 14, 8, 3]
 
+    def test_previous__regex_changed_text(self):
+        self.finder.set_regex(r"\s")
+        self.finder.previous()
+        self.finder.text = "One only."
+        self.finder.pos = None
+        pos = self.find_indices(next=False)
+        assert pos == [3]
+
     def test_previous__regex_ignore_case(self):
         self.finder.ignore_case = True
         self.finder.set_regex(r"O")
@@ -202,3 +219,13 @@ class TestFinder(aeidon.TestCase):
         assert self.finder.text == (
             "One only r-sks -t, because\n"
             "one's surv-val depends on -t.")
+
+    def test_replace_all__string_ignore_case(self):
+        self.finder.ignore_case = True
+        self.finder.pattern = "O"
+        self.finder.replacement = "00"
+        count = self.finder.replace_all()
+        assert count == 4
+        assert self.finder.text == (
+            "00ne 00nly risks it, because\n"
+            "00ne's survival depends 00n it.")
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import importlib
+import os
+import subprocess
+import sys
+
+
+class TestModule(aeidon.TestCase):
+
+    def get_imported_modules(self, code):
+        root = os.path.dirname(os.path.dirname(aeidon.__file__))
+        env = dict(os.environ, PYTHONPATH=root)
+        args = [sys.executable, "-X", "importtime", "-c", code]
+        output = subprocess.run(args,
+                                env=env,
+                                stderr=subprocess.PIPE,
+                                universal_newlines=True,
+                                check=True).stderr
+
+        return set(x.split("|")[-1].strip()
+                   for x in output.splitlines()
+                   if x.startswith("import time:"))
+
+    def test___dir__(self):
+        names = dir(aeidon)
+        assert "Project" in names
+        assert "files" in names
+        assert "framerates" in names
+
+    def test___getattr__(self):
+        for module, names in aeidon._lazy_names.items():
+            module = importlib.import_module("aeidon.{}".format(module))
+            assert set(names) == set(module.__all__)
+            for name in names:
+                assert getattr(aeidon, name) is getattr(module, name)
+
+    def test___getattr____invalid(self):
+        self.assert_raises(AttributeError, getattr, aeidon, "xxx")
+
+    def test___getattr____module(self):
+        for name in aeidon._lazy_modules:
+            module = importlib.import_module("aeidon.{}".format(name))
+            assert getattr(aeidon, name) is module
+
+    def test_import(self):
+        modules = self.get_imported_modules("import aeidon")
+        assert "aeidon.enums" in modules
+        assert not "aeidon.agents" in modules
+        assert not "aeidon.files" in modules
+        assert not "aeidon.languages" in modules
+        assert not "aeidon.project" in modules
+        assert not "subprocess" in modules
+        assert not "xml.etree.ElementTree" in modules
+
+    def test_import__calculator(self):
+        code = "import aeidon; aeidon.Calculator().to_time(1.0)"
+        modules = self.get_imported_modules(code)
+        assert "aeidon.calculator" in modules
+        assert not "aeidon.agents" in modules
+        assert not "aeidon.project" in modules
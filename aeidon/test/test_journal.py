@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+MAIN = aeidon.documents.MAIN
+
+
+class TestUndoJournal(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.journal = aeidon.UndoJournal(self.project)
+
+    def teardown_method(self, method):
+        self.journal.close()
+
+    def test_close(self):
+        self.journal.close()
+        assert not os.path.isfile(self.journal.path)
+
+    def test_discard(self):
+        self.project.set_text(0, MAIN, "test")
+        entry = self.journal.store(self.project.undoables[0])
+        assert os.path.getsize(self.journal.path) > 0
+        self.journal.discard(entry)
+        assert os.path.getsize(self.journal.path) == 0
+
+    def test_discard__compact(self):
+        self.project.set_undo_journal(limit=5)
+        for i in range(50):
+            self.project.set_text(i % 10, MAIN, str(i))
+        journal = self.project.undoables.journal
+        size = os.path.getsize(journal.path)
+        for i in range(50):
+            self.project.undo(10)
+            self.project.redo(10)
+        assert os.path.getsize(journal.path) <= 2 * size
+        texts = [x.main_text for x in self.project.subtitles]
+        self.project.undo(50)
+        self.project.redo(50)
+        assert [x.main_text for x in self.project.subtitles] == texts
+
+    def test_load(self):
+        self.project.remove_subtitles((1, 2))
+        action = self.project.undoables[0]
+        entry = self.journal.store(action)
+        loaded = self.journal.load(entry)
+        assert loaded.revert_function == action.revert_function
+        assert loaded.revert_args == action.revert_args
+        assert loaded.register is aeidon.registers.DO
+        assert loaded.docs == action.docs
+        assert loaded.docs[0] is MAIN
+        subtitle = loaded.revert_args[1][0]
+        assert subtitle.calc is action.revert_args[1][0].calc
+
+    def test_load__group(self):
+        self.project.merge_subtitles((1, 2))
+        action = self.project.undoables[0]
+        entry = self.journal.store(action)
+        assert entry.description == action.description
+        loaded = self.journal.load(entry)
+        assert isinstance(loaded, aeidon.RevertableActionGroup)
+        assert loaded.description == action.description
+        assert len(loaded.actions) == 2
+
+    def test_store__value_error(self):
+        action = aeidon.RevertableAction(register=aeidon.registers.DO)
+        action.revert_function = lambda: None
+        self.assert_raises(ValueError, self.journal.store, action)
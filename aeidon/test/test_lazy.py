@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestLazySubtitleList(aeidon.TestCase):
+
+    def setup_method(self, method):
+        path = self.new_subrip_file()
+        self.file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        offsets, starts = self.file.index()
+        self.subtitles = aeidon.LazySubtitleList(self.file, offsets)
+
+    def test___delitem__(self):
+        subtitle = self.subtitles[1]
+        del self.subtitles[0]
+        assert self.subtitles[0] is subtitle
+        assert not self.subtitles.is_parsed(1)
+
+    def test___eq__(self):
+        assert self.subtitles == self.file.read()
+
+    def test___getitem__(self):
+        subtitle = self.subtitles[1]
+        assert subtitle == self.file.read()[1]
+        assert self.subtitles[1] is subtitle
+        assert self.subtitles.count_parsed() == 1
+
+    def test___getitem____slice(self):
+        subtitles = self.subtitles[2:4]
+        assert subtitles == self.file.read()[2:4]
+        assert self.subtitles.count_parsed() == 2
+
+    def test___setitem__(self):
+        subtitle = aeidon.Subtitle()
+        self.subtitles[0] = subtitle
+        assert self.subtitles[0] is subtitle
+
+    def test_count_parsed(self):
+        assert self.subtitles.count_parsed() == 0
+        list(self.subtitles)
+        assert self.subtitles.count_parsed() == len(self.subtitles)
+
+    def test_framerate(self):
+        subtitle = self.subtitles[0]
+        framerate = aeidon.framerates.FPS_25_000
+        self.subtitles.framerate = framerate
+        assert subtitle.framerate == framerate
+        assert self.subtitles[1].framerate == framerate
+
+    def test_insert(self):
+        subtitle = aeidon.Subtitle()
+        self.subtitles.insert(1, subtitle)
+        assert self.subtitles[1] is subtitle
+        assert self.subtitles[2] == self.file.read()[1]
+
+    def test_is_parsed(self):
+        assert not self.subtitles.is_parsed(0)
+        self.subtitles[0]
+        assert self.subtitles.is_parsed(0)
@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import itertools
 import re
 
 
@@ -89,3 +90,47 @@ class TestLiner(aeidon.TestCase):
             "was bored she took a golden ball,\n"
             "and threw it up high and caught it; and\n"
             "this ball was her favorite plaything.")
+
+    def test_break_lines__length_func(self):
+        text = ("Close by the king's castle "
+                "lay a great dark forest.")
+
+        self.liner.length_func = lambda x: len(x)
+        self.liner.set_text(text)
+        assert self.liner.break_lines() == (
+            "Close by the king's castle\n"
+            "lay a great dark forest.")
+
+    def test_break_lines__long(self):
+        text = " ".join(["The king's child went out "
+                         "into the forest and sat down "
+                         "by the side of the cool fountain."] * 3)
+
+        self.liner.max_length = 32
+        self.liner.set_text(text)
+        lines = self.liner.break_lines().split("\n")
+        assert len(lines) == 9
+        assert max(map(len, lines)) <= 32
+        assert " ".join(lines) == text
+
+    def test_iter_breaks(self):
+        text = ("The king's child went out "
+                "into the forest and sat down "
+                "by the side of the cool fountain.")
+
+        self.liner.max_length = 30
+        self.liner.set_text(text)
+        boxes = text.split(" ")
+        penalties = self.liner._detect_penalties(boxes)
+        lines = lambda x: self.liner._boxes_to_lines(boxes, x)
+        fits = lambda x: max(map(len, lines(x))) <= 30
+        demerit = lambda x: self.liner._calculate_demerit(boxes, penalties, x)
+        candidates = self.liner._iter_breaks(boxes, penalties, 4)
+        for nlines, breaks in enumerate(candidates, 1):
+            # Compare against all possible breaks.
+            points = itertools.combinations(range(len(boxes)-1), nlines-1)
+            points = list(filter(fits, points))
+            if not points:
+                assert breaks is None
+            else: # Valid breaks exist.
+                assert demerit(breaks) == min(map(demerit, points))
@@ -63,6 +63,34 @@ class TestParser(aeidon.TestCase):
             "<i>On only risks it, <b>bcaus</b>\n"
             "on's survival dpnds on it.</i>")
 
+    def test_replace_all__many_tags(self):
+        text = " ".join("<i>one</i> <b>two</b>" for i in range(100))
+        for pattern in ("o", re.compile(r"o")):
+            self.parser.set_text(text)
+            self.parser.pattern = pattern
+            self.parser.replacement = "oo"
+            self.parser.replace_all()
+            assert self.parser.get_text() == text.replace("o", "oo")
+
+    def test_replace_all__remove_tags(self):
+        text = "One <i>only</i> <b>risks</b> it."
+        self.parser.set_text(text)
+        self.parser.set_regex(r" only risks")
+        self.parser.replacement = ""
+        self.parser.replace_all()
+        assert self.parser.get_text() == "One<i></i><b></b> it."
+
+    def test_replace_all__repeated(self):
+        text = "<i>One</i> only <b>risks</b> it."
+        self.parser.set_text(text)
+        self.parser.pattern = "i"
+        self.parser.replacement = "ii"
+        self.parser.replace_all()
+        self.parser.pattern = "O"
+        self.parser.replacement = "OO"
+        self.parser.replace_all()
+        assert self.parser.get_text() == "<i>OOne</i> only <b>riisks</b> iit."
+
     def test_set_text__margins(self):
         text = ("<i>One only risks it, because</i>\n"
                 "<i>one's survival depends on it.</i>")
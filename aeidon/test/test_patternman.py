@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+
+class TestPatternManager(aeidon.TestCase):
+
+    def new_pattern(self, name, policy=None):
+        pattern = aeidon.Pattern({"Name": name})
+        if policy is not None:
+            pattern.set_field("Policy", policy)
+        return pattern
+
+    def setup_method(self, method):
+        self.cache_home_dir = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = aeidon.temp.create_directory()
+        self.manager = aeidon.PatternManager("common-error")
+
+    def teardown_method(self, method):
+        aeidon.CACHE_HOME_DIR = self.cache_home_dir
+
+    def test__filter_patterns__append(self):
+        a1, b, a2 = map(self.new_pattern, ("a", "b", "a"))
+        patterns = self.manager._filter_patterns([a1, b, a2])
+        assert patterns == [a1, a2, b]
+
+    def test__filter_patterns__replace(self):
+        a1, b = map(self.new_pattern, ("a", "b"))
+        a2 = self.new_pattern("a", "Replace")
+        patterns = self.manager._filter_patterns([a1, b, a2])
+        assert patterns == [a2, b]
+
+    def test__read_patterns__cache(self):
+        path = self.manager._get_cache_path()
+        assert os.path.isfile(path)
+        manager = aeidon.PatternManager("common-error")
+        assert manager._filtered.keys() == self.manager._filtered.keys()
+        patterns = manager.get_patterns("Latn", "en")
+        names = [x.get_name(False) for x in patterns]
+        patterns = self.manager.get_patterns("Latn", "en")
+        assert names == [x.get_name(False) for x in patterns]
+
+    def test__read_patterns__invalid_cache(self):
+        path = self.manager._get_cache_path()
+        open(path, "wb").write(b"x")
+        manager = aeidon.PatternManager("common-error")
+        assert manager.get_patterns("Latn", "en")
+
+    def test__read_patterns__stale_cache(self):
+        self.manager._write_cache(("xxx",))
+        manager = aeidon.PatternManager("common-error")
+        assert manager.get_patterns("Latn", "en")
+
+    def test_get_countries(self):
+        countries = self.manager.get_countries("Latn", "en")
+        assert countries == ("US",)
+
+    def test_get_languages(self):
+        languages = self.manager.get_languages("Latn")
+        assert "en" in languages
+        assert "fi" in languages
+
+    def test_get_patterns(self):
+        patterns = self.manager.get_patterns("Latn", "en", "US")
+        assert patterns
+        assert all(isinstance(x, aeidon.Pattern) for x in patterns)
+        patterns.clear()
+        assert self.manager.get_patterns("Latn", "en", "US")
+
+    def test_get_scripts(self):
+        scripts = self.manager.get_scripts()
+        assert scripts == ("Latn",)
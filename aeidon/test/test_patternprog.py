@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import re
+
+
+class TestPatternProgram(aeidon.TestCase):
+
+    def new_pattern(self, pattern, replacement, repeat=False):
+        return aeidon.Pattern({"Pattern": pattern,
+                               "Flags": "DOTALL;MULTILINE;",
+                               "Replacement": replacement,
+                               "Repeat": str(repeat)})
+
+    def setup_method(self, method):
+        self.parser = aeidon.Parser(re.compile(r"<.+?>"))
+
+    def test_apply(self):
+        program = aeidon.PatternProgram([
+            self.new_pattern(r"(?<=[a-z])I", "l"),
+            self.new_pattern(r"\bl\b", "I"),
+        ])
+        self.parser.set_text("<i>HeIIo, l am</i>")
+        assert program.apply(self.parser) == 3
+        assert self.parser.get_text() == "<i>Hello, I am</i>"
+
+    def test_apply__no_match(self):
+        program = aeidon.PatternProgram([self.new_pattern(r"x", "y")])
+        self.parser.set_text("abc")
+        assert program.apply(self.parser) == 0
+        assert self.parser.get_text() == "abc"
+
+    def test_apply__order(self):
+        program = aeidon.PatternProgram([
+            self.new_pattern(r"a", "b"),
+            self.new_pattern(r"b", "c"),
+        ])
+        self.parser.set_text("a")
+        program.apply(self.parser)
+        assert self.parser.get_text() == "c"
+
+    def test_apply__repeat(self):
+        pattern = self.new_pattern(r"(\w)(\w)(\w)", r"\1-\2\3", True)
+        program = aeidon.PatternProgram([pattern])
+        self.parser.set_text("abcd")
+        program.apply(self.parser)
+        assert self.parser.get_text() == "a-b-cd"
+        program = aeidon.PatternProgram([pattern], repeat=False)
+        self.parser.set_text("abcd")
+        program.apply(self.parser)
+        assert self.parser.get_text() == "a-bcd"
+
+    def test__get_required(self):
+        program = aeidon.PatternProgram([])
+        chars, any_chars = program._get_required(r"(?<=[a-z])I(?=x)", 0)
+        assert chars == set("Ix")
+        assert any_chars == ()
+        chars, any_chars = program._get_required(r"(\(|\[)[oO]+", 0)
+        assert chars == set()
+        assert set(any_chars) == set((frozenset("(["), frozenset("oO")))
+
+    def test__get_required__ignore_case(self):
+        program = aeidon.PatternProgram([])
+        assert program._get_required(r"abc", re.IGNORECASE) == (set(), ())
+        chars, any_chars = program._get_required(r"a(?i:b)", 0)
+        assert chars == set("a")
+
+    def test__get_required__optional(self):
+        program = aeidon.PatternProgram([])
+        chars, any_chars = program._get_required(r"a?(?!b)c*|d", 0)
+        assert not chars
+        assert not any_chars
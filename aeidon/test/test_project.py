@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+MAIN = aeidon.documents.MAIN
+
+
+class TestProject(aeidon.TestCase):
+
+    def on_signal(self, project, indices, signal):
+        self.emissions.append((signal, indices))
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.emissions = []
+        for signal in ("positions-changed",
+                       "main-texts-changed",
+                       "subtitles-inserted",
+                       "subtitles-removed"):
+            self.project.connect(signal, self.on_signal, signal)
+
+    def test_batch_signals(self):
+        with self.project.batch_signals():
+            self.project.set_text(3, MAIN, "test")
+            self.project.remove_subtitles((0, 1))
+            self.project.set_text(2, MAIN, "test")
+            self.project.shift_positions(None, 1.0)
+            with self.project.batch_signals():
+                self.project.insert_subtitles((0,))
+            assert not self.emissions
+        n = len(self.project.subtitles)
+        assert self.emissions == [
+            ("subtitles-removed", [0, 1]),
+            ("subtitles-inserted", [0]),
+            ("main-texts-changed", [2, 3]),
+            ("positions-changed", list(range(1, n)))]
+
+    def test_batch_signals__blocked(self):
+        blocked = self.project.block("main-texts-changed")
+        with self.project.batch_signals():
+            self.project.set_text(0, MAIN, "test")
+            self.project.unblock("main-texts-changed", blocked)
+        assert not self.emissions
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import re
+
+
+class TestSearchIndex(aeidon.TestCase):
+
+    texts = ("God has promised you that\nyou will go to Heaven?",
+             "So you are certain of\nbeing saved?",
+             "Be careful,\nit's a dangerous answer.",
+             "ΣΟΦΟΣ says You are saved.")
+
+    def candidates(self, pattern, start=0, stop=4, reverse=False):
+        iterator = self.index.iter_candidates(pattern, start, stop, reverse)
+        return None if iterator is None else list(iterator)
+
+    def setup_method(self, method):
+        self.index = aeidon.SearchIndex(self.texts)
+
+    def test_insert(self):
+        self.index.insert((0, 3))
+        assert self.index.size == 6
+        assert self.candidates("saved", 0, 6) == [0, 2, 3, 5]
+        assert self.candidates("you", 1, 4) == [1, 2, 3]
+
+    def test_iter_candidates__regex(self):
+        pattern = re.compile(r"\bsaved\?$", re.MULTILINE)
+        assert self.candidates(pattern) == [1]
+
+    def test_iter_candidates__regex_ignore_case(self):
+        pattern = re.compile(r"saved", re.IGNORECASE)
+        assert self.candidates(pattern) is None
+
+    def test_iter_candidates__regex_no_literal(self):
+        pattern = re.compile(r"s.v.d")
+        assert self.candidates(pattern) is None
+
+    def test_iter_candidates__reverse(self):
+        assert self.candidates("you", 0, 4, True) == [3, 1, 0]
+        assert self.candidates("you", 1, 3, True) == [1]
+
+    def test_iter_candidates__short(self):
+        assert self.candidates("so") is None
+
+    def test_iter_candidates__sigma(self):
+        assert self.candidates("σοφος") == [3]
+        assert self.candidates("ΣΟΦΟΣ") == [3]
+
+    def test_iter_candidates__string(self):
+        assert self.candidates("you") == [0, 1, 3]
+        assert self.candidates("you are") == [1, 3]
+        assert self.candidates("heaven") == [0]
+        assert self.candidates("hell") == []
+
+    def test_remove(self):
+        self.index.remove((0, 2))
+        assert self.index.size == 2
+        assert self.candidates("you", 0, 2) == [0, 1]
+        assert self.candidates("heaven", 0, 2) == []
+
+    def test_update(self):
+        self.index.update((2,))
+        assert self.candidates("hell") == [2]
+        assert self.candidates("you") == [0, 1, 2, 3]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestSignalBatch(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.batch = aeidon.SignalBatch()
+
+    def test_add__changed(self):
+        self.batch.add("positions-changed", (3, 1))
+        self.batch.add("positions-changed", (1, 2))
+        self.batch.add("main-texts-changed", (0,))
+        assert self.batch.get_emissions() == [
+            ("positions-changed", [1, 2, 3]),
+            ("main-texts-changed", [0])]
+
+    def test_add__inserted(self):
+        self.batch.add("positions-changed", (1, 3))
+        self.batch.add("subtitles-inserted", (0, 3))
+        self.batch.add("main-texts-changed", (0, 4))
+        assert self.batch.get_emissions() == [
+            ("subtitles-inserted", [0, 3]),
+            ("positions-changed", [2, 5]),
+            ("main-texts-changed", [4])]
+
+    def test_add__moved(self):
+        self.batch.add("subtitles-removed", (0,))
+        self.batch.add("subtitles-inserted", (2,))
+        self.batch.add("subtitles-removed", (2,))
+        self.batch.add("subtitles-inserted", (3,))
+        assert self.batch.get_emissions() == [
+            ("subtitles-removed", [0]),
+            ("subtitles-inserted", [3])]
+
+    def test_add__removed(self):
+        self.batch.add("subtitles-inserted", (1,))
+        self.batch.add("positions-changed", (0, 3))
+        self.batch.add("subtitles-removed", (1, 2))
+        self.batch.add("subtitles-removed", (0,))
+        assert self.batch.get_emissions() == [
+            ("subtitles-removed", [0, 1]),
+            ("positions-changed", [0])]
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import codecs
+
+from unittest.mock import patch
+
+
+class TestSniffer(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.path = self.new_subrip_file()
+        self.sniffer = aeidon.Sniffer(self.path)
+
+    def test___init__(self):
+        blob = open(self.path, "rb").read()
+        assert self.sniffer.complete
+        assert self.sniffer.prefix == blob
+        assert self.sniffer.bytes_read == len(blob)
+
+    def test___init____size(self):
+        sniffer = aeidon.Sniffer(self.path, 10)
+        assert not sniffer.complete
+        assert sniffer.bytes_read == 10
+
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bom(self):
+        assert self.sniffer.detect_bom() is None
+        blob = open(self.path, "rb").read()
+        open(self.path, "wb").write(codecs.BOM_UTF8 + blob)
+        sniffer = aeidon.Sniffer(self.path)
+        assert sniffer.detect_bom() == "utf_8_sig"
+
+    def test_detect_format(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            sniffer = aeidon.Sniffer(path)
+            assert sniffer.detect_format("ascii") == format
+
+    def test_detect_format__beyond_prefix(self):
+        blob = open(self.path, "rb").read()
+        open(self.path, "wb").write(b"x\n" * 100 + blob)
+        sniffer = aeidon.Sniffer(self.path, 210)
+        format = sniffer.detect_format("ascii")
+        assert format == aeidon.formats.SUBRIP
+        assert sniffer.bytes_read > 210
+
+    def test_detect_format__error(self):
+        open(self.path, "w").write("x\n")
+        sniffer = aeidon.Sniffer(self.path)
+        self.assert_raises(aeidon.FormatError,
+                           sniffer.detect_format,
+                           "ascii")
+
+    def test_detect_newline(self):
+        open(self.path, "w", newline="").write("a\r\nb\r\n")
+        sniffer = aeidon.Sniffer(self.path)
+        newline = sniffer.detect_newline("ascii")
+        assert newline == aeidon.newlines.WINDOWS
+
+    def test_detect_newline__utf_16(self):
+        with open(self.path, "w", encoding="utf_16", newline="") as f:
+            f.write("a\r\nb\r\n")
+        sniffer = aeidon.Sniffer(self.path)
+        newline = sniffer.detect_newline("utf_16")
+        assert newline == aeidon.newlines.WINDOWS
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2016 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+FRAME = aeidon.modes.FRAME
+TIME  = aeidon.modes.TIME
+
+
+class TestSubtitleStore(aeidon.TestCase):
+
+    def new_subtitle(self, start, end, text):
+        subtitle = aeidon.Subtitle()
+        subtitle.start = start
+        subtitle.end = end
+        subtitle.main_text = text
+        return subtitle
+
+    def setup_method(self, method):
+        self.store = aeidon.SubtitleStore(TIME)
+        self.store.append(self.new_subtitle("00:00:01.000",
+                                            "00:00:02.000",
+                                            "one"))
+
+        self.store.append(self.new_subtitle("00:00:03.000",
+                                            "00:00:04.500",
+                                            "two"))
+
+    def test___delitem__(self):
+        del self.store[0]
+        assert len(self.store) == 1
+        assert self.store[0].main_text == "two"
+
+    def test___eq__(self):
+        subtitles = [x.copy() for x in self.store]
+        assert self.store == subtitles
+        subtitles[0].main_text = "changed"
+        assert self.store != subtitles
+
+    def test___getitem__(self):
+        assert self.store[1].start == "00:00:03.000"
+        assert self.store[-1].end == "00:00:04.500"
+        self.assert_raises(IndexError, self.store.__getitem__, 2)
+
+    def test___getitem____slice(self):
+        subtitles = self.store[1:]
+        assert len(subtitles) == 1
+        assert subtitles[0].main_text == "two"
+
+    def test___setitem__(self):
+        self.store[0] = self.new_subtitle(3.0, 5.0, "three")
+        assert self.store[0].start == "00:00:03.000"
+        assert self.store[0].end == "00:00:05.000"
+        assert self.store[0].main_text == "three"
+
+    def test_convert_framerate__frame(self):
+        self.store.mode = FRAME
+        self.store[0].start = 100
+        self.store[0].end = 200
+        framerate = aeidon.framerates.FPS_25_000
+        self.store.convert_framerate(framerate)
+        assert self.store.framerate == framerate
+        assert self.store[0].start == 104
+        assert self.store[0].end == 209
+
+    def test_convert_framerate__time(self):
+        framerate = aeidon.framerates.FPS_25_000
+        self.store.convert_framerate(framerate)
+        assert self.store.framerate == framerate
+        assert self.store[0].start == "00:00:00.959"
+        assert self.store[0].end == "00:00:01.918"
+
+    def test_extend_positions(self):
+        store = aeidon.SubtitleStore(FRAME)
+        store.extend_positions(self.store)
+        assert len(store) == 2
+        assert store[1].start_frame == self.store[1].start_frame
+        assert store[1].end_frame == self.store[1].end_frame
+        assert store[1].main_text == ""
+
+    def test_get_subtitle(self):
+        self.store[0].ssa.style = "Test"
+        subtitle = self.store.get_subtitle(0)
+        assert isinstance(subtitle, aeidon.Subtitle)
+        assert subtitle == self.store[0]
+        assert subtitle.ssa.style == "Test"
+
+    def test_insert(self):
+        subtitle = self.new_subtitle(0.5, 0.8, "zero")
+        self.store.insert(0, subtitle)
+        assert len(self.store) == 3
+        assert self.store[0].main_text == "zero"
+        assert self.store[1].main_text == "one"
+        subtitle.main_text = "changed"
+        assert self.store[0].main_text == "zero"
+
+    def test_mode(self):
+        self.store.mode = FRAME
+        assert self.store[0].start == 24
+        assert self.store[0].end == 48
+        self.store.mode = TIME
+        assert self.store[0].start == "00:00:01.001"
+        assert self.store[0].end == "00:00:02.002"
+
+    def test_pop(self):
+        subtitle = self.store.pop(0)
+        assert not isinstance(subtitle, aeidon.SubtitleView)
+        assert subtitle.main_text == "one"
+        assert len(self.store) == 1
+
+    def test_replace_positions(self):
+        store = self.store.take([1])
+        store.shift_positions(1.0)
+        self.store.replace_positions([0], store)
+        assert self.store[0].start == "00:00:04.000"
+        assert self.store[0].end == "00:00:05.500"
+
+    def test_replace_positions__list(self):
+        subtitles = [self.new_subtitle(3.0, 5.0, "")]
+        self.store.replace_positions([0], subtitles)
+        assert self.store[0].start == "00:00:03.000"
+        assert self.store[0].end == "00:00:05.000"
+
+    def test_scale_positions(self):
+        self.store.scale_positions(2.0)
+        assert self.store[0].start == "00:00:02.000"
+        assert self.store[1].end == "00:00:09.000"
+
+    def test_shift_positions__frame(self):
+        self.store.mode = FRAME
+        self.store.shift_positions(-10)
+        assert self.store[0].start == 14
+        assert self.store[0].end == 38
+
+    def test_shift_positions__time(self):
+        self.store.shift_positions("-00:00:00.500")
+        assert self.store[0].start == "00:00:00.500"
+        assert self.store[1].end == "00:00:04.000"
+
+    def test_sort(self):
+        self.store[0].start = "00:00:05.000"
+        self.store.sort()
+        assert self.store[0].main_text == "two"
+        assert self.store[1].main_text == "one"
+
+    def test_take(self):
+        store = self.store.take([1])
+        assert len(store) == 1
+        store[0].main_text = "changed"
+        assert self.store[1].main_text == "two"
+
+    def test_take_positions(self):
+        store = self.store.take_positions([1])
+        assert len(store) == 1
+        assert store[0].start == "00:00:03.000"
+        assert store[0].end == "00:00:04.500"
+        assert store[0].main_text == ""
+
+
+class TestSubtitleView(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.store = aeidon.SubtitleStore(TIME)
+        self.store.append(aeidon.Subtitle())
+        self.subtitle = self.store[0]
+
+    def test_copy(self):
+        self.subtitle.main_text = "test"
+        subtitle = self.subtitle.copy()
+        subtitle.main_text = "changed"
+        assert self.subtitle.main_text == "test"
+
+    def test_duration(self):
+        self.subtitle.start = "00:00:01.000"
+        self.subtitle.duration = 2.0
+        assert self.subtitle.end == "00:00:03.000"
+
+    def test_framerate(self):
+        framerate = aeidon.framerates.FPS_25_000
+        self.subtitle.framerate = framerate
+        assert self.store.framerate == framerate
+        assert self.subtitle.calc is self.store.calc
+
+    def test_has_container(self):
+        assert not self.subtitle.has_container("ssa")
+        self.subtitle.ssa.style = "Test"
+        assert self.subtitle.has_container("ssa")
+        assert self.store[0].ssa.style == "Test"
+
+    def test_start(self):
+        self.subtitle.start_seconds = 1.5
+        assert self.store[0].start == "00:00:01.500"
+        assert self.store[0].start_frame == 36
+
+    def test_text(self):
+        self.subtitle.main_text = "main"
+        self.subtitle.tran_text = "tran"
+        assert self.store[0].main_text == "main"
+        assert self.store[0].tran_text == "tran"
@@ -193,8 +193,8 @@ class TestSubtitle(aeidon.TestCase):
     def test_mode__set_frame(self):
         self.fsub.mode = FRAME
         self.fsub.mode = TIME
-        assert self.fsub._start == "00:00:04.000"
-        assert self.fsub._end == "00:00:12.000"
+        assert self.fsub.start == "00:00:04.000"
+        assert self.fsub.end == "00:00:12.000"
 
     def test_mode__set_time(self):
         self.tsub.mode = TIME
@@ -225,13 +225,17 @@ class TestSubtitle(aeidon.TestCase):
 
     def test_shift_positions__seconds(self):
         self.tsub.shift_positions(1.0)
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub.start == "00:00:02.000"
+        assert self.tsub.end == "00:00:04.000"
 
     def test_shift_positions__time(self):
         self.tsub.shift_positions("00:00:01.000")
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub.start == "00:00:02.000"
+        assert self.tsub.end == "00:00:04.000"
+
+    def test_start__native(self):
+        assert self.tsub._start == 1000
+        assert self.fsub._start == 100
 
     def test_start__get(self):
         assert self.tsub.start == "00:00:01.000"
@@ -269,6 +273,11 @@ class TestSubtitle(aeidon.TestCase):
         self.tsub.start_seconds = 0.1
         assert self.tsub.start_seconds == 0.1
 
+    def test_start_time__cache(self):
+        assert self.tsub.start_time is self.tsub.start_time
+        self.tsub.start_seconds = 2.0
+        assert self.tsub.start_time == "00:00:02.000"
+
     def test_start_time__get(self):
         assert self.tsub.start_time == "00:00:01.000"
         assert self.fsub.start_time == "00:00:04.000"
@@ -16,6 +16,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import os
+import pickle
 
 
 class TestModule(aeidon.TestCase):
@@ -104,6 +106,40 @@ class TestModule(aeidon.TestCase):
         open(path, "w", encoding="utf_8").write("\xc3\xb6\n")
         assert aeidon.util.read(path, "ascii") == "\xc3\xb6"
 
+    def test_read_iso_codes(self):
+        directory = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = aeidon.temp.create_directory()
+        try:
+            codes = aeidon.util.read_iso_codes("iso_639", "iso_639_1_code")
+            assert codes["en"] == "English"
+            path = os.path.join(aeidon.CACHE_HOME_DIR,
+                                "iso-codes",
+                                "iso_639.pickle")
+
+            stamp, cached = pickle.load(open(path, "rb"))
+            assert cached == codes
+            pickle.dump((stamp, {"en": "Test"}), open(path, "wb"))
+            codes = aeidon.util.read_iso_codes("iso_639", "iso_639_1_code")
+            assert codes["en"] == "Test"
+        finally:
+            aeidon.CACHE_HOME_DIR = directory
+
+    def test_read_iso_codes__stale(self):
+        directory = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = aeidon.temp.create_directory()
+        try:
+            path = os.path.join(aeidon.CACHE_HOME_DIR,
+                                "iso-codes",
+                                "iso_639.pickle")
+
+            os.makedirs(os.path.dirname(path))
+            stamp = ("iso_639_1_code", 0, 0)
+            pickle.dump((stamp, {"en": "Test"}), open(path, "wb"))
+            codes = aeidon.util.read_iso_codes("iso_639", "iso_639_1_code")
+            assert codes["en"] == "English"
+        finally:
+            aeidon.CACHE_HOME_DIR = directory
+
     def test_readlines__basic(self):
         path = self.new_subrip_file()
         lines = [x.rstrip() for x in open(path, "r").readlines()]
@@ -128,6 +164,13 @@ class TestModule(aeidon.TestCase):
         f = open(path, "r", encoding="utf_8")
         assert f.read() == text
 
+    def test_write_iso_codes(self):
+        path = aeidon.temp.create(".pickle")
+        aeidon.util.write_iso_codes("iso_3166", "alpha_2_code", path)
+        stamp, codes = pickle.load(open(path, "rb"))
+        assert stamp[0] == "alpha_2_code"
+        assert codes["FI"] == "Finland"
+
     def test_writelines__basic(self):
         lines = ("test", "test")
         path = self.new_subrip_file()
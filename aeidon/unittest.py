@@ -25,7 +25,12 @@ __all__ = ("TestCase",)
 
 class TestCase:
 
-    """Base class for unit test cases."""
+    """
+    Base class for unit test cases.
+
+    :attr:`aeidon.CACHE_HOME_DIR` is redirected to a temporary directory
+    for the duration of each test class to not write to the user's cache.
+    """
 
     def assert_raises(self, exception, function, *args, **kwargs):
         """Assert that calling `function` raises `exception`."""
@@ -77,6 +82,12 @@ class TestCase:
         """Compatibility alias for :meth:`setup_method`."""
         self.setup_method(None)
 
+    @classmethod
+    def setup_class(cls):
+        """Set state for executing tests in class."""
+        cls._cache_home_dir = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = aeidon.temp.create_directory()
+
     def setup_method(self, method):
         """Set state for executing tests in `method`."""
         pass
@@ -85,6 +96,11 @@ class TestCase:
         """Compatibility alias for :meth:`teardown_method`."""
         self.teardown_method(None)
 
+    @classmethod
+    def teardown_class(cls):
+        """Remove state set for executing tests in class."""
+        aeidon.CACHE_HOME_DIR = cls._cache_home_dir
+
     def teardown_method(self, method):
         """Remove state set for executing tests in `method`."""
         pass
@@ -20,17 +20,14 @@
 import aeidon
 import collections
 import contextlib
-import inspect
 import locale
 import os
+import pickle
 import random
 import re
-import shutil
 import stat
-import subprocess
 import sys
 import traceback
-import urllib.parse
 
 
 def affirm(value):
@@ -92,6 +89,7 @@ def atomic_open(path, mode="w", *args, **kwargs):
             if sys.platform == "win32":
                 if os.path.isfile(path):
                     os.remove(path)
+            import shutil
             shutil.move(temp_path, path)
     finally:
         with silent(Exception):
@@ -145,14 +143,7 @@ def detect_format(path, encoding):
     Raise :exc:`aeidon.FormatError` if unable to detect format.
     Return an :attr:`aeidon.formats` enumeration item.
     """
-    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
-    with open(path, "r", encoding=encoding) as f:
-        for line in f:
-            for format, re_id in re_ids:
-                if re_id.search(line) is not None:
-                    return format
-    raise aeidon.FormatError("Failed to detect format of file {}"
-                             .format(repr(path)))
+    return aeidon.Sniffer(path).detect_format(encoding)
 
 def detect_newlines(path):
     """Detect and return the newline type of file at `path` or ``None``."""
@@ -248,6 +239,23 @@ def get_encoding_alias(encoding):
         return aliases[encoding]
     return encoding
 
+def _get_iso_codes_path(name):
+    """Return path to iso-codes XML file `name`."""
+    path = "/usr/share/xml/iso-codes/{}.xml".format(name)
+    if not os.path.isfile(path):
+        # Prefer files part of the iso-codes installation,
+        # use bundled copy as fallback.
+        path = os.path.join(aeidon.DATA_DIR,
+                            "iso-codes",
+                            "{}.xml".format(name))
+
+    return path
+
+def _get_iso_codes_stamp(name, key):
+    """Return a tuple identifying iso-codes XML file `name` and `key`."""
+    st = os.stat(_get_iso_codes_path(name))
+    return (key, int(st.st_mtime), st.st_size)
+
 def get_ranges(lst):
     """
     Return a list of ranges in list of integers.
@@ -297,7 +305,7 @@ def install_module(name, obj):
 
         aeidon.util.install_module("foo", lambda: None)
     """
-    aeidon.__dict__[name] = inspect.getmodule(obj)
+    aeidon.__dict__[name] = sys.modules[obj.__module__]
 
 def last(iterator):
     """Return the last value from `iterator` or ``None``."""
@@ -329,6 +337,7 @@ def path_to_uri(path):
     """Convert local filepath to URI."""
     if sys.platform == "win32":
         path = "/{}".format(path.replace("\\", "/"))
+    import urllib.parse
     return "file://{}".format(urllib.parse.quote(path))
 
 def print_read_io(exc_info, path):
@@ -380,6 +389,57 @@ def read(path, encoding=None, fallback="utf_8", quiet=False):
             print_read_unicode(sys.exc_info(), path, encoding)
         raise # UnicodeError
 
+def read_iso_codes(name, key):
+    """
+    Read and return a dictionary mapping codes to names from iso-codes.
+
+    `name` is the name of the iso-codes XML file without extension, e.g.
+    "iso_639", and `key` the attribute of entries to use as code, e.g.
+    "iso_639_1_code". The XML file is parsed only if neither a table written
+    at install time nor one cached at first use matches its modification
+    time and size, otherwise a pickled table is loaded.
+    Raise :exc:`IOError` if the XML file cannot be found.
+    """
+    stamp = _get_iso_codes_stamp(name, key)
+    codes = _read_iso_codes_cache(name, stamp)
+    if codes is not None: return codes
+    codes = _read_iso_codes_xml(name, key)
+    path = os.path.join(aeidon.CACHE_HOME_DIR,
+                        "iso-codes",
+                        "{}.pickle".format(name))
+
+    with silent(Exception):
+        # Caching is an optimization, ignore any failures.
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_open(path, "wb") as f:
+            pickle.dump((stamp, codes), f, pickle.HIGHEST_PROTOCOL)
+    return codes
+
+def _read_iso_codes_cache(name, stamp):
+    """Return cached table matching `stamp` or ``None``."""
+    basename = "{}.pickle".format(name)
+    for directory in (aeidon.DATA_DIR, aeidon.CACHE_HOME_DIR):
+        path = os.path.join(directory, "iso-codes", basename)
+        if not os.path.isfile(path): continue
+        with silent(Exception):
+            with open(path, "rb") as f:
+                cache_stamp, codes = pickle.load(f)
+            if cache_stamp == stamp:
+                return codes
+    return None
+
+def _read_iso_codes_xml(name, key):
+    """Parse and return a dictionary mapping codes to names."""
+    import xml.etree.ElementTree as ET
+    codes = {}
+    path = _get_iso_codes_path(name)
+    for element in ET.parse(path).findall("{}_entry".format(name)):
+        code = element.get(key, None)
+        value = element.get("name", None)
+        if not code or not value: continue
+        codes[code] = value
+    return codes
+
 def readlines(path, encoding=None, fallback="utf_8", quiet=False):
     """
     Read file at `path` and return lines.
@@ -424,6 +484,7 @@ def start_process(command, **kwargs):
     Raise :exc:`aeidon.ProcessError` if something goes wrong.
     Return :class:`subprocess.Popen` instance.
     """
+    import subprocess
     # Use no environment on Windows due to a subprocess bug.
     # http://bugzilla.gnome.org/show_bug.cgi?id=605805
     env = (os.environ.copy() if sys.platform != "win32" else None)
@@ -449,6 +510,7 @@ def title_to_lower_case(title_name):
 
 def uri_to_path(uri):
     """Convert `uri` to local filepath."""
+    import urllib.parse
     uri = urllib.parse.unquote(uri)
     if sys.platform == "win32":
         path = urllib.parse.urlsplit(uri)[2]
@@ -482,6 +544,18 @@ def write(path, text, encoding=None, fallback="utf_8", quiet=False):
             print_write_unicode(sys.exc_info(), path, encoding)
         raise # UnicodeError
 
+def write_iso_codes(name, key, path):
+    """
+    Write a pickled table of codes to names from iso-codes to `path`.
+
+    See :func:`read_iso_codes` for `name` and `key`.
+    Raise :exc:`IOError` if reading or writing fails.
+    """
+    stamp = _get_iso_codes_stamp(name, key)
+    codes = _read_iso_codes_xml(name, key)
+    with atomic_open(path, "wb") as f:
+        pickle.dump((stamp, codes), f, pickle.HIGHEST_PROTOCOL)
+
 def writelines(path, lines, encoding=None, fallback="utf_8", quiet=False):
     """
     Write `lines` of text to file at `path`.
@@ -148,6 +148,8 @@ class Page(aeidon.Observable):
         """Initialize :class:`aeidon.Project` with proper properties."""
         framerate = gaupol.conf.editor.framerate
         self.project = aeidon.Project(framerate)
+        # Merge rapid successive edits of the same field.
+        self.project.undo_coalesce_time = 1
 
     def _init_signal_handlers(self):
         """Initialize signal handlers."""
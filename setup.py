@@ -168,6 +168,8 @@ class Distribution(distribution):
 
     def __find_scripts(self, name):
         """Find scripts to install for name."""
+        if name == "aeidon":
+            self.scripts.append("bin/aeidon")
         if name == "gaupol":
             self.scripts.append("bin/gaupol")
 
@@ -180,6 +182,7 @@ class Distribution(distribution):
         if self.with_aeidon:
             self.__find_data_files("aeidon")
             self.__find_packages("aeidon")
+            self.__find_scripts("aeidon")
         if self.with_aeidon and self.with_iso_codes:
             self.__find_data_files("iso-codes")
         if self.with_gaupol:
@@ -262,6 +265,18 @@ class InstallData(install_data):
         run_or_exit("intltool-merge -d po {}.in {}".format(path, path))
         return ("share/gaupol/extensions/{}".format(extension), (path,))
 
+    def __get_iso_codes_file(self, name, key):
+        """Return a tuple for pickled iso-codes table or ``None``."""
+        import aeidon.util
+        path = os.path.join("data", "iso-codes", "{}.pickle".format(name))
+        log.info("writing '{}'".format(path))
+        try:
+            aeidon.util.write_iso_codes(name, key, path)
+        except IOError:
+            log.warn("failed to write '{}'".format(path))
+            return None
+        return ("share/gaupol/iso-codes", (path,))
+
     def __get_mo_file(self, po_file):
         """Return a tuple for compiled .mo file."""
         locale = os.path.basename(po_file[:-3])
@@ -290,6 +305,12 @@ class InstallData(install_data):
                 self.data_files.append(self.__get_mo_file(po_file))
             for pattern_file in glob.glob("data/patterns/*.in"):
                 self.data_files.append(self.__get_pattern_file(pattern_file))
+            for name, key in (("iso_639", "iso_639_1_code"),
+                              ("iso_3166", "alpha_2_code"),
+                              ("iso_15924", "alpha_4_code")):
+                data_file = self.__get_iso_codes_file(name, key)
+                if data_file is not None:
+                    self.data_files.append(data_file)
         if self.distribution.with_gaupol:
             for extension in os.listdir("data/extensions"):
                 pattern = "data/extensions/{}/*.extension.in"